@@ -4,11 +4,19 @@ from uuid import uuid4
 
 from sqlalchemy.orm import Session
 
+from app.core.pagination import apply_keyset
 from app.models.ingredient import Ingredient
 from app.schemas.ingredient import IngredientCreate, IngredientUpdate
 
 
 class IngredientDAL:
+    # 목록 정렬/커서 키: 성분 순서 -> 생성 시각 -> id
+    LIST_ORDER = (
+        (Ingredient.order_index, False),
+        (Ingredient.created_at, False),
+        (Ingredient.id, False),
+    )
+
     @staticmethod
     def create(db: Session, ing_in: IngredientCreate) -> Ingredient:
         ingredient = Ingredient(
@@ -47,13 +55,13 @@ class IngredientDAL:
         skip: int = 0,
         limit: int = 100,
         product_id: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[Ingredient]:
         q = db.query(Ingredient)
         if product_id is not None:
             q = q.filter(Ingredient.product_id == product_id)
         # 보통 성분 순서가 중요하니까 order_index 오름차순
-        q = q.order_by(Ingredient.order_index.asc(), Ingredient.created_at.asc())
-        return q.offset(skip).limit(limit).all()
+        return apply_keyset(q, IngredientDAL.LIST_ORDER, limit, cursor=cursor, skip=skip).all()
 
     @staticmethod
     def update(
@@ -4,11 +4,15 @@ from uuid import uuid4
 
 from sqlalchemy.orm import Session
 
+from app.core.pagination import apply_keyset
 from app.models.nutrition import Nutrition
 from app.schemas.nutrition import NutritionCreate, NutritionUpdate
 
 
 class NutritionDAL:
+    # 목록 정렬/커서 키 (PK 순)
+    LIST_ORDER = ((Nutrition.id, False),)
+
     @staticmethod
     def create(db: Session, nutrition_in: NutritionCreate) -> Nutrition:
         nutrition = Nutrition(
@@ -53,11 +57,12 @@ class NutritionDAL:
         skip: int = 0,
         limit: int = 100,
         product_id: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[Nutrition]:
         q = db.query(Nutrition)
         if product_id is not None:
             q = q.filter(Nutrition.product_id == product_id)
-        return q.offset(skip).limit(limit).all()
+        return apply_keyset(q, NutritionDAL.LIST_ORDER, limit, cursor=cursor, skip=skip).all()
 
     @staticmethod
     def update(
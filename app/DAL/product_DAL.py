@@ -1,14 +1,23 @@
 # app/DAL/product_DAL.py
+from datetime import datetime
 from typing import List, Optional
 from uuid import uuid4
 
 from sqlalchemy.orm import Session
 
+from app.core.pagination import apply_keyset
 from app.models.product import Product
-from app.schemas.product import ProductCreate, ProductUpdate
+from app.schemas.product import ProductCreate, ProductUpdate, ProductOut, ProductSimpleOut
+
+# 읽기 전용 조회용 컬럼 (Out 스키마 필드 이름 그대로)
+OUT_COLUMNS = tuple(getattr(Product, name) for name in ProductOut.model_fields)
+SIMPLE_COLUMNS = tuple(getattr(Product, name) for name in ProductSimpleOut.model_fields)
 
 
 class ProductDAL:
+    # 목록 정렬/커서 키 (PK 순)
+    LIST_ORDER = ((Product.id, False),)
+
     @staticmethod
     def create(db: Session, product_in: ProductCreate) -> Product:
         product = Product(
@@ -35,6 +44,22 @@ class ProductDAL:
     def get(db: Session, product_id: str) -> Optional[Product]:
         return db.query(Product).filter(Product.id == product_id).first()
 
+    @staticmethod
+    def get_simple_row(db: Session, product_id: str):
+        """
+        ProductSimpleOut 필드(name, category, image_url)만 담은 Row (ORM 객체를 만들지 않음)
+        """
+        return db.query(*SIMPLE_COLUMNS).filter(Product.id == product_id).first()
+
+    @staticmethod
+    def get_updated_at(db: Session, product_id: str) -> Optional[datetime]:
+        # 조건부 GET 판정용, row 전체를 읽지 않음
+        return (
+            db.query(Product.updated_at)
+            .filter(Product.id == product_id)
+            .scalar()
+        )
+
     @staticmethod
     def get_by_barcode(db: Session, barcode: str) -> Optional[Product]:
         return db.query(Product).filter(Product.barcode == barcode).first()
@@ -44,8 +69,23 @@ class ProductDAL:
         db: Session,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Product]:
-        return db.query(Product).offset(skip).limit(limit).all()
+        q = db.query(Product)
+        return apply_keyset(q, ProductDAL.LIST_ORDER, limit, cursor=cursor, skip=skip).all()
+
+    @staticmethod
+    def list_rows(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ):
+        """
+        list()와 같지만 읽기 전용 Row(ProductOut 필드 이름)로 반환 (ORM 객체 / identity map 없음)
+        """
+        q = db.query(*OUT_COLUMNS)
+        return apply_keyset(q, ProductDAL.LIST_ORDER, limit, cursor=cursor, skip=skip).all()
 
     @staticmethod
     def update(
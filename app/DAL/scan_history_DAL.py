@@ -1,24 +1,57 @@
 # app/DAL/scan_history_DAL.py
 from datetime import datetime, timezone, date
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict
 from uuid import uuid4
-from sqlalchemy import func, desc, asc
-from sqlalchemy.orm import Session
+from sqlalchemy import func, desc, asc, tuple_
+from sqlalchemy.orm import Session, undefer_group, joinedload, selectinload
 
-from app.models.scan_history import ScanHistory
-from app.schemas.scan_history import ScanHistoryCreate, ScanHistoryUpdate
+from app.core.local_time import to_local_date
+from app.core.pagination import apply_keyset
+from app.models.scan_history import ScanHistory, REPORT_GROUP
+from app.models.scan_report import ScanReport, REPORT_FIELDS
+from app.models.product import Product
+from app.models.nutrition import Nutrition
+from app.models.ingredient import Ingredient
+from app.schemas.scan_history import ScanHistoryCreate, ScanHistoryUpdate, ScanHistoryOut
+
+
+# 목록 화면(ScanSummaryOut / 홈)에 필요한 컬럼만
+SUMMARY_COLUMNS = (
+    ScanHistory.id,
+    ScanHistory.product_id,
+    ScanHistory.product_name,
+    ScanHistory.display_name,
+    ScanHistory.display_category,
+    ScanHistory.dirty,
+    ScanHistory.decision,
+    ScanHistory.summary,
+    ScanHistory.image_url,
+    ScanHistory.scanned_at,
+)
+
+# ScanHistoryOut 필드 이름 그대로의 컬럼 (리포트 본문은 scan_report에서)
+OUT_COLUMNS = tuple(
+    getattr(ScanReport if name in REPORT_FIELDS else ScanHistory, name)
+    for name in ScanHistoryOut.model_fields
+)
 
 
 class ScanHistoryDAL:
+    # 목록 정렬/커서 키: 최신 스캔 먼저, 같은 시각이면 id로 구분
+    LIST_ORDER = ((ScanHistory.scanned_at, True), (ScanHistory.id, True))
+
     @staticmethod
     def create(db: Session, sh_in: ScanHistoryCreate) -> ScanHistory:
         scanned_at = sh_in.scanned_at or datetime.now(timezone.utc).replace(tzinfo=None)
+        local_date = sh_in.local_date or to_local_date(scanned_at)
 
         scan = ScanHistory(
             id=str(uuid4()),
             user_id=sh_in.user_id,
             product_id=sh_in.product_id,
             scanned_at=scanned_at,
+            local_date=local_date,
+            day_seq=sh_in.day_seq,
             display_name=sh_in.display_name,
             display_category=sh_in.display_category,
             image_url=sh_in.image_url,
@@ -28,16 +61,25 @@ class ScanHistoryDAL:
             conditions=sh_in.conditions,
             allergies=sh_in.allergies,
             habits=sh_in.habits,
+            caution_factors=sh_in.caution_factors,
+            product_name=sh_in.product_name,
+            dirty=False
+        )
+        # 리포트 본문은 scan_report에 같은 트랜잭션으로 저장
+        scan.report = ScanReport(
             ai_allergy_report=sh_in.ai_allergy_report,
             ai_condition_report=sh_in.ai_condition_report,
             ai_alter_report=sh_in.ai_alter_report,
             ai_vegan_report=sh_in.ai_vegan_report,
             ai_total_report=sh_in.ai_total_report,
-            caution_factors=sh_in.caution_factors,
-            product_name=sh_in.product_name,
+            ai_allergy_brief=sh_in.ai_allergy_brief,
+            ai_condition_brief=sh_in.ai_condition_brief,
+            ai_alter_brief=sh_in.ai_alter_brief,
+            ai_vegan_brief=sh_in.ai_vegan_brief,
             product_nutrition=sh_in.product_nutrition,
             product_ingredient=sh_in.product_ingredient,
-            dirty=False
+            detail_payload=sh_in.detail_payload,
+            detail_version=sh_in.detail_version,
         )
         db.add(scan)
         db.commit()
@@ -46,18 +88,50 @@ class ScanHistoryDAL:
 
     @staticmethod
     def get(db: Session, scan_id: str) -> Optional[ScanHistory]:
+        # 상세 조회용이라 리포트(scan_report)까지 한 번에 로드
         return (
             db.query(ScanHistory)
+            .options(undefer_group(REPORT_GROUP), joinedload(ScanHistory.report))
+            .filter(ScanHistory.id == scan_id, ScanHistory.deleted_at.is_(None))
+            .first()
+        )
+
+    @staticmethod
+    def get_cache_validators(db: Session, scan_id: str):
+        """
+        조건부 GET용 updated_at만 한 번에 조회 (scan / product / nutrition / ingredient)
+        nutrition / ingredient는 row 수도 같이 봄 (hard delete는 max(updated_at)을 바꾸지 않을 수 있음)
+        없거나 삭제된 스캔이면 None
+        """
+        def _subquery(expr, model):
+            return (
+                db.query(expr)
+                .filter(model.product_id == ScanHistory.product_id)
+                .scalar_subquery()
+            )
+
+        return (
+            db.query(
+                ScanHistory.updated_at.label("scan_updated_at"),
+                Product.updated_at.label("product_updated_at"),
+                _subquery(func.max(Nutrition.updated_at), Nutrition).label("nutrition_updated_at"),
+                _subquery(func.count(Nutrition.id), Nutrition).label("nutrition_count"),
+                _subquery(func.max(Ingredient.updated_at), Ingredient).label("ingredient_updated_at"),
+                _subquery(func.count(Ingredient.id), Ingredient).label("ingredient_count"),
+            )
+            .outerjoin(Product, Product.id == ScanHistory.product_id)
             .filter(ScanHistory.id == scan_id, ScanHistory.deleted_at.is_(None))
             .first()
         )
+
     @staticmethod
     def get_by_date(db: Session, user_id: str, date: datetime):
         return (
             db.query(ScanHistory)
+            .options(undefer_group(REPORT_GROUP), selectinload(ScanHistory.report))
             .filter(
                 ScanHistory.user_id == user_id,
-                func.date(ScanHistory.scanned_at) == date.date(),
+                ScanHistory.local_date == date.date(),
                 ScanHistory.deleted_at.is_(None),
             )
             .order_by(ScanHistory.scanned_at.desc())
@@ -65,25 +139,57 @@ class ScanHistoryDAL:
         )
 
     @staticmethod
-    def count_scans_date(
+    def list_summaries_by_date(db: Session, user_id: str, local_date: date):
+        """
+        특정 user + 날짜의 스캔 목록 (최신순), 목록에 필요한 컬럼만
+        """
+        return (
+            db.query(*SUMMARY_COLUMNS)
+            .filter(
+                ScanHistory.user_id == user_id,
+                ScanHistory.local_date == local_date,
+                ScanHistory.deleted_at.is_(None),
+            )
+            .order_by(ScanHistory.scanned_at.desc())
+            .all()
+        )
+
+    @staticmethod
+    def get_representative_scans_for_day(
         db: Session,
         user_id: str,
         local_date: date,
-    ) -> int:
+        limit: int = 2,
+    ):
         """
-        특정 user + 날짜에 대한 스캔 개수 반환
+        특정 user + 날짜에서 상품별(product_id, 없으면 scan id) 최신 스캔만 최신순으로 limit개
+        홈 목록에 필요한 컬럼만 조회 (리포트 TEXT 컬럼은 읽지 않음)
         """
-        count = (
-            db.query(func.count(ScanHistory.id))
+        product_key = func.coalesce(ScanHistory.product_id, ScanHistory.id)
+        ranked = (
+            db.query(
+                *SUMMARY_COLUMNS,
+                func.row_number()
+                .over(
+                    partition_by=product_key,
+                    order_by=(desc(ScanHistory.scanned_at), desc(ScanHistory.id)),
+                )
+                .label("rn"),
+            )
             .filter(
                 ScanHistory.user_id == user_id,
-                # scanned_at의 날짜 부분이 local_date와 같은 것만
-                func.date(ScanHistory.scanned_at) == local_date,
+                ScanHistory.local_date == local_date,
+                ScanHistory.deleted_at.is_(None),
             )
-            .scalar()
+            .subquery()
+        )
+        return (
+            db.query(ranked)
+            .filter(ranked.c.rn == 1)
+            .order_by(desc(ranked.c.scanned_at), desc(ranked.c.id))
+            .limit(limit)
+            .all()
         )
-
-        return int(count or 0)
 
     @staticmethod
     def get_scan_order_for_day(
@@ -94,12 +200,13 @@ class ScanHistoryDAL:
     ) -> int:
         """
         특정 user + 날짜에서, scan_id가 몇 번째 스캔인지(1-based index) 반환
+        day_seq가 없는 예전 row용 (새 row는 scan.day_seq를 바로 읽으면 됨)
         """
         rows = (
             db.query(ScanHistory.id)
             .filter(
                 ScanHistory.user_id == user_id,
-                func.date(ScanHistory.scanned_at) == local_date,
+                ScanHistory.local_date == local_date,
                 ScanHistory.deleted_at.is_(None),
             )
             .order_by(asc(ScanHistory.scanned_at), asc(ScanHistory.id))
@@ -122,18 +229,52 @@ class ScanHistoryDAL:
         limit: int = 100,
         user_id: Optional[str] = None,
         product_id: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[ScanHistory]:
-        q = db.query(ScanHistory).filter(ScanHistory.deleted_at.is_(None))
+        # ScanHistoryOut이 리포트 컬럼까지 내려주므로 한 번에 로드 (row마다 추가 조회 방지)
+        q = (
+            db.query(ScanHistory)
+            .options(undefer_group(REPORT_GROUP), selectinload(ScanHistory.report))
+            .filter(ScanHistory.deleted_at.is_(None))
+        )
 
         if user_id is not None:
             q = q.filter(ScanHistory.user_id == user_id)
         if product_id is not None:
             q = q.filter(ScanHistory.product_id == product_id)
 
-        # 최신 스캔 먼저 보이게
-        q = q.order_by(ScanHistory.scanned_at.desc())
+        # 최신 스캔 먼저 보이게 (cursor가 있으면 skip 대신 keyset으로 이어서 조회)
+        q = apply_keyset(q, ScanHistoryDAL.LIST_ORDER, limit, cursor=cursor, skip=skip)
 
-        return q.offset(skip).limit(limit).all()
+        return q.all()
+
+    @staticmethod
+    def list_rows(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+        product_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ):
+        """
+        list()와 같은 조건/정렬이지만 읽기 전용 Row(ScanHistoryOut 필드 이름)로 반환
+        ORM 객체 / identity map 등록 / scan_report 추가 조회 없이 join 한 번
+        """
+        q = (
+            db.query(*OUT_COLUMNS)
+            .outerjoin(ScanReport, ScanReport.scan_id == ScanHistory.id)
+            .filter(ScanHistory.deleted_at.is_(None))
+        )
+
+        if user_id is not None:
+            q = q.filter(ScanHistory.user_id == user_id)
+        if product_id is not None:
+            q = q.filter(ScanHistory.product_id == product_id)
+
+        q = apply_keyset(q, ScanHistoryDAL.LIST_ORDER, limit, cursor=cursor, skip=skip)
+
+        return q.all()
 
     @staticmethod
     def update(
@@ -154,6 +295,10 @@ class ScanHistoryDAL:
         for field, value in data.items():
             setattr(scan, field, value)
 
+        # 리포트만 바뀌어도 scan_history.updated_at(ETag 기준)은 갱신
+        if any(field in REPORT_FIELDS for field in data):
+            scan.updated_at = func.now()
+
         db.commit()
         db.refresh(scan)
         return scan
@@ -173,33 +318,35 @@ class ScanHistoryDAL:
         return True
 
     @staticmethod
-    def get_ai_score_stats_for_day(
+    def get_ai_scores_for_keys(
         db: Session,
-        user_id: str,
-        local_date: date,
-    ) -> Dict[str, Any]:
+        keys: List[tuple],
+    ) -> Dict[tuple, List[Optional[int]]]:
         """
-        특정 user + 날짜에 대한 ai_total_score 개수 / 평균값 반환
-        반환 예: {"count": 3, "avg_score": 72.3}
+        여러 (user_id, local_date)의 ai_total_score 값 목록을 한 번에 조회 (점수 산식 입력)
+        반환 예: {("u1", date(2025, 1, 3)): [70, 82, None], ...} (스캔 없는 날은 빠짐, 삭제된 스캔은 제외)
         """
-        count, avg_score = (
+        if not keys:
+            return {}
+
+        rows = (
             db.query(
-                func.count(ScanHistory.id),
-                func.avg(ScanHistory.ai_total_score),
+                ScanHistory.user_id,
+                ScanHistory.local_date,
+                ScanHistory.ai_total_score,
             )
             .filter(
-                ScanHistory.user_id == user_id,
-                # scanned_at의 날짜 부분이 local_date와 같은 것만
-                func.date(ScanHistory.scanned_at) == local_date,
+                tuple_(ScanHistory.user_id, ScanHistory.local_date).in_(keys),
+                ScanHistory.deleted_at.is_(None),
             )
-            .one()
+            .all()
         )
 
-        return {
-            "count": int(count or 0),
-            "avg_score": float(avg_score) if avg_score is not None else None,
-        }
-        
+        result: Dict[tuple, List[Optional[int]]] = {}
+        for user_id, local_date, score in rows:
+            result.setdefault((user_id, local_date), []).append(score)
+        return result
+
     @staticmethod
     def get_recent_scans_for_user(
         db: Session,
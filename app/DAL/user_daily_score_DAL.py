@@ -1,15 +1,54 @@
 # app/DAL/user_daily_score_DAL.py
 from datetime import date, datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
+from app.core.pagination import apply_keyset
+from app.DAL.user_score_rollup_DAL import UserScoreRollupDAL
 from app.models.user_daily_score import UserDailyScore
 from app.schemas.user_daily_score import UserDailyScoreCreate, UserDailyScoreUpdate
 
 
+def _is_scored(score: Optional[int], dirty: Optional[int]) -> bool:
+    # 주간/월간 평균에 들어가는 날 (UserScoreRollupDAL._aggregate와 같은 기준)
+    return not dirty and score is not None and score >= 0
+
+
+def _count_delta(old: Optional[Dict], new: Optional[Dict]) -> Dict[str, int]:
+    old, new = old or {}, new or {}
+    return {key: (new.get(key) or 0) - (old.get(key) or 0) for key in old.keys() | new.keys()}
+
+
 class UserDailyScoreDAL:
+    # 목록 정렬/커서 키: 유저별, 최근 날짜 먼저 (PK (user_id, local_date))
+    LIST_ORDER = (
+        (UserDailyScore.user_id, False),
+        (UserDailyScore.local_date, True),
+    )
+
+    @staticmethod
+    def _rollup_new_row(db: Session, uds: UserDailyScore) -> None:
+        """
+        새 일별 row를 주간/월간 집계에 반영
+        점수가 확정된 row만 평균까지 다시 집계, 아니면 스캔 수 / 판정 개수만 더함
+        (홈 첫 진입의 빈 row는 더할 값이 없어서 쿼리 없음)
+        """
+        if _is_scored(uds.score, uds.dirty):
+            UserScoreRollupDAL.refresh(db, [(uds.user_id, uds.local_date)])
+        else:
+            UserScoreRollupDAL.apply_delta(
+                db,
+                uds.user_id,
+                uds.local_date,
+                num_scans=uds.num_scans or 0,
+                decision_counts=uds.decision_counts,
+            )
+
     @staticmethod
     def create(db: Session, uds_in: UserDailyScoreCreate) -> UserDailyScore:
         # max_severity Enum -> str
@@ -22,12 +61,15 @@ class UserDailyScoreDAL:
             num_scans=uds_in.num_scans,
             max_severity=max_severity,
             decision_counts=uds_in.decision_counts,
+            scan_seq=uds_in.scan_seq,
             formula_version=uds_in.formula_version,
             dirty=uds_in.dirty,
             last_computed_at=uds_in.last_computed_at,
             sync_state=uds_in.sync_state,
         )
         db.add(uds)
+        db.flush()
+        UserDailyScoreDAL._rollup_new_row(db, uds)
         db.commit()
         db.refresh(uds)
         return uds
@@ -59,6 +101,7 @@ class UserDailyScoreDAL:
             num_scans=uds_in.num_scans,
             max_severity=max_severity,
             decision_counts=uds_in.decision_counts,
+            scan_seq=uds_in.scan_seq,
             formula_version=uds_in.formula_version,
             dirty=uds_in.dirty,
             last_computed_at=uds_in.last_computed_at,
@@ -66,6 +109,8 @@ class UserDailyScoreDAL:
         )
         try:
             db.add(uds)
+            db.flush()
+            UserDailyScoreDAL._rollup_new_row(db, uds)
             db.commit()
             db.refresh(uds)
             return uds
@@ -76,6 +121,183 @@ class UserDailyScoreDAL:
                 db, user_id=uds_in.user_id, local_date=uds_in.local_date
             )
 
+    @staticmethod
+    def list_range(
+        db: Session,
+        user_id: str,
+        date_from: date,
+        date_to: date,
+    ) -> List[UserDailyScore]:
+        """
+        특정 user의 날짜 구간 점수 row (날짜 오름차순), PK 범위 스캔 한 번
+        """
+        return (
+            db.query(UserDailyScore)
+            .filter(
+                UserDailyScore.user_id == user_id,
+                UserDailyScore.local_date >= date_from,
+                UserDailyScore.local_date <= date_to,
+                UserDailyScore.deleted_at.is_(None),
+            )
+            .order_by(UserDailyScore.local_date.asc())
+            .all()
+        )
+
+    @staticmethod
+    def get_range_validators(
+        db: Session,
+        user_id: str,
+        date_from: date,
+        date_to: date,
+    ):
+        """
+        캘린더 조건부 GET용: 날짜 구간 row 수 / max(updated_at) / dirty 수 / 스캔 수 합계를 한 번에 조회
+        row를 읽거나 재계산하지 않고 304 여부를 판단하기 위함 (list_range와 같은 PK 범위)
+        """
+        return (
+            db.query(
+                func.count().label("count"),
+                func.max(UserDailyScore.updated_at).label("updated_at"),
+                func.coalesce(func.sum(UserDailyScore.dirty), 0).label("dirty_count"),
+                func.coalesce(func.sum(UserDailyScore.num_scans), 0).label("num_scans"),
+            )
+            .filter(
+                UserDailyScore.user_id == user_id,
+                UserDailyScore.local_date >= date_from,
+                UserDailyScore.local_date <= date_to,
+                UserDailyScore.deleted_at.is_(None),
+            )
+            .one()
+        )
+
+    @staticmethod
+    def claim_dirty_batch(db: Session, limit: int) -> List[tuple]:
+        """
+        dirty row를 오래된 순으로 limit개 잠그고 (user_id, local_date, num_scans) 반환
+        SKIP LOCKED라 워커가 여러 개여도 같은 row를 동시에 처리하지 않음 (커밋 시 해제)
+        """
+        return (
+            db.query(
+                UserDailyScore.user_id,
+                UserDailyScore.local_date,
+                UserDailyScore.num_scans,
+            )
+            .filter(
+                UserDailyScore.dirty == 1,
+                UserDailyScore.deleted_at.is_(None),
+            )
+            .order_by(UserDailyScore.updated_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    @staticmethod
+    def get_dirty_stats(db: Session):
+        """
+        dirty row 개수, 가장 오래된 dirty row의 updated_at, DB 현재 시각 (재계산 지연 지표용)
+        updated_at이 DB 시각(func.now())이라 지연도 DB 시각 기준으로 계산
+        """
+        return (
+            db.query(
+                func.count().label("count"),
+                func.min(UserDailyScore.updated_at).label("oldest_updated_at"),
+                func.now().label("db_now"),
+            )
+            .filter(
+                UserDailyScore.dirty == 1,
+                UserDailyScore.deleted_at.is_(None),
+            )
+            .one()
+        )
+
+    @staticmethod
+    def bulk_update_scores(
+        db: Session,
+        scores: List[Dict],
+        computed_at: datetime,
+        formula_version: int = 1,
+    ) -> int:
+        """
+        여러 날짜의 점수를 UPDATE 한 문장(executemany)으로 저장하고 dirty 해제
+        scores: [{"user_id": str, "local_date": date, "score": int, "num_scans": 계산 시점 num_scans}, ...]
+        계산하는 사이 새 스캔이 들어와 num_scans가 바뀐 날은 건드리지 않음 (dirty 유지)
+        """
+        if not scores:
+            return 0
+
+        table = UserDailyScore.__table__
+        result = db.execute(
+            update(table)
+            .where(
+                table.c.user_id == bindparam("b_user_id"),
+                table.c.local_date == bindparam("b_local_date"),
+                func.coalesce(table.c.num_scans, 0) == bindparam("b_num_scans"),
+            )
+            .values(
+                score=bindparam("b_score"),
+                dirty=0,
+                formula_version=formula_version,
+                last_computed_at=computed_at,
+            ),
+            [
+                {
+                    "b_user_id": item["user_id"],
+                    "b_local_date": item["local_date"],
+                    "b_num_scans": item["num_scans"],
+                    "b_score": item["score"],
+                }
+                for item in scores
+            ],
+        )
+        # 건너뛴 날(num_scans 변경)이 섞여 있어도 다시 집계하면 같은 값이라 전부 갱신
+        UserScoreRollupDAL.refresh(db, [(item["user_id"], item["local_date"]) for item in scores])
+        db.commit()
+        return result.rowcount or 0
+
+    @staticmethod
+    def allocate_scan_seq(
+        db: Session,
+        user_id: str,
+        local_date: date,
+    ) -> int:
+        """
+        특정 user + 날짜의 다음 스캔 순번(1부터)을 발급
+        upsert(없으면 scan_seq=1로 생성, 있으면 +1)로 row를 잠근 뒤 같은 트랜잭션에서 읽기 때문에
+        동시에 스캔해도 번호가 겹치지 않음
+        커밋하지 않음: 호출한 쪽이 스캔 INSERT와 같은 트랜잭션으로 커밋
+        (잠금이 INSERT까지 유지되고, INSERT가 실패해 롤백되면 번호도 반납되어 "N번"이 비지 않음)
+        """
+        table = UserDailyScore.__table__
+        # 오늘 첫 스캔이면 row부터 생성 (update_on_scan에서 num_scans 누적, rollup은 변화 없음)
+        values = dict(
+            user_id=user_id,
+            local_date=local_date,
+            score=0,
+            num_scans=0,
+            decision_counts={},
+            scan_seq=1,
+            dirty=1,
+        )
+        if db.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(table).values(**values)
+            stmt = stmt.on_duplicate_key_update(scan_seq=table.c.scan_seq + 1)
+        else:
+            stmt = sqlite_insert(table).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[c.name for c in table.primary_key.columns],
+                set_={"scan_seq": table.c.scan_seq + 1},
+            )
+        db.execute(stmt)
+
+        seq = db.execute(
+            select(UserDailyScore.scan_seq).where(
+                UserDailyScore.user_id == user_id,
+                UserDailyScore.local_date == local_date,
+            )
+        ).scalar_one()
+        return int(seq)
+
     @staticmethod
     def list(
         db: Session,
@@ -84,6 +306,7 @@ class UserDailyScoreDAL:
         date_to: Optional[date] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[UserDailyScore]:
         q = db.query(UserDailyScore).filter(UserDailyScore.deleted_at.is_(None))
 
@@ -95,12 +318,9 @@ class UserDailyScoreDAL:
             q = q.filter(UserDailyScore.local_date <= date_to)
 
         # 최근 날짜 먼저
-        q = q.order_by(
-            UserDailyScore.user_id.asc(),
-            UserDailyScore.local_date.desc(),
-        )
+        q = apply_keyset(q, UserDailyScoreDAL.LIST_ORDER, limit, cursor=cursor, skip=skip)
 
-        return q.offset(skip).limit(limit).all()
+        return q.all()
 
     @staticmethod
     def update(
@@ -127,9 +347,25 @@ class UserDailyScoreDAL:
         if "max_severity" in data and data["max_severity"] is not None:
             data["max_severity"] = data["max_severity"].value
 
+        old_score, old_dirty = uds.score, uds.dirty
+        old_num_scans, old_counts = uds.num_scans or 0, uds.decision_counts
+
         for field, value in data.items():
             setattr(uds, field, value)
 
+        # 점수가 바뀌거나 새로 확정(dirty 해제)될 때만 평균까지 다시 집계
+        # 스캔 누적(update_on_scan)은 스캔 수 / 판정 개수 변화량만 더함
+        if uds.score != old_score or (old_dirty and not uds.dirty):
+            db.flush()
+            UserScoreRollupDAL.refresh(db, [(user_id, local_date)])
+        else:
+            UserScoreRollupDAL.apply_delta(
+                db,
+                user_id,
+                local_date,
+                num_scans=(uds.num_scans or 0) - old_num_scans,
+                decision_counts=_count_delta(old_counts, uds.decision_counts),
+            )
         db.commit()
         db.refresh(uds)
         return uds
@@ -153,5 +389,7 @@ class UserDailyScoreDAL:
             return False
 
         uds.deleted_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        db.flush()
+        UserScoreRollupDAL.refresh(db, [(user_id, local_date)])
         db.commit()
         return True
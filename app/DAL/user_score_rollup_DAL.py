@@ -0,0 +1,272 @@
+# app/DAL/user_score_rollup_DAL.py
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Integer, and_, cast, delete, func, or_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.user_daily_score import UserDailyScore
+from app.models.user_score_rollup import UserWeeklyScore, UserMonthlyScore
+
+# 집계 값 컬럼 (upsert 시 덮어쓰는 컬럼)
+ROLLUP_VALUE_COLUMNS = ("score", "score_sum", "scored_days", "num_scans", "decision_counts")
+
+
+def week_start(d: date) -> date:
+    # 월요일 시작
+    return d - timedelta(days=d.weekday())
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def next_month(d: date) -> date:
+    return (d.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+class UserScoreRollupDAL:
+    @staticmethod
+    def _upsert(db: Session, model, rows: List[Dict]) -> None:
+        """
+        PK 충돌 시 집계 값만 덮어쓰는 executemany upsert
+        """
+        if not rows:
+            return
+        table = model.__table__
+        if db.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(table)
+            stmt = stmt.on_duplicate_key_update(
+                **{c: stmt.inserted[c] for c in ROLLUP_VALUE_COLUMNS},
+                updated_at=func.now(),
+            )
+        else:
+            stmt = sqlite_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[c.name for c in table.primary_key.columns],
+                set_={**{c: stmt.excluded[c] for c in ROLLUP_VALUE_COLUMNS}, "updated_at": func.now()},
+            )
+        db.execute(stmt, rows)
+
+    @staticmethod
+    def _delta_upsert(db: Session, model, row: Dict, num_scans: int, counts: Dict[str, int]) -> None:
+        """
+        집계 row 하나에 스캔 수 / 판정 개수 변화량을 더하는 upsert (없으면 row 값 그대로 INSERT)
+        판정 개수는 JSON_SET / JSON_EXTRACT로 키별로 더함 (MySQL / SQLite 모두 같은 함수)
+        """
+        table = model.__table__
+        col = table.c.decision_counts
+        pairs = []
+        for key, delta in counts.items():
+            path = f'$."{key}"'
+            pairs += [path, func.coalesce(cast(func.json_extract(col, path), Integer), 0) + delta]
+
+        values = {"num_scans": table.c.num_scans + num_scans, "updated_at": func.now()}
+        if pairs:
+            values["decision_counts"] = func.json_set(func.coalesce(col, func.json_object()), *pairs)
+
+        if db.get_bind().dialect.name == "mysql":
+            stmt = mysql_insert(table).values(**row).on_duplicate_key_update(**values)
+        else:
+            stmt = sqlite_insert(table).values(**row)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[c.name for c in table.primary_key.columns],
+                set_=values,
+            )
+        db.execute(stmt)
+
+    @staticmethod
+    def apply_delta(
+        db: Session,
+        user_id: str,
+        local_date: date,
+        num_scans: int = 0,
+        decision_counts: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        일별 row의 스캔 수 / 판정 개수 변화량만 그 날의 주/월 집계에 더함 (일별 row를 다시 읽지 않음)
+        점수 평균은 건드리지 않음 -> 점수가 바뀌는 곳(재계산)에서 refresh
+        그래서 스캔으로 dirty가 된 날의 이전 점수는 재계산될 때까지 평균에 남아 있음
+        커밋은 호출한 쪽에서
+        """
+        counts = {key: delta for key, delta in (decision_counts or {}).items() if delta}
+        if not num_scans and not counts:
+            return
+
+        base = {"user_id": user_id, "score": -1, "score_sum": 0, "scored_days": 0, "num_scans": num_scans}
+        base["decision_counts"] = {key: delta for key, delta in counts.items() if delta > 0}
+        UserScoreRollupDAL._delta_upsert(
+            db, UserWeeklyScore, {**base, "week_start": week_start(local_date)}, num_scans, counts
+        )
+        UserScoreRollupDAL._delta_upsert(
+            db, UserMonthlyScore, {**base, "month_start": month_start(local_date)}, num_scans, counts
+        )
+
+    @staticmethod
+    def _aggregate(days: Iterable[tuple]) -> Dict:
+        """
+        (score, num_scans, dirty, decision_counts) 목록 -> 집계 값
+        점수는 계산이 끝난 날(score >= 0, dirty 아님)만 평균
+        """
+        score_sum = 0
+        scored_days = 0
+        num_scans = 0
+        decision_counts: Dict[str, int] = defaultdict(int)
+        for score, scans, dirty, counts in days:
+            num_scans += scans or 0
+            for key, value in (counts or {}).items():
+                decision_counts[key] += value or 0
+            if not dirty and score is not None and score >= 0:
+                score_sum += score
+                scored_days += 1
+        return {
+            "score": round(score_sum / scored_days) if scored_days else -1,
+            "score_sum": score_sum,
+            "scored_days": scored_days,
+            "num_scans": num_scans,
+            "decision_counts": dict(decision_counts),
+        }
+
+    @staticmethod
+    def _load_days(db: Session, ranges: Dict[str, Tuple[date, date]]) -> List[tuple]:
+        # 유저별 (시작, 끝) 날짜 구간을 한 번에 PK 범위 스캔
+        return (
+            db.query(
+                UserDailyScore.user_id,
+                UserDailyScore.local_date,
+                UserDailyScore.score,
+                UserDailyScore.num_scans,
+                UserDailyScore.dirty,
+                UserDailyScore.decision_counts,
+            )
+            .filter(
+                or_(*[
+                    and_(
+                        UserDailyScore.user_id == user_id,
+                        UserDailyScore.local_date >= lo,
+                        UserDailyScore.local_date <= hi,
+                    )
+                    for user_id, (lo, hi) in ranges.items()
+                ]),
+                UserDailyScore.deleted_at.is_(None),
+            )
+            .all()
+        )
+
+    @staticmethod
+    def refresh(db: Session, keys: Iterable[Tuple[str, date]]) -> None:
+        """
+        일별 row (user_id, local_date)가 바뀌었을 때 그 날이 속한 주/월만 다시 집계
+        키가 몇 개든 SELECT 1번 + 주간/월간 upsert 1번씩
+        커밋은 호출한 쪽에서 (일별 row 변경과 같은 트랜잭션으로)
+        """
+        weeks = {(user_id, week_start(d)) for user_id, d in keys}
+        months = {(user_id, month_start(d)) for user_id, d in keys}
+        if not weeks:
+            return
+
+        ranges: Dict[str, Tuple[date, date]] = {}
+        for user_id, start in weeks:
+            lo, hi = ranges.get(user_id, (start, start))
+            ranges[user_id] = (min(lo, start), max(hi, start + timedelta(days=6)))
+        for user_id, start in months:
+            lo, hi = ranges.get(user_id, (start, start))
+            ranges[user_id] = (min(lo, start), max(hi, next_month(start) - timedelta(days=1)))
+
+        week_days: Dict[tuple, list] = {key: [] for key in weeks}
+        month_days: Dict[tuple, list] = {key: [] for key in months}
+        for user_id, local_date, score, scans, dirty, counts in UserScoreRollupDAL._load_days(db, ranges):
+            day = (score, scans, dirty, counts)
+            week_key = (user_id, week_start(local_date))
+            if week_key in week_days:
+                week_days[week_key].append(day)
+            month_key = (user_id, month_start(local_date))
+            if month_key in month_days:
+                month_days[month_key].append(day)
+
+        UserScoreRollupDAL._upsert(
+            db,
+            UserWeeklyScore,
+            [
+                {"user_id": user_id, "week_start": start, **UserScoreRollupDAL._aggregate(days)}
+                for (user_id, start), days in week_days.items()
+            ],
+        )
+        UserScoreRollupDAL._upsert(
+            db,
+            UserMonthlyScore,
+            [
+                {"user_id": user_id, "month_start": start, **UserScoreRollupDAL._aggregate(days)}
+                for (user_id, start), days in month_days.items()
+            ],
+        )
+
+    @staticmethod
+    def rebuild_for_users(db: Session, user_ids: List[str]) -> int:
+        """
+        유저들의 주간/월간 집계를 일별 row에서 처음부터 다시 만듦 (rebuild_score_rollups.py)
+        반환: 다시 집계한 일별 row 수
+        """
+        if not user_ids:
+            return 0
+
+        keys = [
+            (user_id, local_date)
+            for user_id, local_date in (
+                db.query(UserDailyScore.user_id, UserDailyScore.local_date)
+                .filter(
+                    UserDailyScore.user_id.in_(user_ids),
+                    UserDailyScore.deleted_at.is_(None),
+                )
+                .all()
+            )
+        ]
+
+        # 일별 row가 전부 지워진 기간이 남지 않도록 먼저 비우고 같은 트랜잭션에서 다시 채움
+        db.execute(delete(UserWeeklyScore).where(UserWeeklyScore.user_id.in_(user_ids)))
+        db.execute(delete(UserMonthlyScore).where(UserMonthlyScore.user_id.in_(user_ids)))
+        UserScoreRollupDAL.refresh(db, keys)
+        db.commit()
+        return len(keys)
+
+    @staticmethod
+    def list_weekly(
+        db: Session,
+        user_id: str,
+        date_from: date,
+        date_to: date,
+    ) -> List[UserWeeklyScore]:
+        """
+        date_from ~ date_to가 걸치는 주간 집계 (오름차순), PK 범위 스캔 한 번
+        """
+        return (
+            db.query(UserWeeklyScore)
+            .filter(
+                UserWeeklyScore.user_id == user_id,
+                UserWeeklyScore.week_start >= week_start(date_from),
+                UserWeeklyScore.week_start <= date_to,
+            )
+            .order_by(UserWeeklyScore.week_start.asc())
+            .all()
+        )
+
+    @staticmethod
+    def list_monthly(
+        db: Session,
+        user_id: str,
+        date_from: date,
+        date_to: date,
+    ) -> List[UserMonthlyScore]:
+        return (
+            db.query(UserMonthlyScore)
+            .filter(
+                UserMonthlyScore.user_id == user_id,
+                UserMonthlyScore.month_start >= month_start(date_from),
+                UserMonthlyScore.month_start <= date_to,
+            )
+            .order_by(UserMonthlyScore.month_start.asc())
+            .all()
+        )
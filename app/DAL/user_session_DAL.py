@@ -0,0 +1,120 @@
+# app/DAL/user_session_DAL.py
+import hashlib
+from datetime import datetime
+from typing import Optional
+from uuid import uuid4
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.models.user_session import UserSession
+
+
+def hash_token(token: str) -> str:
+    # refresh token 원문 -> 저장/조회용 SHA-256 hex
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class UserSessionDAL:
+    @staticmethod
+    def create(
+        db: Session,
+        user_id: str,
+        token_hash: str,
+        expires_at: datetime,
+    ) -> str:
+        """
+        새 세션 생성 후 세션 id 반환 (커밋은 호출한 쪽에서)
+        """
+        session_id = str(uuid4())
+        db.add(
+            UserSession(
+                id=session_id,
+                user_id=user_id,
+                token_hash=token_hash,
+                expires_at=expires_at,
+            )
+        )
+        return session_id
+
+    @staticmethod
+    def find_active(db: Session, token_hash: str, now: datetime):
+        """
+        현재 토큰으로 유효한 세션 (id, user_id, expires_at) - 커버링 인덱스만 읽음
+        """
+        return db.execute(
+            select(UserSession.id, UserSession.user_id, UserSession.expires_at)
+            .where(
+                UserSession.token_hash == token_hash,
+                UserSession.expires_at > now,
+            )
+        ).first()
+
+    @staticmethod
+    def find_recently_rotated(db: Session, token_hash: str, rotated_after: datetime, now: datetime):
+        """
+        직전 토큰(previous_token_hash)으로 들어왔고 갱신된 지 얼마 안 된 세션 (동시 갱신 유예)
+        """
+        return db.execute(
+            select(UserSession.id, UserSession.user_id, UserSession.expires_at)
+            .where(
+                UserSession.previous_token_hash == token_hash,
+                UserSession.rotated_at > rotated_after,
+                UserSession.expires_at > now,
+            )
+        ).first()
+
+    @staticmethod
+    def rotate(
+        db: Session,
+        session_id: str,
+        new_token_hash: str,
+        now: datetime,
+        expires_at: datetime,
+        expected_token_hash: Optional[str] = None,
+    ) -> bool:
+        """
+        세션 토큰을 새 토큰으로 교체하고 지금 토큰은 previous_token_hash로 남김
+        expected_token_hash가 있으면 그 토큰일 때만 교체 (동시에 다른 요청이 교체했으면 False)
+        """
+        q = update(UserSession).where(UserSession.id == session_id)
+        if expected_token_hash is not None:
+            q = q.where(UserSession.token_hash == expected_token_hash)
+
+        # MySQL은 SET을 왼쪽부터 적용하므로 previous_token_hash를 먼저 (교체 전 token_hash를 읽도록)
+        result = db.execute(
+            q.ordered_values(
+                (UserSession.previous_token_hash, UserSession.token_hash),
+                (UserSession.token_hash, new_token_hash),
+                (UserSession.rotated_at, now),
+                (UserSession.expires_at, expires_at),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    @staticmethod
+    def delete(db: Session, session_id: str) -> int:
+        return db.execute(delete(UserSession).where(UserSession.id == session_id)).rowcount or 0
+
+    @staticmethod
+    def delete_for_user(db: Session, user_id: str) -> int:
+        return db.execute(delete(UserSession).where(UserSession.user_id == user_id)).rowcount or 0
+
+    @staticmethod
+    def purge_expired(db: Session, now: datetime, batch_size: int) -> int:
+        """
+        만료된 세션을 최대 batch_size개 삭제하고 커밋 (expires_at 인덱스 범위 -> PK로 삭제, 잠금 범위 작게)
+        """
+        ids = db.execute(
+            select(UserSession.id)
+            .where(UserSession.expires_at <= now)
+            .order_by(UserSession.expires_at)
+            .limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return 0
+
+        deleted = db.execute(delete(UserSession).where(UserSession.id.in_(ids))).rowcount or 0
+        db.commit()
+        return deleted
@@ -1,12 +1,18 @@
 # app/core/ai_client.py
 from functools import lru_cache
-from openai import AsyncOpenAI
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 
 @lru_cache
-def get_openai_client() -> AsyncOpenAI:
+def get_openai_client() -> "AsyncOpenAI":
     if not settings.OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY is not set in environment")
+    # openai SDK는 import만 0.2~0.4초 걸려서 처음 쓸 때 import (워커 시작 / --reload 시간 단축)
+    from openai import AsyncOpenAI
+
     return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
\ No newline at end of file
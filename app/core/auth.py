@@ -1,12 +1,17 @@
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional, Tuple
 import secrets
+import time
 import jwt  # PyJWT (requirements.txt에 pyjwt 추가 필요)
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from app.core.cache import build_cache
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.metrics import metrics
 from app.DAL.user_DAL import UserDAL
 from app.models.user import User  # ORM User 모델
 
@@ -22,10 +27,12 @@ security = HTTPBearer(auto_error=False)
 def create_access_token(
     user_id: str,
     expires_delta: Optional[timedelta] = None,
+    session_id: Optional[str] = None,
 ) -> str:
     """
     우리 서버에서 쓰는 Access Token(JWT) 발급용 함수.
     payload의 sub에 user_id를 넣는 패턴.
+    session_id가 있으면 sid로 넣어서 로그아웃 시 해당 기기 세션만 끊음
     """
     if expires_delta is None:
         expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -36,6 +43,8 @@ def create_access_token(
         "iat": now,
         "exp": now + expires_delta,
     }
+    if session_id:
+        payload["sid"] = session_id
 
     encoded_jwt = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
@@ -60,29 +69,81 @@ def decode_access_token(token: str) -> dict:
         )
 
 
-def get_current_user(
-    request: Request,
-    creds: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+@dataclass(frozen=True)
+class Principal:
+    """
+    인증된 사용자 중 요청 처리에 필요한 필드만 담은 값 (캐시에 저장)
+    User row를 수정해야 하는 엔드포인트는 get_current_db_user 사용
+    """
+    id: str
+    kakao_user_id: Optional[str]
+    name: Optional[str]
+    profile_image_url: Optional[str]
+    timezone: str
+    habits: Optional[List[str]]
+    conditions: Optional[List[str]]
+    allergies: Optional[List[str]]
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            kakao_user_id=user.kakao_user_id,
+            name=user.name,
+            profile_image_url=user.profile_image_url,
+            timezone=user.timezone,
+            habits=list(user.habits) if user.habits is not None else None,
+            conditions=list(user.conditions) if user.conditions is not None else None,
+            allergies=list(user.allergies) if user.allergies is not None else None,
+        )
+
+
+# user_id -> {"loaded_at": epoch 초, "principal": Principal 필드 dict}
+# CACHE_REDIS_URL이 있으면 워커끼리 공유 (무효화도 전체 워커에 적용)
+_principal_cache = build_cache(
+    "principal",
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+)
+metrics.register_collector("cache.principal", _principal_cache.stats)
+
+
+def invalidate_principal(user_id: str) -> None:
+    """
+    프로필 수정 / 로그아웃 / 탈퇴 등 User row가 바뀐 뒤 호출
+    """
+    _principal_cache.delete(user_id)
+
+
+def _get_token(request: Request, creds: Optional[HTTPAuthorizationCredentials]) -> str:
     token = None
 
     # 1) Authorization: Bearer <token>
     if creds and creds.scheme.lower() == "bearer":
         token = creds.credentials
+    elif creds is None:
+        # 의존성 주입 없이 직접 호출한 경우 (creds=None) 헤더를 직접 확인
+        scheme, _, value = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and value:
+            token = value
 
     # 2) (옵션) 쿠키 fallback도 유지하고 싶다면
     if not token:
         token = request.cookies.get("access_token")
-    
 
     if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
         )
+    return token
 
-    payload = decode_access_token(token)
+
+def _authenticate(request: Request, creds: Optional[HTTPAuthorizationCredentials]) -> Tuple[str, int]:
+    """
+    토큰 검증 후 (user_id, iat) 반환
+    """
+    payload = decode_access_token(_get_token(request, creds))
     user_id = payload.get("sub")
 
     if not user_id:
@@ -91,15 +152,74 @@ def get_current_user(
             detail="Invalid token payload",
         )
 
+    return user_id, int(payload.get("iat") or 0)
+
+
+def peek_user_id(request: Request) -> Optional[str]:
+    """
+    토큰이 있고 유효하면 sub(user_id), 아니면 None (예외 없음, DB 조회 없음)
+    get_db에서 인증 의존성이 없는 라우트도 read-your-writes 라우팅에 쓰려고 호출
+    """
+    try:
+        payload = decode_access_token(_get_token(request, None))
+    except HTTPException:
+        return None
+    return payload.get("sub")
+
+
+def get_session_id(request: Request) -> Optional[str]:
+    """
+    요청 access token의 세션 id (sid). 세션 도입 전에 발급된 토큰이면 None
+    """
+    payload = decode_access_token(_get_token(request, None))
+    return payload.get("sid")
+
+
+def _load_user(db: Session, user_id: str) -> User:
     user = UserDAL.get(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
-
     return user
 
+
+def get_current_user(
+    request: Request,
+    creds: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: Session = Depends(get_db),
+) -> Principal:
+    """
+    캐시에 있으면 DB 조회 없이 Principal 반환
+    토큰 발급(iat) 이후에 읽은 값만 사용 -> 새로 로그인하면 한 번은 DB에서 다시 읽음
+    """
+    user_id, iat = _authenticate(request, creds)
+    # 이 요청의 쓰기 / 최근 쓰기 여부로 replica 읽기 여부를 정함 (app/core/db_routing.py)
+    db.info["user_id"] = user_id
+
+    cached = _principal_cache.get(user_id)
+    if cached is not None and cached["loaded_at"] >= iat:
+        return Principal(**cached["principal"])
+
+    loaded_at = int(time.time())
+    principal = Principal.from_user(_load_user(db, user_id))
+    _principal_cache.set(user_id, {"loaded_at": loaded_at, "principal": asdict(principal)})
+    return principal
+
+
+def get_current_db_user(
+    request: Request,
+    creds: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: Session = Depends(get_db),
+) -> User:
+    """
+    User row를 직접 수정하는 엔드포인트용 (캐시 없이 매번 DB 조회)
+    """
+    user_id, _ = _authenticate(request, creds)
+    db.info["user_id"] = user_id
+    return _load_user(db, user_id)
+
 def create_app_refresh_token() -> str:
     """
     우리 서비스용 Refresh Token
@@ -0,0 +1,143 @@
+# app/core/cache.py
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """
+    프로세스 내 TTL + LRU 캐시 (스레드 안전)
+    sync 엔드포인트는 threadpool에서 돌기 때문에 lock으로 보호
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] <= now:
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "backend": "memory",
+                "size": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / total) if total else None,
+            }
+
+
+class RedisCache:
+    """
+    여러 워커/서버가 같은 캐시를 보도록 하는 Redis 백엔드 (CACHE_REDIS_URL 설정 시)
+    값은 JSON으로 저장. Redis 오류는 캐시 miss로 취급하고 DB로 진행
+    """
+
+    def __init__(self, url: str, namespace: str, ttl_seconds: int):
+        # redis는 선택 의존성이라 사용할 때만 import
+        import redis
+
+        self._client = redis.Redis.from_url(url, socket_timeout=0.2)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _count(self, attr: str) -> None:
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._client.get(self._key(key))
+        except Exception:
+            self._count("errors")
+            self._count("misses")
+            return None
+        if raw is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            self._client.set(self._key(key), json.dumps(value, default=str), ex=self.ttl_seconds)
+        except Exception:
+            self._count("errors")
+
+    def delete(self, key: str) -> None:
+        try:
+            self._client.delete(self._key(key))
+        except Exception:
+            self._count("errors")
+
+    def clear(self) -> None:
+        try:
+            keys = list(self._client.scan_iter(match=f"{self.namespace}:*"))
+            if keys:
+                self._client.delete(*keys)
+        except Exception:
+            self._count("errors")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "backend": "redis",
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "hit_ratio": (self.hits / total) if total else None,
+            }
+
+
+def build_cache(namespace: str, ttl_seconds: int, max_entries: int):
+    """
+    CACHE_REDIS_URL이 있으면 Redis, 없으면 프로세스 내 캐시
+    (프로세스 내 캐시는 워커마다 따로라서 무효화도 해당 워커에만 적용됨 -> TTL을 짧게)
+    """
+    if settings.CACHE_REDIS_URL:
+        return RedisCache(settings.CACHE_REDIS_URL, namespace, ttl_seconds)
+    return TTLCache(ttl_seconds, max_entries)
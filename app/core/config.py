@@ -5,7 +5,66 @@ from pathlib import Path
 
 class Settings(BaseSettings):
     # --- DB ---
+    # 없으면 MYSQL_* 환경변수로 구성. 로컬 개발/벤치마크는 sqlite:///./healthy_scanner.db
     DATABASE_URL: str | None = None
+    # SQLite 쓰기 잠금을 기다리는 최대 시간
+    SQLITE_BUSY_TIMEOUT_SECONDS: float = 30.0
+    # 워커 프로세스 수 x (POOL_SIZE + MAX_OVERFLOW)가 MySQL max_connections를 넘지 않게
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    # 풀이 꽉 찼을 때 커넥션을 기다리는 최대 시간
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+    # MySQL wait_timeout(기본 8시간)보다 짧게. 이보다 오래된 커넥션은 checkout 시 새로 연결
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # checkout마다 ping 왕복으로 끊긴 커넥션(방화벽/LB idle timeout)을 걸러냄
+    # false(recycle만)는 운영 MySQL에서 benchmark_db_pool.py로 이득을 확인했을 때만
+    DB_POOL_PRE_PING: bool = True
+
+    # --- SQL 쿼리 통계 (app/core/query_stats.py) ---
+    # 켜면 응답에 X-DB-Query-Count / X-DB-Query-Ms 헤더 추가 (로컬 개발 / 벤치마크용, 운영에서는 끔)
+    QUERY_STATS_HEADERS: bool = False
+    # 이보다 오래 걸린 SQL은 라우트와 함께 경고 로그 (db.slow_queries 카운터)
+    SLOW_QUERY_MS: float = 200.0
+    SLOW_QUERY_LOG_MAX_CHARS: int = 1000
+
+    # --- 프로세스 지표 (GET /v1/metrics) ---
+    # 인증 없이 캐시/풀 상태, replica 오류 메시지(DB 호스트/유저가 들어갈 수 있음), 카카오 오류 수를 그대로 내려줌
+    # 그래서 기본은 라우트를 등록하지 않음. 외부에서 닿지 않는 환경(로컬 / 스테이징 내부망)에서만 켤 것
+    METRICS_ENDPOINT_ENABLED: bool = False
+
+    # --- 앱 시작 ---
+    # startup에서 DB 풀 / 모델 매퍼 / HTTP 클라이언트 미리 준비 (app/core/warmup.py)
+    STARTUP_WARMUP_ENABLED: bool = True
+    STARTUP_WARMUP_DB_CONNECTIONS: int = 4
+
+    # --- 읽기 replica ---
+    # 없으면 모든 요청이 primary
+    REPLICA_DATABASE_URL: str | None = None
+    # replica에서 읽어도 되는 GET 라우트 (FastAPI route name = 엔드포인트 함수 이름)
+    REPLICA_READ_ROUTES: list[str] = [
+        "get_product",
+        "list_products",
+        "get_ingredient",
+        "list_ingredients",
+        "get_nutrition",
+        "list_nutrition",
+        "list_scan_history",
+        "get_scan_detail",
+        "get_full_scan_history",
+        "get_scan_list",
+        "get_user_score_trend",
+        "get_user_daily_score",
+        "list_user_daily_scores",
+        "get_my_page",
+    ]
+    # 복제 지연이 이보다 크면 primary에서 읽음 (라우트별로 REPLICA_ROUTE_MAX_LAG_SECONDS에서 덮어씀)
+    REPLICA_MAX_LAG_SECONDS: float = 2.0
+    REPLICA_ROUTE_MAX_LAG_SECONDS: dict[str, float] = {}
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 1.0
+    # 쓰기 직후 이 시간 동안 그 유저의 읽기는 primary (REPLICA_MAX_LAG_SECONDS보다 길게)
+    # 워커 프로세스끼리 공유하려면 CACHE_REDIS_URL 필요
+    READ_YOUR_WRITES_SECONDS: int = 5
+    READ_YOUR_WRITES_MAX_ENTRIES: int = 100000
 
     # --- OpenAI ---
     OPENAI_API_KEY: str | None = None
@@ -14,6 +73,15 @@ class Settings(BaseSettings):
     KAKAO_CLIENT_ID: str | None = None
     KAKAO_CLIENT_SECRET: str | None = None
     KAKAO_REDIRECT_URI: str | None = None
+    # 로컬 테스트 시 stub 서버 주소로 바꿔서 사용
+    KAKAO_AUTH_BASE_URL: str = "https://kauth.kakao.com"
+    KAKAO_API_BASE_URL: str = "https://kapi.kakao.com"
+    KAKAO_HTTP_TIMEOUT_SECONDS: float = 5.0
+    KAKAO_HTTP_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    KAKAO_HTTP_MAX_CONNECTIONS: int = 50
+    KAKAO_HTTP_MAX_KEEPALIVE: int = 20
+    # 연결 실패 재시도 횟수 (조회 API는 5xx / 읽기 타임아웃도 재시도)
+    KAKAO_HTTP_RETRIES: int = 2
 
     # --- 이미지 저장 설정 ---
     # 기본값은 "프로젝트 기준 static"
@@ -22,6 +90,38 @@ class Settings(BaseSettings):
     )
     IMAGE_BASE_URL: str = "/static"
 
+    # --- 앱 로그인 세션 (refresh token) ---
+    REFRESH_TOKEN_TTL_DAYS: int = 30
+    # 동시에 두 요청이 같은 토큰으로 갱신할 때 직전 토큰도 잠깐 허용
+    REFRESH_TOKEN_ROTATION_GRACE_SECONDS: int = 30
+    # 잘못된 refresh token을 기억해서 반복 요청이 DB까지 가지 않게 (프로세스 내)
+    INVALID_REFRESH_TOKEN_CACHE_TTL_SECONDS: int = 300
+    INVALID_REFRESH_TOKEN_CACHE_MAX_ENTRIES: int = 50000
+    SESSION_PURGE_BATCH_SIZE: int = 1000
+
+    # --- HTTP 캐시 ---
+    # 상품 정보는 유저와 무관하고 거의 바뀌지 않아서 공유 캐시 허용
+    PRODUCT_CACHE_MAX_AGE_SECONDS: int = 300
+
+    # --- 서버 캐시 ---
+    # 설정하면 워커끼리 캐시 공유 (redis 패키지 필요), 없으면 프로세스 내 캐시
+    CACHE_REDIS_URL: str | None = None
+    HOME_CACHE_TTL_SECONDS: int = 60
+    HOME_CACHE_MAX_ENTRIES: int = 10000
+    # 인증된 사용자(Principal) 캐시: 매 요청 user 조회를 생략
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # --- 점수 산식 ---
+    # app/services/score_formulas.py 에 등록된 버전. 바꾼 뒤 python recompute_scores.py 로 전체 재계산
+    SCORE_FORMULA_VERSION: int = 1
+
+    # --- 점수 재계산 워커 ---
+    # dirty인 user_daily_score를 배치로 미리 재계산 (여러 워커 프로세스여도 SKIP LOCKED로 나눠 처리)
+    SCORE_WORKER_ENABLED: bool = True
+    SCORE_WORKER_BATCH_SIZE: int = 200
+    SCORE_WORKER_INTERVAL_SECONDS: float = 5.0
+
     class Config:
         env_file = ".env"
         extra = "ignore"
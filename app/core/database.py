@@ -1,9 +1,20 @@
 # app/core/db.py
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
+from fastapi import Request
 import os
 from dotenv import load_dotenv
 
+from app.core.config import settings
+from app.core.db_routing import ReplicaLagMonitor, RoutingSession
+from app.core.metrics import metrics
+from app.core.query_stats import instrument_query_stats
+
 load_dotenv()
 
 # ⚠️ .env 파일에서 DB 설정 읽어오기
@@ -13,34 +24,178 @@ MYSQL_HOST = os.getenv("MYSQL_HOST")
 MYSQL_PORT = os.getenv("MYSQL_PORT")
 MYSQL_DB = os.getenv("MYSQL_DB")
 
-# MySQL 접속 URL 구성
-DATABASE_URL = (
+# MySQL 접속 URL 구성 (DATABASE_URL이 있으면 그걸 우선 사용, 로컬은 sqlite:///./healthy_scanner.db 가능)
+DATABASE_URL = settings.DATABASE_URL or (
     f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}"
     f"@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DB}"
     "?charset=utf8mb4"
 )
 
+
+class TimedQueuePool(QueuePool):
+    """
+    커넥션을 받기까지 기다린 시간(db.pool.wait)과 풀 고갈 타임아웃(db.pool.timeouts) 기록
+    (pre-ping / recycle 재연결 시간도 wait에 포함)
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            metrics.inc("db.pool.timeouts")
+            raise
+        finally:
+            metrics.observe("db.pool.wait", (time.perf_counter() - start) * 1000)
+
+
+def pool_options() -> dict:
+    """
+    커넥션 풀 설정
+    - 기본은 pre-ping: checkout마다 ping 왕복 1번으로 끊긴 커넥션(LB/프록시 idle timeout 등)을 걸러냄
+    - pool_recycle은 MySQL wait_timeout보다 짧게 두어 서버가 끊을 만큼 오래된 커넥션은 미리 새로 연결
+    - DB_POOL_PRE_PING=false(recycle만)는 선택: 중간에 끊긴 커넥션을 만나면 그 요청은 500으로 실패하고
+      풀 전체가 새로 연결됨. 운영 MySQL에서 benchmark_db_pool.py로 차이를 확인한 뒤에만 끌 것
+    """
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    로컬 SQLite 모드 (DATABASE_URL=sqlite:///./healthy_scanner.db)
+    - WAL: 읽기와 쓰기가 서로 막지 않음 (쓰기는 여전히 한 번에 하나)
+    - synchronous=NORMAL: 커밋마다 fsync 하지 않음 (WAL에서는 DB가 깨지지 않고 마지막 커밋만 잃을 수 있음)
+    - foreign_keys: SQLite는 기본으로 FK(ON DELETE CASCADE 포함)를 검사하지 않음
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _create_engine(url: str):
+    if make_url(url).get_backend_name() == "sqlite":
+        # sqlite는 기본 풀을 그대로 사용. 쓰기 잠금은 timeout 동안 기다렸다가 실패
+        engine = create_engine(
+            url,
+            echo=False,
+            connect_args={
+                "check_same_thread": False,
+                "timeout": settings.SQLITE_BUSY_TIMEOUT_SECONDS,
+            },
+        )
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        return engine
+    return create_engine(url, echo=False, **pool_options())
+
+
+def instrument_pool(engine, name: str = "db.pool") -> None:
+    """
+    풀 이벤트로 지표 수집 + GET /v1/metrics collectors[name]에 현재 풀 상태 노출
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.inc(f"{name}.connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checkout_at = connection_record.info.pop("checkout_at", None)
+        if checkout_at is not None:
+            metrics.observe(f"{name}.hold", (time.perf_counter() - checkout_at) * 1000)
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.inc(f"{name}.invalidated")
+
+    def _stats() -> dict:
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            return {"class": type(pool).__name__}
+        stats = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(0, pool.overflow()),
+            "timeout_seconds": pool.timeout(),
+        }
+        if isinstance(pool, TimedQueuePool):
+            # pool_options()로 만든 풀 (SQLite 기본 풀은 DB_POOL_* 설정을 쓰지 않음)
+            stats.update(
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pre_ping=settings.DB_POOL_PRE_PING,
+                recycle_seconds=settings.DB_POOL_RECYCLE_SECONDS,
+            )
+        return stats
+
+    metrics.register_collector(name, _stats)
+
+
 # SQLAlchemy 엔진 생성
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,
-    pool_pre_ping=True,     # 연결 살펴보고 끊어졌으면 재연결
-)
+engine = _create_engine(DATABASE_URL)
+instrument_pool(engine)
+instrument_query_stats(engine)
+
+# 읽기 전용 replica (없으면 모든 요청이 primary)
+replica_engine = None
+replica_lag_monitor = None
+if settings.REPLICA_DATABASE_URL:
+    replica_engine = _create_engine(settings.REPLICA_DATABASE_URL)
+    instrument_pool(replica_engine, "db.replica_pool")
+    instrument_query_stats(replica_engine)
+    replica_lag_monitor = ReplicaLagMonitor(
+        replica_engine,
+        interval_seconds=settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+    )
+    metrics.register_collector("db.replica", replica_lag_monitor.stats)
 
-# 세션 팩토리
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 세션 팩토리 (기본은 primary, REPLICA_READ_ROUTES의 읽기만 replica로)
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replica_bind=replica_engine,
+    lag_monitor=replica_lag_monitor,
+)
 
 # Base 클래스 (모든 모델이 여기를 상속)
 Base = declarative_base()
 
 
 # FastAPI 의존성
-def get_db():
+def get_db(request: Request):
     """
     요청마다 DB 세션을 열고,
     요청이 끝나면 자동으로 닫아줌.
+    REPLICA_READ_ROUTES에 등록된 GET 라우트면 읽기를 replica로 보낼 수 있게 표시
+    replica가 있으면 토큰의 sub를 user_id로 기록 -> 인증 의존성이 없는 라우트도
+    쓰기 직후(스캔 저장 -> 상세 조회)에는 primary에서 읽음 (read-your-writes)
     """
     db = SessionLocal()
+    if replica_engine is not None:
+        # app.core.auth가 get_db를 import하므로 여기서 import
+        from app.core.auth import peek_user_id
+
+        user_id = peek_user_id(request)
+        if user_id:
+            db.info["user_id"] = user_id
+    route = request.scope.get("route")
+    route_name = getattr(route, "name", None)
+    if request.method == "GET" and route_name in settings.REPLICA_READ_ROUTES:
+        db.info["replica_route"] = route_name
     try:
         yield db
     finally:
@@ -0,0 +1,168 @@
+# app/core/db_routing.py
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.core.cache import build_cache
+from app.core.config import settings
+from app.core.metrics import metrics
+
+# user_id -> 마지막 쓰기 시각. 이 안에 있는 유저의 읽기는 primary로 (read-your-writes)
+# CACHE_REDIS_URL이 없으면 워커 프로세스마다 따로 기록됨
+_recent_writers = build_cache(
+    "recent_write",
+    ttl_seconds=max(settings.READ_YOUR_WRITES_SECONDS, math.ceil(settings.REPLICA_MAX_LAG_SECONDS)),
+    max_entries=settings.READ_YOUR_WRITES_MAX_ENTRIES,
+)
+metrics.register_collector("cache.recent_write", _recent_writers.stats)
+
+
+def mark_user_write(user_id: str) -> None:
+    _recent_writers.set(user_id, time.time())
+
+
+def has_recent_write(user_id: str) -> bool:
+    return _recent_writers.get(user_id) is not None
+
+
+class ReplicaLagMonitor:
+    """
+    replica 복제 지연(초)을 주기적으로 확인 (요청마다 조회하지 않고 interval 동안 값 재사용)
+    확인에 실패하거나 복제가 멈춰 있으면 unhealthy -> 모든 읽기를 primary로
+    """
+
+    def __init__(self, engine: Engine, interval_seconds: float):
+        self.engine = engine
+        self.interval_seconds = interval_seconds
+
+        self._lock = threading.Lock()
+        self._lag_seconds: Optional[float] = None
+        self._checked_at = 0.0
+        self._last_checked_at: Optional[datetime] = None
+        self._last_error: Optional[str] = None
+
+    def _query_lag(self) -> float:
+        with self.engine.connect() as conn:
+            try:
+                row = conn.exec_driver_sql("SHOW REPLICA STATUS").mappings().first()
+            except Exception:
+                # MySQL 8.0.22 이전
+                conn.rollback()
+                row = conn.exec_driver_sql("SHOW SLAVE STATUS").mappings().first()
+
+        if row is None:
+            # 복제 설정이 없는 서버 (로컬에서 primary와 같은 DB를 replica로 지정한 경우 등)
+            return 0.0
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        # NULL이면 복제 스레드가 멈춘 상태
+        return math.inf if lag is None else float(lag)
+
+    def lag_seconds(self) -> Optional[float]:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < self.interval_seconds:
+                return self._lag_seconds
+            # 다른 요청은 확인이 끝날 때까지 이전 값 사용
+            self._checked_at = now
+
+        try:
+            lag, error = self._query_lag(), None
+        except Exception as e:
+            lag, error = None, repr(e)
+            metrics.inc("db.replica.check_errors")
+
+        with self._lock:
+            self._lag_seconds = lag
+            self._last_error = error
+            self._last_checked_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        return lag
+
+    def within(self, max_lag_seconds: float) -> bool:
+        lag = self.lag_seconds()
+        return lag is not None and lag <= max_lag_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        # GET /v1/metrics 의 collectors["db.replica"]
+        with self._lock:
+            lag = self._lag_seconds
+            return {
+                "lag_seconds": None if lag is None or math.isinf(lag) else lag,
+                "healthy": lag is not None and not math.isinf(lag),
+                "last_checked_at": self._last_checked_at.isoformat() if self._last_checked_at else None,
+                "last_error": self._last_error,
+            }
+
+
+class RoutingSession(Session):
+    """
+    읽기 전용 라우트의 SELECT만 replica로 보내는 세션
+    - get_db가 REPLICA_READ_ROUTES에 있는 GET 요청이면 info["replica_route"]를 채움
+    - get_db(토큰의 sub) / get_current_user가 info["user_id"]를 채움 -> 최근에 쓰기를 한 유저면 primary
+    - flush / INSERT·UPDATE·DELETE는 항상 primary. 한 번 쓰면 그 세션의 이후 읽기도 primary
+    - 라우트를 잘못 등록해도 쓰기는 primary로 가므로 데이터가 깨지지 않음 (읽기만 조금 늦을 수 있음)
+    """
+
+    def __init__(
+        self,
+        *args,
+        replica_bind: Optional[Engine] = None,
+        lag_monitor: Optional[ReplicaLagMonitor] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.lag_monitor = lag_monitor
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        primary = super().get_bind(mapper, clause=clause, **kw)
+        if self.replica_bind is None:
+            return primary
+
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["wrote"] = True
+            self.info["use_replica"] = False
+            return primary
+
+        route = self.info.get("replica_route")
+        if route is None:
+            return primary
+
+        # 한 요청 안에서는 처음 정한 쪽을 계속 사용 (replica / primary를 오가며 섞어 읽지 않음)
+        use_replica = self.info.get("use_replica")
+        if use_replica is None:
+            use_replica = self.info["use_replica"] = self._choose_replica(route)
+        return self.replica_bind if use_replica else primary
+
+    def _choose_replica(self, route: str) -> bool:
+        user_id = self.info.get("user_id")
+        if user_id and has_recent_write(user_id):
+            metrics.inc("db.route.primary_recent_write")
+            return False
+
+        max_lag = settings.REPLICA_ROUTE_MAX_LAG_SECONDS.get(route, settings.REPLICA_MAX_LAG_SECONDS)
+        if self.lag_monitor is not None and not self.lag_monitor.within(max_lag):
+            metrics.inc("db.route.primary_replica_lag")
+            return False
+
+        metrics.inc("db.route.replica")
+        return True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _mark_write_after_commit(session: RoutingSession) -> None:
+    if session.info.pop("wrote", False):
+        user_id = session.info.get("user_id")
+        if user_id:
+            mark_user_write(user_id)
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _clear_write_after_rollback(session: RoutingSession) -> None:
+    session.info.pop("wrote", None)
@@ -0,0 +1,101 @@
+# app/core/http_cache.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+# 유저별 데이터: 브라우저/앱만 저장하고 매번 재검증
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def public_max_age(seconds: int) -> str:
+    return f"public, max-age={seconds}"
+
+
+def build_etag(*parts) -> str:
+    """
+    updated_at, payload 버전 등으로 strong ETag 생성 (None은 빈 문자열로 취급)
+    """
+    raw = "|".join("" if p is None else (p.isoformat() if isinstance(p, datetime) else str(p)) for p in parts)
+    return '"' + hashlib.sha1(raw.encode("utf-8")).hexdigest() + '"'
+
+
+def latest(*values: Optional[datetime]) -> Optional[datetime]:
+    """
+    여러 updated_at 중 가장 최근 값 (Last-Modified 용)
+    """
+    present = [v for v in values if v is not None]
+    return max(present) if present else None
+
+
+def _to_utc(dt: datetime) -> datetime:
+    # DB datetime은 naive UTC로 저장됨
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def format_http_date(dt: datetime) -> str:
+    return format_datetime(_to_utc(dt), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match는 weak 비교 (W/ 접두어 무시)
+    target = etag.removeprefix("W/")
+    return any(t.strip().removeprefix("W/") == target for t in header.split(","))
+
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+) -> bool:
+    """
+    조건부 GET 판정. If-None-Match가 있으면 그것만 보고,
+    없을 때만 If-Modified-Since를 봄 (RFC 9110)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since is None:
+            return False
+        # HTTP 날짜는 초 단위까지만 표현됨
+        return _to_utc(last_modified).replace(microsecond=0) <= _to_utc(since)
+
+    return False
+
+
+def set_cache_headers(
+    response: Response,
+    etag: str,
+    last_modified: Optional[datetime],
+    cache_control: str,
+) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_http_date(last_modified)
+
+
+def not_modified_response(
+    etag: str,
+    last_modified: Optional[datetime],
+    cache_control: str,
+) -> Response:
+    """
+    본문 없는 304 응답 (검증자 헤더는 200과 동일하게 보냄)
+    """
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, last_modified, cache_control)
+    return response
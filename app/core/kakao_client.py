@@ -0,0 +1,32 @@
+# app/core/kakao_client.py
+from functools import lru_cache
+
+import httpx
+
+from app.core.config import settings
+
+
+@lru_cache
+def get_kakao_http_client() -> httpx.AsyncClient:
+    """
+    카카오 API 공용 AsyncClient (프로세스당 하나, keep-alive 연결 재사용)
+    transport retries는 연결 단계 실패(ConnectError/ConnectTimeout)만 재시도 -> 요청이 전송되지 않은 경우라 POST도 안전
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            settings.KAKAO_HTTP_TIMEOUT_SECONDS,
+            connect=settings.KAKAO_HTTP_CONNECT_TIMEOUT_SECONDS,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.KAKAO_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.KAKAO_HTTP_MAX_KEEPALIVE,
+        ),
+        transport=httpx.AsyncHTTPTransport(retries=settings.KAKAO_HTTP_RETRIES),
+    )
+
+
+async def close_kakao_http_client() -> None:
+    # 앱 shutdown 시 연결 정리 (한 번도 만들지 않았으면 아무것도 안 함)
+    if get_kakao_http_client.cache_info().currsize:
+        await get_kakao_http_client().aclose()
+        get_kakao_http_client.cache_clear()
@@ -0,0 +1,35 @@
+# app/core/local_time.py
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# 유저 timezone이 비어 있으면 한국 시간 기준
+DEFAULT_TIMEZONE = "Asia/Seoul"
+
+
+@lru_cache(maxsize=64)
+def get_zone(tz_name: Optional[str] = None) -> ZoneInfo:
+    """
+    timezone 이름 -> ZoneInfo. 잘못된 이름이면 기본 timezone으로 대체.
+    """
+    try:
+        return ZoneInfo(tz_name or DEFAULT_TIMEZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(DEFAULT_TIMEZONE)
+
+
+def to_local_date(scanned_at: datetime, tz_name: Optional[str] = None) -> date:
+    """
+    DB에 저장된 naive UTC datetime을 유저 로컬 날짜로 변환
+    """
+    if scanned_at.tzinfo is None:
+        scanned_at = scanned_at.replace(tzinfo=timezone.utc)
+    return scanned_at.astimezone(get_zone(tz_name)).date()
+
+
+def local_today(tz_name: Optional[str] = None) -> date:
+    """
+    유저 로컬 기준 오늘 날짜
+    """
+    return datetime.now(get_zone(tz_name)).date()
@@ -0,0 +1,82 @@
+# app/core/metrics.py
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict
+
+
+class Metrics:
+    """
+    프로세스 내 간단한 지표 모음 (카운터 / 지연시간 p50·p99 / 외부 collector)
+    GET /v1/metrics 로 조회
+    """
+
+    # 지연시간은 최근 N개 샘플로만 백분위 계산
+    SAMPLE_SIZE = 2048
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._samples: Dict[str, Deque[float]] = {}
+        self._totals: Dict[str, int] = {}
+        self._collectors: Dict[str, Callable[[], Any]] = {}
+
+    def inc(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, ms: float) -> None:
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.SAMPLE_SIZE)
+            samples.append(ms)
+            self._totals[name] = self._totals.get(name, 0) + 1
+
+    @contextmanager
+    def timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - start) * 1000)
+
+    def register_collector(self, name: str, fn: Callable[[], Any]) -> None:
+        """
+        캐시 통계처럼 조회 시점에 값을 읽어오는 지표 등록
+        """
+        with self._lock:
+            self._collectors[name] = fn
+
+    @staticmethod
+    def _percentile(sorted_values: list, q: float) -> float:
+        idx = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+        return sorted_values[idx]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            totals = dict(self._totals)
+            collectors = dict(self._collectors)
+
+        latency: Dict[str, Any] = {}
+        for name, values in samples.items():
+            if not values:
+                continue
+            latency[name] = {
+                "count": totals.get(name, 0),
+                "p50_ms": round(self._percentile(values, 0.50), 3),
+                "p99_ms": round(self._percentile(values, 0.99), 3),
+                "max_ms": round(values[-1], 3),
+            }
+
+        return {
+            "counters": counters,
+            "latency": latency,
+            "collectors": {name: fn() for name, fn in collectors.items()},
+        }
+
+
+metrics = Metrics()
@@ -0,0 +1,102 @@
+# app/core/pagination.py
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, or_, tuple_
+
+# 다음 페이지 커서를 내려주는 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# (컬럼, 내림차순 여부) 목록. 마지막 컬럼은 PK처럼 유일해야 페이지가 겹치지 않음
+KeysetOrder = Sequence[Tuple[Any, bool]]
+
+
+def _dump(value: Any) -> list:
+    # JSON으로 날짜 타입을 잃지 않도록 타입 태그를 같이 저장
+    if isinstance(value, datetime):
+        return ["dt", value.isoformat()]
+    if isinstance(value, date):
+        return ["d", value.isoformat()]
+    return ["v", value]
+
+
+def _load(item: list) -> Any:
+    tag, value = item
+    if tag == "dt":
+        return datetime.fromisoformat(value)
+    if tag == "d":
+        return date.fromisoformat(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps([_dump(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> tuple:
+    """
+    클라이언트가 보낸 커서 -> 키 값 튜플. 형식이 틀리면 400
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        items = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = tuple(_load(item) for item in items)
+    except (ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def _after(order: KeysetOrder, values: tuple):
+    """
+    정렬 순서상 values 다음에 오는 row 조건
+    방향이 모두 같으면 row 비교 (a, b) < (x, y) 한 번으로 인덱스 범위 스캔
+    """
+    columns = [col for col, _ in order]
+    directions = {is_desc for _, is_desc in order}
+    if len(directions) == 1:
+        if directions.pop():
+            return tuple_(*columns) < tuple_(*values)
+        return tuple_(*columns) > tuple_(*values)
+
+    # 방향이 섞여 있으면 (a > x) OR (a = x AND b < y) ... 로 풀어서 비교
+    clauses = []
+    for i, (col, is_desc) in enumerate(order):
+        prefix = [c == v for c, v in zip(columns[:i], values[:i])]
+        step = col < values[i] if is_desc else col > values[i]
+        clauses.append(and_(*prefix, step))
+    return or_(*clauses)
+
+
+def apply_keyset(q, order: KeysetOrder, limit: int, cursor: Optional[str] = None, skip: int = 0):
+    """
+    cursor가 있으면 keyset(seek) 방식, 없으면 기존 skip/limit(offset) 방식
+    어느 쪽이든 같은 정렬 순서를 사용
+    """
+    q = q.order_by(*[col.desc() if is_desc else col.asc() for col, is_desc in order])
+    if cursor:
+        q = q.filter(_after(order, decode_cursor(cursor, len(order))))
+    elif skip:
+        q = q.offset(skip)
+    return q.limit(limit)
+
+
+def next_cursor(rows: Sequence[Any], limit: int, order: KeysetOrder) -> Optional[str]:
+    """
+    한 페이지가 꽉 찼으면 마지막 row 기준 다음 커서, 아니면 None (마지막 페이지)
+    """
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(*[getattr(last, col.key) for col, _ in order])
+
+
+def set_next_cursor(response: Response, rows: Sequence[Any], limit: int, order: KeysetOrder) -> None:
+    cursor = next_cursor(rows, limit, order)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
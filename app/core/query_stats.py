@@ -0,0 +1,164 @@
+# app/core/query_stats.py
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_MS_HEADER = "X-DB-Query-Ms"
+
+
+@dataclass
+class QueryStats:
+    """
+    한 요청(또는 count_queries 블록)에서 실행된 SQL 수 / DB 시간
+    """
+
+    count: int = 0
+    total_ms: float = 0.0
+    scope: Optional[Dict[str, Any]] = None  # ASGI scope (라우트는 매칭된 뒤에 채워짐)
+    statements: Optional[List[str]] = None  # count_queries에서만 SQL 원문을 모음
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if self.statements is not None:
+            self.statements.append(statement)
+
+    @property
+    def route(self) -> Optional[str]:
+        if self.scope is None:
+            return None
+        route = self.scope.get("route")
+        path = getattr(route, "path", None) or self.scope.get("path")
+        return f"{self.scope.get('method')} {path}"
+
+
+# 현재 요청의 통계. 동기 라우트/의존성도 threadpool로 context가 복사되므로 같은 객체를 봄
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+# count_queries 블록들: context와 상관없이 프로세스의 모든 SQL을 받음
+# (TestClient는 앱을 다른 스레드의 이벤트 루프에서 실행해서 contextvar가 전달되지 않음)
+_watchers: List[QueryStats] = []
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def instrument_query_stats(engine: Engine) -> None:
+    """
+    cursor 실행 이벤트로 SQL 수 / 시간 집계 + SLOW_QUERY_MS 이상이면 라우트와 함께 경고 로그
+    추적 중인 요청이 없어도(워커, 스크립트) 느린 쿼리 로그는 남김
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_started_at"].pop()) * 1000
+
+        stats = _current.get()
+        if stats is not None:
+            stats.record(statement, elapsed_ms)
+        for watcher in _watchers:
+            watcher.record(statement, elapsed_ms)
+
+        if elapsed_ms >= settings.SLOW_QUERY_MS:
+            metrics.inc("db.slow_queries")
+            logger.warning(
+                "slow query %.1fms route=%s: %s",
+                elapsed_ms,
+                stats.route if stats is not None else None,
+                statement[: settings.SLOW_QUERY_LOG_MAX_CHARS],
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(exception_context):
+        # 실패한 쿼리는 after_cursor_execute가 오지 않으므로 시작 시각만 정리
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
+
+
+class QueryStatsMiddleware:
+    """
+    요청마다 QueryStats를 시작하고, QUERY_STATS_HEADERS가 켜져 있으면
+    X-DB-Query-Count / X-DB-Query-Ms 응답 헤더로 내려줌
+    (스트리밍 응답은 헤더를 보낸 뒤에 실행된 쿼리가 빠질 수 있음)
+    """
+
+    def __init__(self, app, add_headers: Optional[bool] = None):
+        self.app = app
+        self.add_headers = settings.QUERY_STATS_HEADERS if add_headers is None else add_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope=scope)
+        token = _current.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and self.add_headers:
+                headers = list(message.get("headers", []))
+                headers.append((QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()))
+                headers.append((QUERY_MS_HEADER.lower().encode(), f"{stats.total_ms:.1f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current.reset(token)
+            metrics.observe("db.queries_per_request", stats.count)
+            metrics.observe("db.time_per_request", stats.total_ms)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """
+    블록 안에서 실행된 SQL 수 / 원문 수집 (테스트, 벤치마크용)
+    다른 스레드(TestClient 안의 앱, threadpool)에서 실행된 SQL도 포함. 점수 워커처럼 같은 시간에
+    도는 백그라운드 작업의 SQL도 섞이므로 테스트에서는 SCORE_WORKER_ENABLED=false로
+
+        with count_queries() as q:
+            client.get("/v1/home", headers=headers)
+        assert q.count <= 3, q.statements
+    """
+    stats = QueryStats(statements=[])
+    _watchers.append(stats)
+    try:
+        yield stats
+    finally:
+        _watchers.remove(stats)
+
+
+@contextmanager
+def assert_query_budget(max_queries: int, label: str = "") -> Iterator[QueryStats]:
+    """
+    pytest용: 블록 안의 SQL 수가 max_queries를 넘으면 AssertionError (실행된 SQL 목록 포함)
+
+        def test_full_scan_query_budget(client, headers):
+            with assert_query_budget(4, "GET /v1/scan-history/{id}/details"):
+                client.get(f"/v1/scan-history/{scan_id}/details", headers=headers)
+    """
+    with count_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        listing = "\n".join(f"  {i}. {sql}" for i, sql in enumerate(stats.statements or [], 1))
+        raise AssertionError(
+            f"{label or 'query budget'}: {stats.count} queries > budget {max_queries}\n{listing}"
+        )
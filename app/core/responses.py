@@ -0,0 +1,69 @@
+# app/core/responses.py
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
+
+# 응답 헤더 중 본문에 따라 새로 계산되는 것 (임시 Response에서 옮기지 않음)
+_BODY_HEADERS = {b"content-length", b"content-type"}
+
+
+def _default(obj: Any) -> Any:
+    # orjson이 직접 못 다루는 타입만 (datetime / date / Enum / UUID는 orjson이 처리)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson으로 직렬화하는 JSON 응답 (json.dumps보다 수 배 빠르고 bytes를 바로 만듦)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def fast_json(
+    content: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+) -> FastJSONResponse:
+    """
+    라우트에서 바로 반환하는 JSON 응답
+    Response를 반환하면 FastAPI가 response_model 검증 + jsonable_encoder를 건너뜀
+    -> DB에서 읽은 값처럼 이미 형식이 맞는 dict에만 사용 (response_model은 문서용으로 남겨 둠)
+    response: 라우트가 주입받은 임시 Response (ETag, X-Next-Cursor 등 헤더를 옮겨 담음)
+    """
+    out = FastJSONResponse(content, status_code=status_code)
+    if response is not None:
+        if response.status_code:
+            out.status_code = response.status_code
+        out.raw_headers.extend(
+            (key, value) for key, value in response.raw_headers if key not in _BODY_HEADERS
+        )
+    return out
+
+
+def rows_to_dicts(rows: Iterable[Any], schema: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """
+    ORM 객체 / Row -> schema 필드만 담은 dict (model_validate 없이)
+    필드 이름이 컬럼 속성과 같고 alias / validator가 없는 Out 스키마에만 사용
+    """
+    fields = tuple(schema.model_fields)
+    out: List[Dict[str, Any]] = []
+    for row in rows:
+        if isinstance(row, Row) and row._fields == fields:
+            # DAL의 *_rows 조회 (컬럼을 스키마 필드 순서대로 뽑음) -> 속성 조회 없이 바로 dict
+            out.append(dict(zip(fields, row)))
+        else:
+            out.append({name: getattr(row, name) for name in fields})
+    return out
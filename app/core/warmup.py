@@ -0,0 +1,108 @@
+# app/core/warmup.py
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Set
+
+from sqlalchemy.orm import configure_mappers
+
+from app.core.config import settings
+from app.core.database import engine, replica_engine
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# 마지막 warm-up 결과 (GET /v1/metrics 의 collectors["startup"])
+_last_result: Dict[str, Any] = {}
+# 백그라운드 warm-up 작업 (GC로 취소되지 않도록 참조 유지)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _warm_db_pool(db_engine, connections: int) -> int:
+    """
+    풀에 커넥션을 미리 만들어 둠 (첫 요청들이 연결 수립 비용을 내지 않도록)
+    DB에 연결할 수 없어도 앱은 뜨고, 요청이 들어올 때 다시 연결을 시도함
+    """
+    opened = []
+    try:
+        for _ in range(connections):
+            conn = db_engine.connect()
+            opened.append(conn)
+            conn.exec_driver_sql("SELECT 1")
+        return len(opened)
+    except Exception as e:
+        logger.warning("DB pool warm-up failed after %d connections: %r", len(opened), e)
+        metrics.inc("startup.warmup.db_errors")
+        return len(opened)
+    finally:
+        for conn in opened:
+            conn.close()
+
+
+def _warm_catalog() -> None:
+    # 모델 매퍼 설정(관계/컬럼 컴파일)과 점수 산식 등록을 첫 요청 전에 끝냄
+    from app.services.score_formulas import get_formula
+
+    configure_mappers()
+    get_formula()
+
+
+def _warm_openai_client() -> None:
+    from app.core.ai_client import get_openai_client
+
+    started = time.perf_counter()
+    try:
+        get_openai_client()
+    except Exception as e:
+        logger.warning("OpenAI client warm-up failed: %r", e)
+        return
+    _last_result["openai_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+
+def _warm_http_clients() -> None:
+    from app.core.kakao_client import get_kakao_http_client
+
+    get_kakao_http_client()
+    if settings.OPENAI_API_KEY:
+        # openai SDK import(수백 ms)는 startup을 막지 않도록 스레드에서 (첫 스캔 요청 전에 끝나 있도록)
+        task = asyncio.create_task(asyncio.to_thread(_warm_openai_client))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+async def warm_up() -> Dict[str, Any]:
+    """
+    앱 startup에서 호출. 단계별 소요 시간(ms)을 기록하고 metrics collector로 노출
+    """
+    result: Dict[str, Any] = {}
+    started = time.perf_counter()
+
+    step = time.perf_counter()
+    result["db_connections"] = await asyncio.to_thread(
+        _warm_db_pool, engine, settings.STARTUP_WARMUP_DB_CONNECTIONS
+    )
+    if replica_engine is not None:
+        result["replica_connections"] = await asyncio.to_thread(
+            _warm_db_pool, replica_engine, settings.STARTUP_WARMUP_DB_CONNECTIONS
+        )
+    result["db_ms"] = round((time.perf_counter() - step) * 1000, 1)
+
+    step = time.perf_counter()
+    _warm_catalog()
+    result["catalog_ms"] = round((time.perf_counter() - step) * 1000, 1)
+
+    step = time.perf_counter()
+    _warm_http_clients()
+    result["http_clients_ms"] = round((time.perf_counter() - step) * 1000, 1)
+
+    result["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    result["finished_at"] = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+    metrics.observe("startup.warmup", result["total_ms"])
+    logger.info("startup warm-up done: %s", result)
+
+    _last_result.update(result)
+    return result
+
+
+metrics.register_collector("startup", lambda: dict(_last_result))
@@ -1,4 +1,7 @@
 # app/dependencies.py
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from pathlib import Path
@@ -9,6 +12,8 @@ from app.DAL.nutrition_DAL import NutritionDAL
 from app.DAL.ingredient_DAL import IngredientDAL
 from app.DAL.user_DAL import UserDAL
 from app.DAL.user_daily_score_DAL import UserDailyScoreDAL
+from app.DAL.user_score_rollup_DAL import UserScoreRollupDAL
+from app.DAL.user_session_DAL import UserSessionDAL
 
 from app.services.scan_history_service import ScanHistoryService
 from app.services.ingredient_service import IngredientService
@@ -20,144 +25,172 @@ from app.services.scan_flow_service import ScanFlowService
 from app.services.image_storage_service import ImageStorageService
 from app.services.ai_scan_analysis_service import AiScanAnalysisService
 from app.services.scan_get_full_service import ScanGetFullService
+from app.services.kakao_auth_service import KakaoAuthService
+from app.services.session_service import SessionService
 
 
 from app.core.database import get_db
 from app.core.ai_client import get_openai_client
+from app.core.kakao_client import get_kakao_http_client
 from app.core.config import settings
 
 
+# ---------------------------------------------------------
+# 상태 없는 구성요소: 프로세스당 하나 (lru_cache)
+# DAL은 staticmethod만 있고, 스토리지/외부 API 클라이언트는 설정값만 들고 있음
+# ---------------------------------------------------------
+@lru_cache
 def get_user_dal() -> UserDAL:
     return UserDAL()
 
+@lru_cache
 def get_ingredient_dal() -> IngredientDAL:
     return IngredientDAL()
 
+@lru_cache
 def get_user_daily_score_dal() -> UserDailyScoreDAL:
     return UserDailyScoreDAL()
 
+@lru_cache
+def get_user_score_rollup_dal() -> UserScoreRollupDAL:
+    return UserScoreRollupDAL()
+
+@lru_cache
+def get_user_session_dal() -> UserSessionDAL:
+    return UserSessionDAL()
+
+@lru_cache
 def get_scan_history_dal() -> ScanHistoryDAL:
     return ScanHistoryDAL()
 
+@lru_cache
 def get_product_dal() -> ProductDAL:
     return ProductDAL()
 
+@lru_cache
 def get_nutrition_dal() -> NutritionDAL:
     return NutritionDAL()
 
+@lru_cache
 def get_image_storage_service() -> ImageStorageService:
     return ImageStorageService(
         base_dir=Path(settings.IMAGE_BASE_DIR),
         base_url=settings.IMAGE_BASE_URL
     )
 
-def get_nutrition_service(
-        db: Session = Depends(get_db),
-        nutrition_dal: NutritionDAL = Depends(get_nutrition_dal)
-    ) -> NutritionService:
+@lru_cache
+def get_kakao_auth_service() -> KakaoAuthService:
+    return KakaoAuthService(http_client=get_kakao_http_client())
+
+@lru_cache
+def get_ai_scan_analysis_service() -> AiScanAnalysisService:
+    # OpenAI 클라이언트가 필요해서 (OPENAI_API_KEY 없으면 실패) 실제로 분석할 때만 호출됨
+    client = get_openai_client()
+    return AiScanAnalysisService(openai_client=client)
+
+
+# ---------------------------------------------------------
+# 요청 단위 서비스 (DB 세션을 들고 있음)
+# Depends는 db 하나만 받고, 하위 서비스/DAL은 직접 조립 -> 요청당 의존성 해석(스레드풀 왕복) 횟수를 줄임
+# 같은 요청에서 get_db는 한 번만 실행되므로 모든 서비스가 같은 세션을 씀
+# ---------------------------------------------------------
+def build_nutrition_service(db: Session) -> NutritionService:
     return NutritionService(
         db = db,
-        nutrition_dal = nutrition_dal
+        nutrition_dal = get_nutrition_dal()
     )
 
 
-def get_ingredient_service(
-        db: Session = Depends(get_db),
-        ingredient_dal: IngredientDAL = Depends(get_ingredient_dal)
-    ) -> IngredientService:
+def build_ingredient_service(db: Session) -> IngredientService:
     return IngredientService(
         db=db,
-        ingredient_dal=ingredient_dal
+        ingredient_dal=get_ingredient_dal()
     )
 
-def get_product_service(
-        db: Session = Depends(get_db),
-        product_dal: ProductDAL = Depends(get_product_dal),
-        nutrition_dal: NutritionDAL = Depends(get_nutrition_dal),
-        ingredient_dal: IngredientDAL = Depends(get_ingredient_dal),
-        image_storage: ImageStorageService = Depends(get_image_storage_service)
-) -> ProductService:
-    return ProductService(db, product_dal, nutrition_dal, ingredient_dal, image_storage)
-
-
-def get_user_daily_score_service(
-        db: Session = Depends(get_db),
-        uds_dal: UserDailyScoreDAL = Depends(get_user_daily_score_dal),
-        scan_history_dal: ScanHistoryDAL = Depends(get_scan_history_dal),
-) -> UserDailyScoreService:
+
+def build_product_service(db: Session) -> ProductService:
+    return ProductService(
+        db,
+        get_product_dal(),
+        get_nutrition_dal(),
+        get_ingredient_dal(),
+        get_image_storage_service(),
+    )
+
+
+def build_user_daily_score_service(db: Session) -> UserDailyScoreService:
     return UserDailyScoreService(
         db=db,
-        user_daily_score_dal=uds_dal,
-        scan_history_dal=scan_history_dal
+        user_daily_score_dal=get_user_daily_score_dal(),
+        scan_history_dal=get_scan_history_dal(),
+        user_score_rollup_dal=get_user_score_rollup_dal(),
     )
 
 
+def build_scan_history_service(db: Session, product_service: Optional[ProductService] = None) -> ScanHistoryService:
+    return ScanHistoryService(
+        db = db,
+        user_dal = get_user_dal(),
+        product_dal = get_product_dal(),
+        nutrition_dal = get_nutrition_dal(),
+        ingredient_dal = get_ingredient_dal(),
+        scan_history_dal = get_scan_history_dal(),
+        user_daily_score_dal = get_user_daily_score_dal(),
+        product_service = product_service or build_product_service(db),
+        # 조회 API에서는 만들지 않음 (스캔 분석할 때 처음 만들어짐)
+        ai_service_factory = get_ai_scan_analysis_service,
+        image_storage = get_image_storage_service()
+    )
 
-def get_ai_scan_analysis_service():
-    client = get_openai_client()
-    return AiScanAnalysisService(openai_client=client)
 
+def get_nutrition_service(db: Session = Depends(get_db)) -> NutritionService:
+    return build_nutrition_service(db)
 
-def get_scan_history_service(
-    db: Session = Depends(get_db),
-    user_dal: UserDAL = Depends(get_user_dal),
-    product_dal: ProductDAL = Depends(get_product_dal),
-    nutrition_dal: NutritionDAL = Depends(get_nutrition_dal),
-    ingredient_dal: IngredientDAL = Depends(get_ingredient_dal),
-    scan_history_dal: ScanHistoryDAL = Depends(get_scan_history_dal),
-    product_service: ProductService = Depends(get_product_service),
-    ai_service: AiScanAnalysisService = Depends(get_ai_scan_analysis_service),
-    image_storage: ImageStorageService = Depends(get_image_storage_service),
-) -> ScanHistoryService:
-    return ScanHistoryService(
-        db = db,
-        user_dal = user_dal,
-        product_dal =  product_dal,
-        nutrition_dal = nutrition_dal,
-        ingredient_dal = ingredient_dal, 
-        scan_history_dal = scan_history_dal,
-        product_service = product_service,
-        ai_service = ai_service,
-        image_storage = image_storage
+
+def get_ingredient_service(db: Session = Depends(get_db)) -> IngredientService:
+    return build_ingredient_service(db)
+
+
+def get_product_service(db: Session = Depends(get_db)) -> ProductService:
+    return build_product_service(db)
+
+
+def get_user_daily_score_service(db: Session = Depends(get_db)) -> UserDailyScoreService:
+    return build_user_daily_score_service(db)
+
+
+def get_session_service(db: Session = Depends(get_db)) -> SessionService:
+    return SessionService(
+        db=db,
+        user_session_dal=get_user_session_dal(),
     )
 
-def get_scan_get_full_service(
-    db: Session = Depends(get_db),
-    scan_history_dal: ScanHistoryDAL = Depends(get_scan_history_dal),
-    product_dal: ProductDAL = Depends(get_product_dal),
-    nutrition_dal: NutritionDAL = Depends(get_nutrition_dal),
-    ingredient_dal: IngredientDAL = Depends(get_ingredient_dal),
-    scan_history_service: ScanHistoryService = Depends(get_scan_history_service)
-) -> ScanGetFullService:
+
+def get_scan_history_service(db: Session = Depends(get_db)) -> ScanHistoryService:
+    return build_scan_history_service(db)
+
+
+def get_scan_get_full_service(db: Session = Depends(get_db)) -> ScanGetFullService:
     return ScanGetFullService(
         db=db,
-        scan_history_dal=scan_history_dal,
-        product_dal=product_dal,
-        nutrition_dal=nutrition_dal,
-        ingredient_dal=ingredient_dal,
-        scan_history_service=scan_history_service
+        scan_history_dal=get_scan_history_dal(),
+        product_dal=get_product_dal(),
+        nutrition_dal=get_nutrition_dal(),
+        ingredient_dal=get_ingredient_dal(),
+        scan_history_service=build_scan_history_service(db)
     )
 
-def get_user_service(
-    db: Session = Depends(get_db),
-    user_dal: UserDAL = Depends(get_user_dal),
-    user_daily_score_dal: UserDailyScoreDAL = Depends(get_user_daily_score_dal),
-) -> UserService:
-    return UserService(db, user_dal, user_daily_score_dal)
-
-
-def get_scan_flow_service(
-    scan_history_service: ScanHistoryService = Depends(get_scan_history_service),
-    nutrition_service: NutritionService = Depends(get_nutrition_service),
-    ingredient_service: IngredientService = Depends(get_ingredient_service),
-    product_service: ProductService = Depends(get_product_service),
-    user_daily_score_service: UserDailyScoreService = Depends(get_user_daily_score_service),
-) -> ScanFlowService:
+
+def get_user_service(db: Session = Depends(get_db)) -> UserService:
+    return UserService(db, get_user_dal(), get_user_daily_score_dal())
+
+
+def get_scan_flow_service(db: Session = Depends(get_db)) -> ScanFlowService:
+    product_service = build_product_service(db)
     return ScanFlowService(
-        scan_history_service=scan_history_service,
+        scan_history_service=build_scan_history_service(db, product_service),
         product_service=product_service,
-        nutrition_service=nutrition_service,
-        ingredient_service=ingredient_service,
-        user_daily_score_service=user_daily_score_service,
+        nutrition_service=build_nutrition_service(db),
+        ingredient_service=build_ingredient_service(db),
+        user_daily_score_service=build_user_daily_score_service(db),
     )
-
@@ -20,13 +20,21 @@ from app.routers import (
     auth_router,
     auth_user_router,
     home_router,
+    metrics_router,
 )
 
-from app.core.database import Base, engine
-Base.metadata.create_all(bind=engine)
+from app.core.config import settings
+from app.core.kakao_client import close_kakao_http_client
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.warmup import warm_up
+from app.services.score_recompute_worker import score_recompute_worker
+# 테이블 생성은 앱 시작에서 하지 않음 -> python init_db.py (운영 MySQL은 sql/*.mysql.sql)
 
 app = FastAPI(title="HealthyScanner Backend", version="0.1.0")
 
+# 요청별 SQL 수 / DB 시간 집계 (QUERY_STATS_HEADERS=true면 응답 헤더로도 내려줌)
+app.add_middleware(QueryStatsMiddleware)
+
 
 app.include_router(user_router.router)
 app.include_router(product_router.router)
@@ -40,6 +48,33 @@ app.include_router(auth_router.router)
 app.include_router(auth_user_router.router)
 app.include_router(scan_flow_router.router)
 app.include_router(home_router.router)
+# 프로세스 내부 지표라 명시적으로 켰을 때만 노출 (METRICS_ENDPOINT_ENABLED)
+if settings.METRICS_ENDPOINT_ENABLED:
+    app.include_router(metrics_router.router)
+
+
+@app.on_event("startup")
+async def warm_up_resources():
+    # DB 풀 / 모델 매퍼 / HTTP 클라이언트를 첫 요청 전에 준비 (DB가 안 떠 있어도 앱은 뜸)
+    if settings.STARTUP_WARMUP_ENABLED:
+        await warm_up()
+
+
+@app.on_event("startup")
+async def start_score_worker():
+    # dirty 점수를 미리 재계산해서 홈 진입 시 재계산을 피함
+    if settings.SCORE_WORKER_ENABLED:
+        score_recompute_worker.start()
+
+
+@app.on_event("shutdown")
+async def stop_score_worker():
+    await score_recompute_worker.stop()
+
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    await close_kakao_http_client()
 
 
 
@@ -53,6 +88,8 @@ def root():
 #사진 가져오는 메서드
 
 BASE_DIR = Path(__file__).resolve().parent.parent
+# 새로 받은 저장소(로컬 모드)에는 static 폴더가 없어서 mount가 실패함
+(BASE_DIR / "static").mkdir(exist_ok=True)
 
 app.mount(
     "/static",
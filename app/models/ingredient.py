@@ -6,6 +6,7 @@ from sqlalchemy import (
     Integer,
     DateTime,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.sql import func
 
@@ -15,6 +16,10 @@ from datetime import datetime
 
 class Ingredient(Base):
     __tablename__ = "ingredient"
+    __table_args__ = (
+        # 상품별 성분 목록 커서 페이지네이션 (order_index, created_at, id)
+        Index("ix_ingredient_product_order", "product_id", "order_index", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, index=True)
     product_id: Mapped[str] = mapped_column(
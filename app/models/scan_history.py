@@ -6,19 +6,43 @@ from sqlalchemy import (
     Boolean,
     Text,
     Integer,
+    Date,
     DateTime,
     ForeignKey,
+    Index,
 )
-from sqlalchemy.dialects.mysql import JSON as MySQLJSON
 from sqlalchemy.sql import func
-from sqlalchemy.orm import Mapped, mapped_column
-from datetime import datetime
-from typing import Any, Optional
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.ext.associationproxy import association_proxy
+from datetime import datetime, date
+from typing import Optional
 from app.core.database import Base
+from app.models.types import JSONType
+from app.models.scan_report import ScanReport
+
+# 목록/집계에서는 안 읽는 JSON 컬럼 묶음 (리포트 본문은 scan_report 테이블)
+# 상세 조회는 undefer_group(REPORT_GROUP)으로 한 번에 읽음
+REPORT_GROUP = "report"
+
+
+def _report_field(name: str):
+    # scan.report가 없을 때 값을 쓰면 scan_report row를 새로 만듦
+    return association_proxy(
+        "report",
+        name,
+        creator=lambda value: ScanReport(**{name: value}),
+    )
 
 
 class ScanHistory(Base):
     __tablename__ = "scan_history"
+    __table_args__ = (
+        # 날짜별 조회(목록/개수/점수 통계)는 전부 (user_id, local_date) 범위로 처리
+        # deleted_at은 하루치 row가 많지 않아서 인덱스에 넣지 않고 필터로만 거름
+        Index("ix_scan_history_user_local_date", "user_id", "local_date", "scanned_at"),
+        # 유저별 전체 히스토리 커서 페이지네이션 (scanned_at DESC, id DESC)
+        Index("ix_scan_history_user_scanned_id", "user_id", "scanned_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, index=True)
 
@@ -49,34 +73,51 @@ class ScanHistory(Base):
 
     scanned_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), nullable=False)
 
+    # 유저 timezone 기준 스캔 날짜 (저장 시점에 계산)
+    local_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    # local_date 안에서 몇 번째 스캔인지 (user_daily_score.scan_seq에서 발급, 1부터)
+    day_seq: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
     # ENUM('avoid','caution','ok') 를 문자열로 매핑
     decision: Mapped[str] = mapped_column(String(16), nullable=True)
 
     summary: Mapped[str] = mapped_column(String(255), nullable=True)
     ai_total_score: Mapped[int] = mapped_column(Integer, nullable=True)  # TINYINT UNSIGNED(0~255)
 
-    conditions: Mapped[list[str]] = mapped_column(MySQLJSON, nullable=True)
-    allergies: Mapped[list[str]] = mapped_column(MySQLJSON, nullable=True)
-    habits: Mapped[list[str]] = mapped_column(MySQLJSON, nullable=True)
-
-    ai_allergy_report: Mapped[str] = mapped_column(Text, nullable=True)
-    ai_condition_report: Mapped[str] = mapped_column(Text, nullable=True)
-    ai_alter_report: Mapped[str] = mapped_column(Text, nullable=True)
-    ai_vegan_report: Mapped[str] = mapped_column(Text, nullable=True)
-    ai_total_report: Mapped[str] = mapped_column(Text, nullable=True)
-    
-    ai_vegan_brief: Mapped[str] = mapped_column(Text, nullable=True)
-    ai_allergy_brief: Mapped[str] = mapped_column(Text, nullable=True)
-    ai_condition_brief: Mapped[str] = mapped_column(Text, nullable=True)
-    ai_alter_brief: Mapped[str] = mapped_column(Text, nullable=True)
-    
     product_name: Mapped[Optional[str]] = mapped_column(String(256), nullable=True)
-    product_nutrition: Mapped[Optional[dict[str, Any]]] = mapped_column(MySQLJSON, nullable=True)
-    product_ingredient: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # ---- 아래 REPORT_GROUP 컬럼은 기본으로 로드하지 않음 ----
+    conditions: Mapped[list[str]] = mapped_column(JSONType, nullable=True, deferred_group=REPORT_GROUP)
+    allergies: Mapped[list[str]] = mapped_column(JSONType, nullable=True, deferred_group=REPORT_GROUP)
+    habits: Mapped[list[str]] = mapped_column(JSONType, nullable=True, deferred_group=REPORT_GROUP)
+
+    caution_factors: Mapped[list[dict[str, str]] | None] = mapped_column(JSONType, nullable=True, deferred_group=REPORT_GROUP)
+
+    # AI 리포트 본문/상품 원문/상세 응답 JSON은 scan_report(1:1)에 저장
+    # 기존 코드는 scan.ai_total_report 처럼 그대로 읽고 쓸 수 있게 프록시로 연결
+    report: Mapped[Optional[ScanReport]] = relationship(
+        ScanReport,
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    ai_allergy_report = _report_field("ai_allergy_report")
+    ai_condition_report = _report_field("ai_condition_report")
+    ai_alter_report = _report_field("ai_alter_report")
+    ai_vegan_report = _report_field("ai_vegan_report")
+    ai_total_report = _report_field("ai_total_report")
+
+    ai_vegan_brief = _report_field("ai_vegan_brief")
+    ai_allergy_brief = _report_field("ai_allergy_brief")
+    ai_condition_brief = _report_field("ai_condition_brief")
+    ai_alter_brief = _report_field("ai_alter_brief")
 
+    product_nutrition = _report_field("product_nutrition")
+    product_ingredient = _report_field("product_ingredient")
 
-    caution_factors: Mapped[list[dict[str, str]] | None] = mapped_column(MySQLJSON, nullable=True)
+    detail_payload = _report_field("detail_payload")
+    detail_version = _report_field("detail_version")
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=False),
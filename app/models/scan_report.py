@@ -0,0 +1,76 @@
+# app/models/scan_report.py
+from sqlalchemy import String, Text, SmallInteger, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from typing import Any, Optional
+from app.core.database import Base
+from app.models.types import JSONType
+
+
+class ScanReport(Base):
+    """
+    scan_history와 1:1인 AI 리포트 본문 테이블
+    목록/개수/점수 집계는 scan_history만 읽도록 긴 텍스트를 따로 보관 (상세 조회 때만 join)
+    """
+    __tablename__ = "scan_report"
+    __table_args__ = {
+        # 텍스트 위주라 압축 효율이 좋음 (innodb_file_per_table 필요)
+        "mysql_row_format": "COMPRESSED",
+        "mysql_key_block_size": "8",
+    }
+
+    scan_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("scan_history.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    ai_allergy_report: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ai_condition_report: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ai_alter_report: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ai_vegan_report: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ai_total_report: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    ai_vegan_brief: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ai_allergy_brief: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ai_condition_brief: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    ai_alter_brief: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    product_nutrition: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONType, nullable=True)
+    product_ingredient: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # 저장 시점에 미리 만들어 둔 상세 응답(ScanDetailOut) JSON
+    # detail_version이 현재 버전과 다르면 위 ai_* 컬럼으로 다시 만듦
+    detail_payload: Mapped[Optional[dict[str, Any]]] = mapped_column(JSONType, nullable=True)
+    detail_version: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        nullable=False,
+        server_default=func.now(),
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+# scan_report로 옮긴 컬럼 (ScanHistory에서 같은 이름으로 프록시)
+REPORT_FIELDS = (
+    "ai_allergy_report",
+    "ai_condition_report",
+    "ai_alter_report",
+    "ai_vegan_report",
+    "ai_total_report",
+    "ai_vegan_brief",
+    "ai_allergy_brief",
+    "ai_condition_brief",
+    "ai_alter_brief",
+    "product_nutrition",
+    "product_ingredient",
+    "detail_payload",
+    "detail_version",
+)
@@ -0,0 +1,7 @@
+# app/models/types.py
+from sqlalchemy import JSON
+from sqlalchemy.dialects.mysql import JSON as MySQLJSON
+
+# 모델의 JSON 컬럼은 이 타입 사용
+# MySQL에서는 네이티브 JSON, SQLite(로컬 개발/벤치마크)에서는 TEXT에 JSON 문자열로 저장
+JSONType = JSON().with_variant(MySQLJSON(), "mysql")
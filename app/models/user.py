@@ -1,10 +1,11 @@
 from typing import Optional
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.dialects.mysql import JSON as MySQLJSON
 from sqlalchemy import String, Text, Integer, DateTime
 from sqlalchemy.sql import func
 from datetime import datetime
 from app.core.database import Base
+from app.models.types import JSONType
+from app.core.local_time import DEFAULT_TIMEZONE
 
 
 class User(Base):
@@ -20,9 +21,17 @@ class User(Base):
     name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     profile_image_url: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
-    habits: Mapped[Optional[list[str]]] = mapped_column(MySQLJSON, nullable=True)
-    conditions: Mapped[Optional[list[str]]] = mapped_column(MySQLJSON, nullable=True)
-    allergies: Mapped[Optional[list[str]]] = mapped_column(MySQLJSON, nullable=True)
+    habits: Mapped[Optional[list[str]]] = mapped_column(JSONType, nullable=True)
+    conditions: Mapped[Optional[list[str]]] = mapped_column(JSONType, nullable=True)
+    allergies: Mapped[Optional[list[str]]] = mapped_column(JSONType, nullable=True)
+
+    # 날짜 집계(local_date) 기준 timezone
+    timezone: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        default=DEFAULT_TIMEZONE,
+        server_default=DEFAULT_TIMEZONE,
+    )
 
     kakao_access_token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     kakao_refresh_token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
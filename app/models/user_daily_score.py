@@ -7,17 +7,22 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     SmallInteger,
+    Index,
 )
-from sqlalchemy.dialects.mysql import JSON as MySQLJSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime, date
 
 from app.core.database import Base
+from app.models.types import JSONType
 
 
 class UserDailyScore(Base):
     __tablename__ = "user_daily_score"
+    __table_args__ = (
+        # 백그라운드 재계산 워커: WHERE dirty = 1 ORDER BY updated_at
+        Index("ix_user_daily_score_dirty_updated", "dirty", "updated_at"),
+    )
 
     # 복합 PK: user_id + local_date
     user_id: Mapped[str] = mapped_column(
@@ -34,7 +39,10 @@ class UserDailyScore(Base):
 
     num_scans: Mapped[int | None] = mapped_column(Integer)
     max_severity: Mapped[str] = mapped_column(String(16), nullable=True)  # 'none' | 'info' | 'warning' | 'danger'
-    decision_counts: Mapped[list[dict[str, int]]] = mapped_column(MySQLJSON, nullable=True)
+    decision_counts: Mapped[list[dict[str, int]]] = mapped_column(JSONType, nullable=True)
+
+    # 그날 마지막으로 발급한 스캔 순번 (scan_history.day_seq)
+    scan_seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     formula_version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     dirty: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
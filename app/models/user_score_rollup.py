@@ -0,0 +1,66 @@
+# app/models/user_score_rollup.py
+from sqlalchemy import String, Integer, SmallInteger, Date, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime, date
+from typing import Optional
+
+from app.core.database import Base
+from app.models.types import JSONType
+
+
+class UserWeeklyScore(Base):
+    """
+    user_daily_score의 주간 집계 (월요일 시작)
+    스캔 수 / 판정 개수는 변화량만 더하고 (UserScoreRollupDAL.apply_delta)
+    점수가 바뀐 날만 해당 주를 다시 집계 (UserScoreRollupDAL.refresh)
+    """
+    __tablename__ = "user_weekly_score"
+
+    user_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    week_start: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    # 점수가 계산된 날(score >= 0, dirty 아님)의 평균, 그런 날이 없으면 -1
+    score: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=-1)
+    score_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    scored_days: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+    num_scans: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    decision_counts: Mapped[Optional[dict[str, int]]] = mapped_column(JSONType, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+class UserMonthlyScore(Base):
+    """
+    user_daily_score의 월간 집계 (매월 1일 기준)
+    """
+    __tablename__ = "user_monthly_score"
+
+    user_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    month_start: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    score: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=-1)
+    score_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    scored_days: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+    num_scans: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    decision_counts: Mapped[Optional[dict[str, int]]] = mapped_column(JSONType, nullable=True)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
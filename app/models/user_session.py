@@ -0,0 +1,47 @@
+# app/models/user_session.py
+from sqlalchemy import String, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from typing import Optional
+
+from app.core.database import Base
+
+
+class UserSession(Base):
+    """
+    기기별 로그인 세션 (앱 refresh token)
+    토큰 원문은 저장하지 않고 SHA-256 hex만 저장. 갱신(rotation) 때마다 token_hash가 바뀌고 id는 유지
+    """
+    __tablename__ = "user_session"
+    __table_args__ = (
+        # 같은 토큰이 두 세션에 들어가지 않게
+        Index("ux_user_session_token_hash", "token_hash", unique=True),
+        # refresh 조회: WHERE token_hash = ? -> (user_id, expires_at, id(PK))까지 인덱스만으로 처리
+        Index("ix_user_session_token", "token_hash", "user_id", "expires_at"),
+        # 동시 갱신 유예: 직전 토큰으로 들어온 요청
+        Index("ix_user_session_previous_token", "previous_token_hash"),
+        # 유저 전체 로그아웃
+        Index("ix_user_session_user", "user_id"),
+        # 만료 세션 정리 (purge_sessions.py)
+        Index("ix_user_session_expires", "expires_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    user_id: Mapped[str] = mapped_column(
+        String(50),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    previous_token_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=False), nullable=False)
+    rotated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=False), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=False),
+        nullable=False,
+        server_default=func.now(),
+    )
@@ -11,3 +11,4 @@ from . import auth_router
 from . import auth_user_router
 from . import scan_flow_router
 from . import home_router
+from . import metrics_router
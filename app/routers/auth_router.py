@@ -4,10 +4,24 @@ from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from uuid import uuid4
 from app.core.database import get_db
+from app.dependencies import get_kakao_auth_service, get_session_service
+from app.services.kakao_auth_service import (
+    KakaoAuthService,
+    KakaoAPIError,
+    KakaoUnavailableError,
+)
+from app.services.session_service import SessionService
 from app.models.user import User
-from app.core.auth import create_access_token, get_current_user, create_app_refresh_token
+from app.core.auth import (
+    Principal,
+    create_access_token,
+    get_current_db_user,
+    get_current_user,
+    get_session_id,
+    invalidate_principal,
+)
 from fastapi import Request
-import requests
+from starlette.concurrency import run_in_threadpool
 import os
 from datetime import datetime
 from dotenv import load_dotenv
@@ -57,10 +71,12 @@ def kakao_login(platform: str = Query("ios")):
 # 2️⃣ Kakao Callback + App Token Issuance
 # ---------------------------------------------------------
 @router.get("/auth/kakao/callback")
-def kakao_callback(
+async def kakao_callback(
     code: str,
     state: str = Query("ios"),
     db: Session = Depends(get_db),
+    kakao: KakaoAuthService = Depends(get_kakao_auth_service),
+    sessions: SessionService = Depends(get_session_service),
 ):
     # 플랫폼별 redirect_uri
     if state == "android":
@@ -71,38 +87,32 @@ def kakao_callback(
         redirect_uri = KAKAO_REDIRECT_URI_IOS
 
     # -------------------------------------------------
-    # Step 1) Kakao Access Token 요청
+    # Step 1~2) Kakao Access Token 요청 + User Info (공용 커넥션 풀, 이벤트 루프를 막지 않음)
     # -------------------------------------------------
-    token_res = requests.post(
-        "https://kauth.kakao.com/oauth/token",
-        data={
-            "grant_type": "authorization_code",
-            "client_id": KAKAO_CLIENT_ID,
-            "redirect_uri": redirect_uri,
-            "code": code,
-        },
-    ).json()
-
-    kakao_access_token = token_res.get("access_token")
-    if not kakao_access_token:
+    try:
+        kakao_login = await kakao.login(
+            client_id=KAKAO_CLIENT_ID, redirect_uri=redirect_uri, code=code
+        )
+    except KakaoAPIError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to get Kakao access token",
         )
+    except KakaoUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Kakao API unavailable",
+        )
+
+    token_res = kakao_login["token"]
+    user_info = kakao_login["user_info"]
 
+    kakao_access_token = token_res.get("access_token")
     kakao_refresh_token = token_res.get("refresh_token")
     token_type = token_res.get("token_type")
     expires_in = token_res.get("expires_in")
     refresh_expires_in = token_res.get("refresh_token_expires_in")
 
-    # -------------------------------------------------
-    # Step 2) Kakao User Info
-    # -------------------------------------------------
-    user_info = requests.get(
-        "https://kapi.kakao.com/v2/user/me",
-        headers={"Authorization": f"Bearer {kakao_access_token}"},
-    ).json()
-
     kakao_user_id = str(user_info.get("id"))
     nickname = (
         user_info.get("kakao_account", {})
@@ -116,37 +126,44 @@ def kakao_callback(
     )
 
     # -------------------------------------------------
-    # Step 3) User Upsert
-    # -------------------------------------------------
-    user = db.query(User).filter(User.kakao_user_id == kakao_user_id, User.deleted_at.is_(None),).first()
-
-    if not user:
-        user = User(
-            id=str(uuid4()),
-            kakao_user_id=kakao_user_id,
-            name=nickname,
-            profile_image_url=profile_image,
-            created_at=datetime.utcnow(),
-        )
-        db.add(user)
-
-    # Kakao token 저장
-    user.access_token = kakao_access_token
-    user.refresh_token = kakao_refresh_token
-    user.token_type = token_type
-    user.expires_in = expires_in
-    user.refresh_expires_in = refresh_expires_in
-
-    # -------------------------------------------------
-    # 🔐 App Token Issuance
+    # Step 3) User Upsert + App Token Issuance (DB 작업은 threadpool에서)
     # -------------------------------------------------
-    app_access_token = create_access_token(user.id)
-    app_refresh_token = create_app_refresh_token()
-
-    user.app_refresh_token = app_refresh_token
-
-    db.commit()
-    db.refresh(user)
+    def _upsert_user_and_issue_tokens():
+        user = db.query(User).filter(User.kakao_user_id == kakao_user_id, User.deleted_at.is_(None),).first()
+
+        if not user:
+            user = User(
+                id=str(uuid4()),
+                kakao_user_id=kakao_user_id,
+                name=nickname,
+                profile_image_url=profile_image,
+                created_at=datetime.utcnow(),
+            )
+            db.add(user)
+
+        # Kakao token 저장
+        user.access_token = kakao_access_token
+        user.refresh_token = kakao_refresh_token
+        user.token_type = token_type
+        user.expires_in = expires_in
+        user.refresh_expires_in = refresh_expires_in
+
+        # -------------------------------------------------
+        # 🔐 App Token Issuance (기기별 세션, refresh token은 해시만 저장)
+        # -------------------------------------------------
+        db.flush()
+        issued = sessions.issue(user.id)
+        app_access_token = create_access_token(user.id, session_id=issued.session_id)
+
+        # 예전 방식(user 컬럼)의 refresh token은 더 이상 쓰지 않음
+        user.app_refresh_token = None
+
+        db.commit()
+        return user.id, app_access_token, issued.refresh_token
+
+    user_id, app_access_token, app_refresh_token = await run_in_threadpool(
+        _upsert_user_and_issue_tokens
+    )
 
     # -------------------------------------------------
     # ✅ Redirect + Cookie (여기가 핵심)
@@ -162,7 +179,7 @@ def kakao_callback(
       "expires_in": expires_in,
       "refresh_expires_in": refresh_expires_in,
       "kakao_user_id" : kakao_user_id,
-      "user_id": user.id,
+      "user_id": user_id,
     })
 
     
@@ -173,7 +190,7 @@ def kakao_callback(
 # 3️⃣ Get Current User
 # ---------------------------------------------------------
 @router.get("/auth/me")
-def get_me(user: User = Depends(get_current_user)):
+def get_me(user: Principal = Depends(get_current_user)):
     return {
         "id": user.id,
         "name": user.name,
@@ -188,16 +205,25 @@ def get_me(user: User = Depends(get_current_user)):
 def logout(
     request: Request,
     db: Session = Depends(get_db),
+    sessions: SessionService = Depends(get_session_service),
 ):
     token = request.headers.get("Authorization")
     if not token:
         return {"message": "Already logged out.(No Token Found)"}
 
     try:
-        user = get_current_user(request, db=db)
+        # 토큰 필드를 지워야 해서 캐시가 아닌 DB row로 조회
+        user = get_current_db_user(request, creds=None, db=db)
     except Exception:
         return {"message": "already logged out"}
 
+    # 이 기기 세션만 종료. sid 없는 예전 토큰이면 모든 기기 세션 종료
+    session_id = get_session_id(request)
+    if session_id:
+        sessions.user_session_dal.delete(db, session_id)
+    else:
+        sessions.user_session_dal.delete_for_user(db, user.id)
+
     user.app_refresh_token = None
     user.access_token = None
     user.refresh_token = None
@@ -205,6 +231,7 @@ def logout(
     user.expires_in = None
     user.refresh_expires_in = None
     db.commit()
+    invalidate_principal(user.id)
 
     return {"message": "logout 성공!"}
 
@@ -213,9 +240,10 @@ def logout(
 # 5️⃣ Unlink Kakao Account
 # ---------------------------------------------------------
 @router.delete("/auth/unlink")
-def unlink_account(
-    user: User = Depends(get_current_user),
+async def unlink_account(
+    user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
+    kakao: KakaoAuthService = Depends(get_kakao_auth_service),
 ):
     KAKAO_ADMIN_KEY = os.getenv("KAKAO_ADMIN_KEY")
     if not KAKAO_ADMIN_KEY:
@@ -224,40 +252,42 @@ def unlink_account(
             detail="KAKAO_ADMIN_KEY not configured",
         )
 
-    kakao_res = requests.post(
-        "https://kapi.kakao.com/v1/user/unlink",
-        headers={
-            "Authorization": f"KakaoAK {KAKAO_ADMIN_KEY}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        },
-        data={
-            "target_id_type": "user_id",
-            "target_id": user.kakao_user_id,  # 카카오 user_id
-        },
-        timeout=5,
-    )
-
-    if kakao_res.status_code != 200:
+    try:
+        await kakao.unlink(admin_key=KAKAO_ADMIN_KEY, kakao_user_id=user.kakao_user_id)  # 카카오 user_id
+    except KakaoAPIError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Failed to unlink Kakao account",
         )
+    except KakaoUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Kakao API unavailable",
+        )
 
-    db.execute(
-        text("DELETE FROM user_daily_score WHERE user_id = :uid"),
-        {"uid": user.id},
-    )
-    db.execute(
-        text("DELETE FROM scan_history WHERE user_id = :uid"),
-        {"uid": user.id},
-    )
+    def _delete_user_data():
+        db.execute(
+            text("DELETE FROM user_session WHERE user_id = :uid"),
+            {"uid": user.id},
+        )
+        db.execute(
+            text("DELETE FROM user_daily_score WHERE user_id = :uid"),
+            {"uid": user.id},
+        )
+        db.execute(
+            text("DELETE FROM scan_history WHERE user_id = :uid"),
+            {"uid": user.id},
+        )
     
-    db.execute(
-        text("DELETE FROM user WHERE id = :uid"),
-        {"uid": user.id},
-    )
+        db.execute(
+            text("DELETE FROM user WHERE id = :uid"),
+            {"uid": user.id},
+        )
 
-    db.commit()
+        db.commit()
+        invalidate_principal(user.id)
+
+    await run_in_threadpool(_delete_user_data)
     return {"message": "account unlinked"}
 
 
@@ -274,26 +304,21 @@ class RefreshTokenRequest(BaseModel):
 @router.post("/v1/auth/refresh")
 def refresh_access_token(
     body: RefreshTokenRequest,
-    db: Session = Depends(get_db),
+    sessions: SessionService = Depends(get_session_service),
 ):
-    refresh_token = body.app_refresh_token
-
-    # 🔍 Refresh Token으로 사용자 조회
-    user = (
-        db.query(User)
-        .filter(User.app_refresh_token == refresh_token)
-        .first()
-    )
+    # 🔍 Refresh Token 해시로 세션 조회 + 새 Refresh Token으로 교체 (rotation)
+    issued = sessions.refresh(body.app_refresh_token)
 
-    if not user:
+    if issued is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
         )
 
     # 🔐 새 Access Token 발급
-    new_access_token = create_access_token(user.id)
+    new_access_token = create_access_token(issued.user_id, session_id=issued.session_id)
 
     return {
-        "app_access_token": new_access_token
+        "app_access_token": new_access_token,
+        "app_refresh_token": issued.refresh_token,
     }
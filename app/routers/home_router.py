@@ -11,6 +11,8 @@ from app.dependencies import (
 )
 
 from app.core.auth import get_current_user
+from app.core.metrics import metrics
+from app.core.responses import FastJSONResponse
 
 from app.services.home_service import HomeService
 from app.services.user_daily_score_service import UserDailyScoreService
@@ -40,4 +42,5 @@ def get_home(
         scan_history_dal=scan_history_dal,
         
     )
-    return service.get_home(user_id=current_user.id)
+    with metrics.timer("http.home"):
+        return FastJSONResponse(service.get_home(user_id=current_user.id, tz_name=current_user.timezone))
@@ -1,10 +1,11 @@
 # app/routers/ingredient_router.py
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.pagination import set_next_cursor
 from app.DAL.ingredient_DAL import IngredientDAL
 from app.schemas.ingredient import IngredientCreate, IngredientUpdate, IngredientOut, IngredientDetailOut, IngredientText
 
@@ -46,14 +47,17 @@ def get_ingredient(
     response_model=List[IngredientOut],
 )
 def list_ingredients(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     product_id: Optional[str] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
     db: Session = Depends(get_db),
 ):
     ingredients = IngredientDAL.list(
-        db, skip=skip, limit=limit, product_id=product_id
+        db, skip=skip, limit=limit, product_id=product_id, cursor=cursor
     )
+    set_next_cursor(response, ingredients, limit, IngredientDAL.LIST_ORDER)
     return ingredients
 
 
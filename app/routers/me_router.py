@@ -3,10 +3,9 @@ from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from app.models.user import User 
 
 from app.core.database import get_db
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_user
 from app.schemas.user import (
     MyPageHabitIn,
     MyPageHabitOut,
@@ -34,7 +33,7 @@ router = APIRouter(
 def update_habits(
     habit_in: MyPageHabitIn,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_dal: UserDAL = Depends(get_user_dal),
     usd_dal: UserDailyScoreDAL = Depends(get_user_daily_score_dal)
 ) -> MyPageHabitOut:
@@ -51,7 +50,7 @@ def update_habits(
 def update_conditions(
     condition_in: MyPageConditionIn,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_dal: UserDAL = Depends(get_user_dal),
     usd_dal: UserDailyScoreDAL = Depends(get_user_daily_score_dal)
 ) -> MyPageConditionOut:
@@ -68,7 +67,7 @@ def update_conditions(
 def update_allergies(
     allergies_in: MyPageAllergiesIn,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_dal: UserDAL = Depends(get_user_dal),
     usd_dal: UserDailyScoreDAL = Depends(get_user_daily_score_dal)
 ) -> MyPageAllergiesOut:
@@ -0,0 +1,19 @@
+# app/routers/metrics_router.py
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from app.core.metrics import metrics
+
+router = APIRouter(
+    prefix="/v1/metrics",
+    tags=["metrics"],
+)
+
+
+# 캐시 적중률, 엔드포인트 지연시간(p50/p99) 등 프로세스 내 지표
+# 워커마다 따로 집계됨
+# 인증이 없으므로 settings.METRICS_ENDPOINT_ENABLED일 때만 app에 등록 (app/main.py)
+@router.get("")
+def get_metrics() -> Dict[str, Any]:
+    return metrics.snapshot()
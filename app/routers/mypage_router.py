@@ -3,10 +3,9 @@ from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from app.models.user import User 
 
 from app.core.database import get_db
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_user
 from app.schemas.user import MyPageOut
 from app.services.user_service import UserService
 
@@ -28,7 +27,7 @@ router = APIRouter(
 )
 def get_my_page(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     user_dal: UserDAL = Depends(get_user_dal),
     usd_dal: UserDailyScoreDAL = Depends(get_user_daily_score_dal)
 ):
@@ -1,10 +1,11 @@
 # app/routers/nutrition_router.py
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.pagination import set_next_cursor
 from app.DAL.nutrition_DAL import NutritionDAL
 from app.schemas.nutrition import NutritionCreate, NutritionUpdate, NutritionOut, NutritionDetailOut
 
@@ -46,14 +47,17 @@ def get_nutrition(
     response_model=List[NutritionOut],
 )
 def list_nutrition(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     product_id: Optional[str] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
     db: Session = Depends(get_db),
 ):
     nutritions = NutritionDAL.list(
-        db, skip=skip, limit=limit, product_id=product_id
+        db, skip=skip, limit=limit, product_id=product_id, cursor=cursor
     )
+    set_next_cursor(response, nutritions, limit, NutritionDAL.LIST_ORDER)
     return nutritions
 
 
@@ -1,10 +1,20 @@
 # app/routers/product_router.py
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.http_cache import (
+    build_etag,
+    is_not_modified,
+    not_modified_response,
+    public_max_age,
+    set_cache_headers,
+)
+from app.core.pagination import set_next_cursor
+from app.core.responses import fast_json, rows_to_dicts
 from app.DAL.product_DAL import ProductDAL
 from app.schemas.product import ProductCreate, ProductUpdate, ProductOut, ProductSimpleOut
 from app.services.product_service import ProductService
@@ -34,12 +44,26 @@ def create_product(
 )
 def get_product(
     product_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ) -> ProductSimpleOut:
-    product = ProductDAL.get(db, product_id)
+    # updated_at만 먼저 보고 안 바뀌었으면 304
+    updated_at = ProductDAL.get_updated_at(db, product_id)
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    etag = build_etag("product", product_id, updated_at)
+    cache_control = public_max_age(settings.PRODUCT_CACHE_MAX_AGE_SECONDS)
+    if is_not_modified(request, etag, updated_at):
+        return not_modified_response(etag, updated_at, cache_control)
+
+    product = ProductDAL.get_simple_row(db, product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+
+    set_cache_headers(response, etag, updated_at, cache_control)
+    return fast_json(rows_to_dicts([product], ProductSimpleOut)[0], response)
 
 
 @router.get(
@@ -47,12 +71,16 @@ def get_product(
     response_model=List[ProductOut],
 )
 def list_products(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(default=None),
     db: Session = Depends(get_db),
 ):
-    products = ProductDAL.list(db, skip=skip, limit=limit)
-    return products
+    # cursor가 있으면 skip은 무시 (X-Next-Cursor 헤더 값을 그대로 넘기면 다음 페이지)
+    products = ProductDAL.list_rows(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, products, limit, ProductDAL.LIST_ORDER)
+    return fast_json(rows_to_dicts(products, ProductOut), response)
 
 
 @router.patch(
@@ -2,15 +2,23 @@
 from typing import List, Optional
 from datetime import datetime, date
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.DAL.scan_history_DAL import ScanHistoryDAL
-from app.models.user import User
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_user
+from app.core.http_cache import (
+    PRIVATE_REVALIDATE,
+    is_not_modified,
+    not_modified_response,
+    set_cache_headers,
+)
+from app.core.pagination import set_next_cursor
+from app.core.responses import fast_json, rows_to_dicts
 
 from app.services.scan_history_service import ScanHistoryService
+from app.services.home_service import HomeService
 from app.services.scan_get_full_service import ScanGetFullService
 from app.dependencies import get_scan_get_full_service, get_scan_history_service
 
@@ -45,6 +53,7 @@ def create_scan_history(
     db: Session = Depends(get_db),
 ):
     scan = ScanHistoryDAL.create(db, sh_in)
+    HomeService.invalidate(scan.user_id)
     return scan
 
 
@@ -55,10 +64,19 @@ def create_scan_history(
 )
 def get_scan_detail(
     scan_id: str,
+    request: Request,
+    response: Response,
     scan_service: ScanHistoryService = Depends(get_scan_history_service)
 ):
     service = scan_service
-    return service.get_scan_detail(scan_id)
+
+    # 상세 응답을 만들기 전에 updated_at으로 304 판정
+    etag, last_modified = service.get_scan_detail_validators(scan_id)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified, PRIVATE_REVALIDATE)
+
+    set_cache_headers(response, etag, last_modified, PRIVATE_REVALIDATE)
+    return fast_json(service.get_scan_detail(scan_id), response)
 
 
 @router.get(
@@ -66,20 +84,24 @@ def get_scan_detail(
     response_model=List[ScanHistoryOut],
 )
 def list_scan_history(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     user_id: Optional[str] = Query(default=None),
     product_id: Optional[str] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
     db: Session = Depends(get_db),
 ):
-    scans = ScanHistoryDAL.list(
+    scans = ScanHistoryDAL.list_rows(
         db,
         skip=skip,
         limit=limit,
         user_id=user_id,
         product_id=product_id,
+        cursor=cursor,
     )
-    return scans
+    set_next_cursor(response, scans, limit, ScanHistoryDAL.LIST_ORDER)
+    return fast_json(rows_to_dicts(scans, ScanHistoryOut), response)
 
 """
 @router.patch(
@@ -120,9 +142,15 @@ def delete_scan_history(
     scan_id: str,
     db: Session = Depends(get_db),
 ):
+    # 홈 캐시를 지우려면 user_id가 필요해서 먼저 조회
+    scan = ScanHistoryDAL.get(db, scan_id)
+    if not scan:
+        raise HTTPException(status_code=404, detail="Scan history not found")
+
     ok = ScanHistoryDAL.soft_delete(db, scan_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Scan history not found")
+    HomeService.invalidate(scan.user_id)
     return
 
 @router.get(
@@ -131,10 +159,18 @@ def delete_scan_history(
 )
 def get_full_scan_history(
     scan_id: str,
+    request: Request,
+    response: Response,
     scan_get_full_service: ScanGetFullService = Depends(get_scan_get_full_service)
 ) -> ScanFullOut:
     service = scan_get_full_service
-    return service.get_full_scan(scan_id)
+
+    etag, last_modified = service.get_full_scan_validators(scan_id)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified, PRIVATE_REVALIDATE)
+
+    set_cache_headers(response, etag, last_modified, PRIVATE_REVALIDATE)
+    return fast_json(service.get_full_scan(scan_id), response)
 
 @router.get(
     "",
@@ -142,13 +178,15 @@ def get_full_scan_history(
 )
 async def get_scan_list(
     date: datetime,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     service: ScanHistoryService = Depends(get_scan_history_service),
 ):
     """
     특정 날짜(date)의 스캔 기록 목록 조회
     """
-    return await service.get_scan_list_by_date(
-        user_id=current_user.id,
-        date=date,
+    return fast_json(
+        await service.get_scan_list_by_date(
+            user_id=current_user.id,
+            date=date,
+        )
     )
\ No newline at end of file
@@ -1,16 +1,33 @@
 # app/routers/user_daily_score_router.py
-from datetime import date
+from datetime import date, timedelta
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.auth import Principal, get_current_user
 from app.core.database import get_db
+from app.core.pagination import set_next_cursor
+from app.core.local_time import local_today
+from app.core.http_cache import (
+    PRIVATE_REVALIDATE,
+    build_etag,
+    is_not_modified,
+    not_modified_response,
+    set_cache_headers,
+)
+from app.dependencies import get_user_daily_score_service
+from app.services.user_daily_score_service import UserDailyScoreService
 from app.DAL.user_daily_score_DAL import UserDailyScoreDAL
+from app.DAL.user_score_rollup_DAL import week_start
+from app.services.home_service import HomeService
 from app.schemas.user_daily_score import (
     UserDailyScoreCreate,
     UserDailyScoreUpdate,
     UserDailyScoreOut,
+    UserDailyScoreRangeOut,
+    TrendPeriod,
+    UserScoreTrendOut,
 )
 
 router = APIRouter(
@@ -29,9 +46,129 @@ def create_user_daily_score(
     db: Session = Depends(get_db),
 ):
     uds = UserDailyScoreDAL.create(db, uds_in)
+    HomeService.invalidate(uds.user_id)
     return uds
 
 
+# 캘린더 한 번에 조회할 수 있는 최대 일수 (월 보기 + 앞뒤 주)
+MAX_RANGE_DAYS = 62
+
+
+def _range_etag(user_id: str, date_from: date, date_to: date, v) -> str:
+    return build_etag(
+        "uds-range",
+        user_id,
+        date_from,
+        date_to,
+        v.count,
+        v.updated_at,
+        v.dirty_count,
+        v.num_scans,
+    )
+
+
+# /{user_id}/{local_date} 보다 먼저 선언해야 "me"/"range"가 날짜 조회로 잡히지 않음
+@router.get(
+    "/me/range",
+    response_model=UserDailyScoreRangeOut,
+)
+def get_user_daily_score_range(
+    request: Request,
+    response: Response,
+    date_from: date = Query(...),
+    date_to: date = Query(...),
+    service: UserDailyScoreService = Depends(get_user_daily_score_service),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    날짜 구간(보통 한 달)의 일별 점수 / 스캔 수 / 판정 개수 / 가장 나쁜 판정
+    """
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from must be <= date_to")
+    if (date_to - date_from).days + 1 > MAX_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range must be at most {MAX_RANGE_DAYS} days")
+
+    user_id = current_user.id
+    # 어느 timezone에서도 확실히 지난 구간이면 잠깐 캐시 허용, 오늘이 포함되면 매번 재검증
+    if date_to < local_today() - timedelta(days=1):
+        cache_control = "private, max-age=300"
+    else:
+        cache_control = PRIVATE_REVALIDATE
+
+    # 재계산 전에 validator 한 번으로 304 판단 (dirty인 날이 있으면 재계산해야 하므로 304 안 함)
+    validators = service.get_range_validators(user_id=user_id, date_from=date_from, date_to=date_to)
+    if not validators.dirty_count:
+        etag = _range_etag(user_id, date_from, date_to, validators)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, None, cache_control)
+
+    result = service.get_range(user_id=user_id, date_from=date_from, date_to=date_to)
+
+    if validators.dirty_count:
+        # 재계산으로 바뀐 updated_at / dirty 반영
+        validators = service.get_range_validators(user_id=user_id, date_from=date_from, date_to=date_to)
+        etag = _range_etag(user_id, date_from, date_to, validators)
+
+    set_cache_headers(response, etag, None, cache_control)
+    return result
+
+
+# 추이 조회 최대 칸 수 (주간 약 1년 / 월간 2년)
+MAX_TREND_PERIODS = {
+    TrendPeriod.week: 53,
+    TrendPeriod.month: 24,
+}
+
+
+@router.get(
+    "/me/trend",
+    response_model=UserScoreTrendOut,
+)
+def get_user_score_trend(
+    request: Request,
+    response: Response,
+    period: TrendPeriod = Query(default=TrendPeriod.week),
+    date_from: date = Query(...),
+    date_to: date = Query(...),
+    service: UserDailyScoreService = Depends(get_user_daily_score_service),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    주간/월간 점수 추이 (주간/월간 집계 테이블 PK 범위 조회 한 번)
+    """
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from must be <= date_to")
+
+    if period == TrendPeriod.week:
+        num_periods = (week_start(date_to) - week_start(date_from)).days // 7 + 1
+    else:
+        num_periods = (date_to.year - date_from.year) * 12 + date_to.month - date_from.month + 1
+    if num_periods > MAX_TREND_PERIODS[period]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range must cover at most {MAX_TREND_PERIODS[period]} {period.value}s",
+        )
+
+    user_id = current_user.id
+    result = service.get_trend(
+        user_id=user_id, period=period, date_from=date_from, date_to=date_to
+    )
+
+    etag = build_etag(
+        "uds-trend",
+        user_id,
+        period.value,
+        date_from,
+        date_to,
+        *[f"{p.period_start}:{p.score}:{p.num_scans}:{sorted(p.decision_counts.items())}" for p in result.periods],
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, None, PRIVATE_REVALIDATE)
+
+    set_cache_headers(response, etag, None, PRIVATE_REVALIDATE)
+    return result
+
+
 @router.get(
     "/{user_id}/{local_date}",
     response_model=UserDailyScoreOut,
@@ -52,11 +189,13 @@ def get_user_daily_score(
     response_model=List[UserDailyScoreOut],
 )
 def list_user_daily_scores(
+    response: Response,
     user_id: Optional[str] = Query(default=None),
     date_from: Optional[date] = Query(default=None),
     date_to: Optional[date] = Query(default=None),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(default=None),
     db: Session = Depends(get_db),
 ):
     items = UserDailyScoreDAL.list(
@@ -66,7 +205,9 @@ def list_user_daily_scores(
         date_to=date_to,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, items, limit, UserDailyScoreDAL.LIST_ORDER)
     return items
 
 
@@ -83,6 +224,7 @@ def update_user_daily_score(
     uds = UserDailyScoreDAL.update(db, user_id, local_date, uds_in)
     if not uds:
         raise HTTPException(status_code=404, detail="User daily score not found")
+    HomeService.invalidate(user_id)
     return uds
 
 
@@ -98,4 +240,5 @@ def delete_user_daily_score(
     ok = UserDailyScoreDAL.soft_delete(db, user_id, local_date)
     if not ok:
         raise HTTPException(status_code=404, detail="User daily score not found")
+    HomeService.invalidate(user_id)
     return
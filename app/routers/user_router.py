@@ -6,8 +6,14 @@ from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.core.database import get_db
-from app.core.auth import get_current_user
+from app.core.auth import (
+    Principal,
+    get_current_user,
+    get_current_db_user,
+    invalidate_principal,
+)
 from app.DAL.user_DAL import UserDAL
+from app.services.home_service import HomeService
 from app.schemas.user import (
     UserCreate, UserUpdate, UserOut
 )
@@ -81,6 +87,9 @@ def update_user(
     user = UserDAL.update(db, user_id, user_in)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    # timezone이 바뀌면 홈의 '오늘'도 바뀜
+    HomeService.invalidate(user_id)
+    invalidate_principal(user_id)
     return user
 
 
@@ -98,6 +107,8 @@ def delete_user(
     ok = UserDAL.soft_delete(db, user_id)
     if not ok:
         raise HTTPException(status_code=404, detail="User not found")
+    HomeService.invalidate(user_id)
+    invalidate_principal(user_id)
     return
 
 
@@ -109,7 +120,7 @@ def delete_user(
     response_model=UserOut,
 )
 def get_me(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     - 우리 앱 JWT 기반 인증
@@ -130,7 +141,8 @@ def get_me(
 def update_profile(
     profile: UserUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    # User row를 직접 수정하므로 캐시된 Principal이 아닌 DB row 사용
+    current_user: User = Depends(get_current_db_user),
 ):
     same_data = (
         current_user.habits == profile.habits and
@@ -144,5 +156,7 @@ def update_profile(
 
     db.commit()
     db.refresh(current_user)
+    HomeService.invalidate(current_user.id)
+    invalidate_principal(current_user.id)
 
     return current_user
\ No newline at end of file
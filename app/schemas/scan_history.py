@@ -1,5 +1,5 @@
 # app/schemas/scan_history.py
-from datetime import datetime
+from datetime import datetime, date
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -14,6 +14,8 @@ class ScanDecision(str, Enum):
 
 class ScanHistoryBase(BaseModel):
     scanned_at: Optional[datetime] = None  # 안 오면 서버에서 now로 채워줄 계획
+    local_date: Optional[date] = None  # 안 오면 scanned_at + 기본 timezone으로 계산
+    day_seq: Optional[int] = None  # 그날 몇 번째 스캔인지 (1부터)
     decision: Optional[ScanDecision] = None
     display_name:  Optional[str] = None
     display_category: Optional[str] = None
@@ -50,6 +52,10 @@ class ScanHistoryCreate(ScanHistoryBase):
     user_id: str
     product_id: str | None
 
+    # 미리 만들어 둔 상세 응답 (ScanDetailOut JSON + 버전)
+    detail_payload: Optional[Dict[str, Any]] = None
+    detail_version: Optional[int] = None
+
 
 class ScanHistoryUpdate(ScanHistoryBase):
     model_config = ConfigDict(extra="forbid")
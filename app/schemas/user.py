@@ -1,8 +1,9 @@
 # app/schemas/user.py
 from datetime import datetime
 from typing import List, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class UserBase(BaseModel):
@@ -22,9 +23,22 @@ class UserUpdate(BaseModel):
     habits: Optional[List[str]] = None
     conditions: Optional[List[str]] = None
     allergies: Optional[List[str]] = None
+    timezone: Optional[str] = None  # 예: "Asia/Seoul"
 
     model_config = ConfigDict(extra="forbid")  # 이상한 필드는 막기
 
+    @field_validator("timezone")
+    @classmethod
+    def check_timezone(cls, v: Optional[str]) -> Optional[str]:
+        # 잘못된 이름을 저장하면 local_date 계산이 조용히 기본 timezone으로 바뀌므로 422로 거절
+        if v is None:
+            return v
+        try:
+            ZoneInfo(v)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: {v}")
+        return v
+
 
 class UserOut(BaseModel):
     id: str
@@ -33,6 +47,7 @@ class UserOut(BaseModel):
     conditions: Optional[list[str]]
     allergies: Optional[list[str]]
     profile_image_url: Optional[str] = None
+    timezone: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
 
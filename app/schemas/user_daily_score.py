@@ -1,10 +1,12 @@
 # app/schemas/user_daily_score.py
 from datetime import date, datetime
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict
 
+from app.schemas.scan_history import RiskLevel
+
 
 class MaxSeverity(str, Enum):
     none = "none"
@@ -19,6 +21,7 @@ class UserDailyScoreBase(BaseModel):
     num_scans: int = 0
     max_severity: Optional[MaxSeverity] = None
     decision_counts: Optional[Dict[str, int]] = None
+    scan_seq: int = 0
 
     formula_version: int = 1
     dirty: int = 0
@@ -52,3 +55,41 @@ class UserDailyScoreOut(UserDailyScoreBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# 캘린더(월 보기)용 하루 요약
+class UserDailyScoreDayOut(BaseModel):
+    local_date: date
+    score: int
+    num_scans: int = 0
+    decision_counts: Dict[str, int] = {}
+    top_risk_level: Optional[RiskLevel] = None  # 그날 가장 나쁜 판정 (스캔 없으면 None)
+
+
+class UserDailyScoreRangeOut(BaseModel):
+    user_id: str
+    date_from: date
+    date_to: date
+    days: List[UserDailyScoreDayOut]  # row가 있는 날만, 날짜 오름차순
+
+
+class TrendPeriod(str, Enum):
+    week = "week"    # 월요일 시작
+    month = "month"  # 1일 시작
+
+
+# 추이 그래프용 주/월 한 칸
+class UserPeriodScoreOut(BaseModel):
+    period_start: date
+    score: int             # 점수가 계산된 날의 평균, 없으면 -1
+    scored_days: int = 0
+    num_scans: int = 0
+    decision_counts: Dict[str, int] = {}
+
+
+class UserScoreTrendOut(BaseModel):
+    user_id: str
+    period: TrendPeriod
+    date_from: date
+    date_to: date
+    periods: List[UserPeriodScoreOut]  # 구간의 모든 주/월 (집계가 없으면 -1), 오름차순
@@ -1,11 +1,27 @@
-from datetime import datetime, timezone, date, timedelta
+from datetime import date
 from typing import Dict, Any, List, Optional, cast
 
 from sqlalchemy.orm import Session
 
 from app.services.user_daily_score_service import UserDailyScoreService
 from app.DAL.scan_history_DAL import ScanHistoryDAL
-from app.models.scan_history import ScanHistory
+from app.core.local_time import local_today
+from app.core.cache import build_cache
+from app.core.config import settings
+from app.core.metrics import metrics
+
+
+# 유저별 홈 응답 캐시 (key: user_id, value: {"date": 오늘, "payload": 응답})
+# 스캔 생성/삭제/이름 변경, 점수/프로필 변경 시 HomeService.invalidate로 지움
+_home_cache = build_cache(
+    "home",
+    ttl_seconds=settings.HOME_CACHE_TTL_SECONDS,
+    max_entries=settings.HOME_CACHE_MAX_ENTRIES,
+)
+metrics.register_collector("cache.home", _home_cache.stats)
+
+# 홈에 보여주는 대표 스캔 개수
+HOME_SCAN_LIMIT = 2
 
 
 class HomeService:
@@ -28,17 +44,27 @@ class HomeService:
             return "yellow"
         return "green"
 
-    def get_home(self, user_id: str) -> Dict[str, Any]:
-        kst = timezone(timedelta(hours=9))
-        now_kst = datetime.now(kst)
-        today_start_kst = now_kst.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end_kst = today_start_kst + timedelta(days=1)
-
-        # 2. 이를 UTC 시각으로 변환 (필터링 기준)
-        start_utc = today_start_kst.astimezone(timezone.utc).replace(tzinfo=None)
-        end_utc = today_end_kst.astimezone(timezone.utc).replace(tzinfo=None)
-        today: date = datetime.now(kst).date()
-
+    @staticmethod
+    def invalidate(user_id: str) -> None:
+        """
+        홈 화면에 보이는 데이터가 바뀌었을 때 호출
+        """
+        _home_cache.delete(user_id)
+
+    def get_home(self, user_id: str, tz_name: Optional[str] = None) -> Dict[str, Any]:
+        # 유저 timezone 기준 오늘 (기본 Asia/Seoul)
+        today: date = local_today(tz_name)
+
+        # 날짜가 바뀌었으면 캐시된 응답은 어제 것이라 버림
+        cached = _home_cache.get(user_id)
+        if cached is not None and cached["date"] == today.isoformat():
+            return cached["payload"]
+
+        payload = self._build_home(user_id, today)
+        _home_cache.set(user_id, {"date": today.isoformat(), "payload": payload})
+        return payload
+
+    def _build_home(self, user_id: str, today: date) -> Dict[str, Any]:
         # 오늘 점수
         uds = self.user_daily_score_service.user_daily_score_dal.get(
             self.db, user_id=user_id, local_date=today
@@ -52,29 +78,14 @@ class HomeService:
 
         today_score = uds.score if uds else 0
 
-        # 모든 스캔 (최신순)
-        all_scans: List[ScanHistory] = (
-            self.db.query(ScanHistory)
-            .filter(
-                ScanHistory.user_id == user_id,
-                ScanHistory.scanned_at >= start_utc,
-                ScanHistory.scanned_at < end_utc
-            )
-            .order_by(ScanHistory.scanned_at.desc())
-            .all()
+        # 상품별 최신 스캔 2개만 (필요한 컬럼만 조회)
+        rows = self.scan_history_dal.get_representative_scans_for_day(
+            self.db, user_id=user_id, local_date=today, limit=HOME_SCAN_LIMIT
         )
 
-        # product_id 기준 대표 스캔 선정
-        representative: dict[str, ScanHistory] = {}
-
-        for scan in all_scans:
-            key = scan.product_id or scan.id
-            if key not in representative:
-                representative[key] = scan
-
         scan_items: List[Dict[str, Any]] = []
 
-        for scan in list(representative.values())[:2]:
+        for scan in rows:
             scan_items.append(
                 {
                     "name": scan.product_name if not scan.dirty else scan.display_name,
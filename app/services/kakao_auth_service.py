@@ -0,0 +1,127 @@
+# app/services/kakao_auth_service.py
+import asyncio
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+
+class KakaoAPIError(Exception):
+    """
+    카카오가 오류 응답을 준 경우 (잘못된 code, 만료된 토큰 등)
+    """
+
+    def __init__(self, status_code: int, body: Any = None):
+        self.status_code = status_code
+        self.body = body
+        super().__init__(f"Kakao API error {status_code}")
+
+
+class KakaoUnavailableError(Exception):
+    """
+    재시도 후에도 카카오에 연결하지 못했거나 응답이 없는 경우
+    """
+
+
+class KakaoAuthService:
+    """
+    카카오 OAuth / 사용자 API 호출 (공용 AsyncClient 사용, 이벤트 루프를 막지 않음)
+    - 토큰 발급(POST)은 code가 한 번만 쓰이므로 연결 단계 실패만 재시도 (transport retries)
+    - 사용자 정보 조회(GET)는 5xx / 읽기 타임아웃도 재시도
+    - 호출별 지연시간 / 재시도 / 오류 수는 metrics의 kakao.* 로 집계
+    """
+
+    # 재시도 간격 (0.1초, 0.2초, ...)
+    RETRY_BACKOFF_SECONDS = 0.1
+
+    def __init__(self, http_client: httpx.AsyncClient, retries: Optional[int] = None):
+        self.http_client = http_client
+        self.retries = settings.KAKAO_HTTP_RETRIES if retries is None else retries
+
+    async def _send(self, name: str, method: str, url: str, *, idempotent: bool, **kwargs) -> httpx.Response:
+        attempts = (self.retries if idempotent else 0) + 1
+        for attempt in range(attempts):
+            try:
+                with metrics.timer(f"kakao.{name}"):
+                    res = await self.http_client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt + 1 >= attempts:
+                    metrics.inc(f"kakao.{name}.errors")
+                    raise KakaoUnavailableError(f"Kakao {name} request failed: {e!r}") from e
+            else:
+                if res.status_code < 500 or attempt + 1 >= attempts:
+                    if res.status_code >= 400:
+                        metrics.inc(f"kakao.{name}.errors")
+                    return res
+
+            metrics.inc(f"kakao.{name}.retries")
+            await asyncio.sleep(self.RETRY_BACKOFF_SECONDS * (2 ** attempt))
+
+        raise AssertionError("unreachable")
+
+    @staticmethod
+    def _json_or_raise(res: httpx.Response) -> Dict[str, Any]:
+        try:
+            body = res.json()
+        except ValueError:
+            body = res.text
+        if res.status_code >= 400 or not isinstance(body, dict):
+            raise KakaoAPIError(res.status_code, body)
+        return body
+
+    async def exchange_code(self, *, client_id: str, redirect_uri: str, code: str) -> Dict[str, Any]:
+        """
+        인가 code -> 카카오 토큰 (access_token, refresh_token, expires_in, ...)
+        """
+        res = await self._send(
+            "token",
+            "POST",
+            f"{settings.KAKAO_AUTH_BASE_URL}/oauth/token",
+            idempotent=False,
+            data={
+                "grant_type": "authorization_code",
+                "client_id": client_id,
+                "redirect_uri": redirect_uri,
+                "code": code,
+            },
+        )
+        return self._json_or_raise(res)
+
+    async def get_user_info(self, access_token: str) -> Dict[str, Any]:
+        res = await self._send(
+            "user_info",
+            "GET",
+            f"{settings.KAKAO_API_BASE_URL}/v2/user/me",
+            idempotent=True,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        return self._json_or_raise(res)
+
+    async def login(self, *, client_id: str, redirect_uri: str, code: str) -> Dict[str, Any]:
+        """
+        토큰 발급 -> 사용자 정보 조회 (사용자 조회에 토큰이 필요해서 순서대로, 같은 keep-alive 풀 사용)
+        반환: {"token": 토큰 응답, "user_info": 사용자 정보}
+        """
+        token = await self.exchange_code(client_id=client_id, redirect_uri=redirect_uri, code=code)
+        access_token = token.get("access_token")
+        if not access_token:
+            raise KakaoAPIError(400, token)
+        user_info = await self.get_user_info(access_token)
+        return {"token": token, "user_info": user_info}
+
+    async def unlink(self, *, admin_key: str, kakao_user_id: str) -> None:
+        res = await self._send(
+            "unlink",
+            "POST",
+            f"{settings.KAKAO_API_BASE_URL}/v1/user/unlink",
+            idempotent=False,
+            headers={"Authorization": f"KakaoAK {admin_key}"},
+            data={
+                "target_id_type": "user_id",
+                "target_id": kakao_user_id,
+            },
+        )
+        if res.status_code != 200:
+            raise KakaoAPIError(res.status_code, res.text)
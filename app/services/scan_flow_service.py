@@ -8,6 +8,7 @@ from app.services.nutrition_service import NutritionService
 from app.services.ingredient_service import IngredientService
 from app.services.product_service import ProductService
 from app.services.user_daily_score_service import UserDailyScoreService
+from app.services.home_service import HomeService
 
 from app.schemas.user_daily_score import MaxSeverity
 
@@ -113,7 +114,7 @@ class ScanFlowService:
             raise RuntimeError("scan.decision is None")
 
         # user_daily_score 갱신
-        local_date = scan.scanned_at.date()
+        local_date = scan.local_date
         decision_key = scan.decision      # ✅ str 그대로 사용
         severity: MaxSeverity | None = None
 
@@ -123,6 +124,8 @@ class ScanFlowService:
             severity=severity,
             decision_key=decision_key,
         )
+        # 점수 row가 dirty로 바뀌었으니 홈 캐시 다시 지움
+        HomeService.invalidate(scan.user_id)
 
         return ScanResultOut(
             scan_id=scan.id,
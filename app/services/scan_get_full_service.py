@@ -1,4 +1,7 @@
 # app/services/get_full_service.py (예시)
+from datetime import datetime
+from typing import Any, Dict
+
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
@@ -6,13 +9,19 @@ from app.DAL.scan_history_DAL import ScanHistoryDAL
 from app.DAL.product_DAL import ProductDAL
 from app.DAL.nutrition_DAL import NutritionDAL
 from app.DAL.ingredient_DAL import IngredientDAL
+from app.models.scan_history import ScanHistory
 
-from app.schemas.scan_full import ScanFullOut, ScanPartOut
+from app.core.responses import rows_to_dicts
 from app.schemas.product import ProductSimpleOut
 from app.schemas.nutrition import NutritionDetail, NutritionBase
-from app.schemas.ingredient import IngredientText, IngredientBase
+from app.schemas.ingredient import IngredientBase
+
+from app.services.scan_history_service import ScanHistoryService, SCAN_DETAIL_VERSION
+from app.core.local_time import to_local_date
+from app.core.http_cache import build_etag, latest
 
-from app.services.scan_history_service import ScanHistoryService
+# ScanFullOut 조립 방식이 바뀌면 올려서 기존 ETag를 무효화
+SCAN_FULL_VERSION = 1
 
 
 
@@ -34,71 +43,99 @@ class ScanGetFullService:
         self.ingredient_dal = ingredient_dal
         self.service = scan_history_service
 
-    def _build_fallback_product(self, scan) -> ProductSimpleOut:
-        # scanned_at 기준 날짜로 임시 이름 생성
-        d = scan.scanned_at.date()
-        user_id = scan.user_id
-        order = self.scan_history_dal.get_scan_order_for_day(
-            db = self.db, 
-            user_id = user_id, 
-            local_date = d, 
-            scan_id = scan.id,
-        )
-        
-        scan_history = self.scan_history_dal.get(self.db, scan.id)
-
-        if scan_history is None:
-            raise RuntimeError("scan_history should not be None here")
-
-        name = scan_history.display_name or f"{d.month}월 {d.day}일 {order}번"
+    def _build_fallback_product(self, scan: ScanHistory) -> Dict[str, Any]:
+        # 상품 정보가 없을 때 스캔 row만으로 상품 부분을 채움 (추가 조회 없음)
+        # 스캔한 로컬 날짜로 임시 이름 생성
+        d = scan.local_date or to_local_date(scan.scanned_at)
+
+        name = scan.display_name
+        if not name:
+            # 저장할 때 받은 순번 사용, 예전 row만 그날 스캔 목록에서 계산
+            order = scan.day_seq or self.scan_history_dal.get_scan_order_for_day(
+                db = self.db, 
+                user_id = scan.user_id, 
+                local_date = d, 
+                scan_id = scan.id,
+            )
+            name = f"{d.month}월 {d.day}일 {order}번"
 
         if scan.product_name:
             name = scan.product_name
             if scan.dirty:
                 name = scan.display_name
 
-        category = scan_history.display_category or "Uncategorized"
-
-        product_id = scan_history.product_id
-        product = self.product_dal.get(self.db, product_id)
-
-
-        image_url = ""
-        if product and getattr(product, "image_url", None):
-            image_url = product.image_url
-        elif scan_history.image_url:
-            image_url = scan_history.image_url
+        category = scan.display_category or "Uncategorized"
+
+        return {
+            "name": name,
+            "category": category,
+            "image_url": scan.image_url or "",  # 이미지 없으면 빈 문자열
+        }
+
+    def get_full_scan_validators(self, scan_id: str) -> tuple[str, datetime | None]:
+        """
+        GET /{scan_id}/details 조건부 요청용 (ETag, Last-Modified)
+        응답에 들어가는 네 테이블의 updated_at을 쿼리 한 번으로 확인
+        """
+        row = self.scan_history_dal.get_cache_validators(self.db, scan_id)
+        if row is None:
+            raise HTTPException(status_code=404, detail="Scan not found")
 
-        return ProductSimpleOut(
-            name=name,
-            category=category,
-            image_url=image_url,  # 이미지 없으면 빈 문자열
+        etag = build_etag(
+            "scan-full",
+            SCAN_FULL_VERSION,
+            SCAN_DETAIL_VERSION,
+            scan_id,
+            row.scan_updated_at,
+            row.product_updated_at,
+            row.nutrition_updated_at,
+            row.nutrition_count,
+            row.ingredient_updated_at,
+            row.ingredient_count,
         )
-
-    def get_full_scan(self, scan_id: str) -> ScanFullOut:
+        last_modified = latest(
+            row.scan_updated_at,
+            row.product_updated_at,
+            row.nutrition_updated_at,
+            row.ingredient_updated_at,
+        )
+        return etag, last_modified
+
+    def get_full_scan(self, scan_id: str) -> Dict[str, Any]:
+        """
+        ScanFullOut 형태의 dict
+        DB row / 저장된 상세 응답은 검증 없이 그대로 쓰고, AI 응답(product_nutrition)만 스키마로 검증
+        """
+        # scan / product / nutrition / ingredient 각각 한 번씩만 조회
         scan = self.scan_history_dal.get(self.db, scan_id)
         if scan is None:
             raise HTTPException(status_code=404, detail="Scan not found")
 
+        product_id = scan.product_id
+
         # product
-        product = self.product_dal.get(self.db, scan.product_id)
+        product = self.product_dal.get_simple_row(self.db, product_id) if product_id else None
         if product is None:
             product_out = self._build_fallback_product(scan)
         else:
-            product_out = ProductSimpleOut.model_validate(product)
-
-        # scan(요약 + 리포트들)
-        scan_detail = self.service.get_scan_detail(scan.id)  # summary / reports / caution_factors 만들던 함수
-        scan_part = ScanPartOut(
-            summary=scan_detail.summary,
-            score=scan.ai_total_score or 0,
-            reports=scan_detail.reports,
-            caution_factors=scan_detail.caution_factors,
-        )
+            product_out = rows_to_dicts([product], ProductSimpleOut)[0]
+
+        # scan(요약 + 리포트들) - 저장된 상세 응답 사용
+        scan_detail = self.service.render_scan_detail(scan)
+        scan_part = {
+            "summary": scan_detail["summary"],
+            "score": scan.ai_total_score or 0,
+            "reports": scan_detail["reports"],
+            "caution_factors": scan_detail.get("caution_factors", []),
+        }
 
         # nutrition / ingredient는 없을 수도 있으니 Optional
-        nutrition = self.nutrition_dal.get_id_by_product_id(self.db, scan.product_id)
-        ingredient = self.ingredient_dal.get_id_by_product_id(self.db, scan.product_id)
+        # product_id가 없는 스캔(이미지/성분표)은 조회할 필요 없음
+        nutrition = None
+        ingredient = None
+        if product_id:
+            nutrition = self.nutrition_dal.get_id_by_product_id(self.db, product_id)
+            ingredient = self.ingredient_dal.get_id_by_product_id(self.db, product_id)
 
         if nutrition is None:
             ai_response = scan.product_nutrition
@@ -111,9 +148,9 @@ class ScanGetFullService:
             else:
                 ingredient = IngredientBase(raw_ingredient="")
 
-        return ScanFullOut(
-            product=product_out,
-            scan=scan_part,
-            nutrition=NutritionDetail.model_validate(nutrition) if nutrition else None,
-            ingredient=IngredientText(text=ingredient.raw_ingredient) if ingredient else None,
-        )
+        return {
+            "product": product_out,
+            "scan": scan_part,
+            "nutrition": NutritionDetail.model_validate(nutrition).model_dump() if nutrition else None,
+            "ingredient": {"text": ingredient.raw_ingredient} if ingredient else None,
+        }
@@ -1,7 +1,7 @@
 # app/services/scan_history_service.py
 
 from datetime import datetime, timezone, date
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Callable, Dict, List, Optional, Literal
 
 from fastapi import UploadFile, HTTPException
 from sqlalchemy.orm import Session
@@ -11,10 +11,16 @@ from app.DAL.user_DAL import UserDAL
 from app.DAL.nutrition_DAL import NutritionDAL
 from app.DAL.product_DAL import ProductDAL
 from app.DAL.ingredient_DAL import IngredientDAL
+from app.DAL.user_daily_score_DAL import UserDailyScoreDAL
+from app.models.scan_history import ScanHistory
+
+from app.core.local_time import to_local_date
+from app.core.http_cache import build_etag
 
 from app.services.product_service import ProductService
 from app.services.ai_scan_analysis_service import AiScanAnalysisService
 from app.services.image_storage_service import ImageStorageService
+from app.services.home_service import HomeService
 
 from app.schemas.scan_history import (
     ScanHistoryCreate,
@@ -29,8 +35,6 @@ from app.schemas.scan_history import (
     FaceType,
     ScanHistoryUpdate,
     ScanHistoryNameCategoryOut,
-    ScanSummaryOut,
-    ScanHistoryListOut
 )
 from app.schemas.user import UserOut
 from app.schemas.product import ProductOut
@@ -40,6 +44,10 @@ import base64
 
 AnalyzeType = Literal["barcode_image", "nutrition_label", "image"]
 
+# 저장해 두는 상세 응답(detail_payload) 형식 버전
+# build_scan_detail 결과 형태가 바뀌면 올려서 예전 payload를 무시하게 함
+SCAN_DETAIL_VERSION = 1
+
 class ScanHistoryService:
     def __init__(
         self,
@@ -49,8 +57,9 @@ class ScanHistoryService:
         nutrition_dal: NutritionDAL,
         ingredient_dal: IngredientDAL,
         scan_history_dal: ScanHistoryDAL,
+        user_daily_score_dal: UserDailyScoreDAL,
         product_service: ProductService,
-        ai_service: AiScanAnalysisService,
+        ai_service_factory: Callable[[], AiScanAnalysisService],
         image_storage: ImageStorageService,
     ):
         self.db = db
@@ -59,10 +68,19 @@ class ScanHistoryService:
         self.nutrition_dal = nutrition_dal
         self.ingredient_dal = ingredient_dal
         self.scan_history_dal = scan_history_dal
+        self.user_daily_score_dal = user_daily_score_dal
         self.product_service = product_service
-        self.ai_service = ai_service
+        self.ai_service_factory = ai_service_factory
+        self._ai_service: Optional[AiScanAnalysisService] = None
         self.image_storage = image_storage
 
+    @property
+    def ai_service(self) -> AiScanAnalysisService:
+        # 스캔 분석 경로에서만 생성 (조회 API는 OpenAI 설정 없이도 동작)
+        if self._ai_service is None:
+            self._ai_service = self.ai_service_factory()
+        return self._ai_service
+
     async def analyze_and_save_scan(
         self,
         user_id: str,
@@ -145,14 +163,8 @@ class ScanHistoryService:
             nutrition_dict = {"raw_label": nutrition_text} if nutrition_text else None
             ingredient_list = []
 
-            d = datetime.now(timezone.utc)
-            n = self.scan_history_dal.count_scans_date(
-                db=self.db,
-                user_id=user_id,
-                local_date=d.date(),
-            ) + 1
-
-            tmp_display_name = f"{d.month}월 {d.day}일 {n}번"
+            # "12월 3일 4번" 같은 이름은 저장 직전에 순번 받아서 만듦
+            tmp_display_name = None
             tmp_display_category = "Uncategorized"
 
             if image is not None:
@@ -175,15 +187,9 @@ class ScanHistoryService:
             b64 = base64.b64encode(image_bytes).decode("ascii")
             mime = image.content_type or "image/jpeg"
             image_data_url = f"data:{mime};base64,{b64}"
-            
-            d = datetime.now(timezone.utc)
-            n = self.scan_history_dal.count_scans_date(
-                db=self.db,
-                user_id=user_id,
-                local_date=d.date(),
-            ) + 1
-
-            tmp_display_name = f"{d.month}월 {d.day}일 {n}번"
+
+            # "12월 3일 4번" 같은 이름은 저장 직전에 순번 받아서 만듦
+            tmp_display_name = None
             tmp_display_category = "Uncategorized"
 
         else:
@@ -230,11 +236,22 @@ class ScanHistoryService:
 
         now_aware = datetime.now(timezone.utc)
         scanned_at = now_aware.replace(tzinfo=None)  # naive datetime 저장
+        local_date = to_local_date(scanned_at, user.timezone)
+
+        # 오늘 몇 번째 스캔인지 user_daily_score 카운터에서 원자적으로 발급
+        # 커밋은 아래 scan_history_dal.create에서 한 번 (순번 발급과 스캔 INSERT가 같은 트랜잭션)
+        day_seq = self.user_daily_score_dal.allocate_scan_seq(
+            self.db, user_id=user_id, local_date=local_date
+        )
+        if display_name is None:
+            display_name = f"{local_date.month}월 {local_date.day}일 {day_seq}번"
     
         data = ScanHistoryCreate(
             user_id=user_id,
             product_id=product_id,
             scanned_at=scanned_at,
+            local_date=local_date,
+            day_seq=day_seq,
             display_name=display_name,
             display_category=display_category,
             image_url=image_url,
@@ -260,7 +277,12 @@ class ScanHistoryService:
             dirty=False
         )
 
+        # 분석 결과는 바뀌지 않으니 상세 응답을 미리 만들어 같이 저장
+        data.detail_payload = self.build_scan_detail(data).model_dump(mode="json")
+        data.detail_version = SCAN_DETAIL_VERSION
+
         scan = self.scan_history_dal.create(self.db, data)
+        HomeService.invalidate(user_id)
         return scan
 
 
@@ -270,10 +292,7 @@ class ScanHistoryService:
         display_name: str, 
         display_category: str
     ) -> ScanHistoryNameCategoryOut:
-        scan = self.scan_history_dal.get(self.db, scan_id)
-        if scan is None:
-            raise HTTPException(status_code=404, detail="Scan not found")
-        
+        # 이름 / 카테고리는 상세 응답(ScanDetailOut)에 없으므로 저장된 detail_payload는 그대로 둠
         update_in = ScanHistoryUpdate(
             display_name=display_name,
             display_category=display_category,
@@ -283,6 +302,7 @@ class ScanHistoryService:
         scan = self.scan_history_dal.update(self.db, scan_id, update_in)
         if scan is None:
             raise HTTPException(status_code=404, detail="Scan not found")
+        HomeService.invalidate(scan.user_id)
 
         return ScanHistoryNameCategoryOut(
             name=scan.display_name,
@@ -292,8 +312,12 @@ class ScanHistoryService:
 
     async def get_scan_list_by_date(
         self, user_id: str, date: datetime
-    ) -> ScanHistoryListOut:
-        scans = self.scan_history_dal.get_by_date(self.db, user_id, date)
+    ) -> Dict[str, Any]:
+        """
+        ScanHistoryListOut 형태의 dict (DB에서 읽은 값이라 검증 없이 그대로 직렬화)
+        """
+        # 목록에 필요한 컬럼만 조회 (리포트 TEXT/JSON 제외)
+        scans = self.scan_history_dal.list_summaries_by_date(self.db, user_id, date.date())
 
         scan_list = []
         for s in scans:
@@ -305,23 +329,52 @@ class ScanHistoryService:
             }.get(decision, RiskLevel.green)
 
             scan_list.append(
-                ScanSummaryOut(
-                    name=s.product_name if not s.dirty else s.display_name,
-                    category=s.display_category,
-                    scanID=s.id,
-                    riskLevel=risk_level,     # DB에 컬럼 있으면
-                    summary=s.summary,  # or summary 필드
-                    url=s.image_url,            # 이미지 저장한 컬럼명
-                )
+                {
+                    "name": s.product_name if not s.dirty else s.display_name,
+                    "category": s.display_category,
+                    "scanID": s.id,
+                    "riskLevel": risk_level.value,     # DB에 컬럼 있으면
+                    "summary": s.summary,  # or summary 필드
+                    "url": s.image_url,            # 이미지 저장한 컬럼명
+                }
             )
 
-        return ScanHistoryListOut(scan=scan_list)
+        return {"scan": scan_list}
 
-    def get_scan_detail(self, scan_id: str) -> ScanDetailOut:
+    def get_scan_detail(self, scan_id: str) -> Dict[str, Any]:
         scan = self.scan_history_dal.get(self.db, scan_id)
         if scan is None:
             raise HTTPException(status_code=404, detail="Scan not found")
 
+        return self.render_scan_detail(scan)
+
+    def get_scan_detail_validators(self, scan_id: str) -> tuple[str, datetime]:
+        """
+        GET /{scan_id} 조건부 요청용 (ETag, Last-Modified). 상세 응답을 만들기 전에 호출
+        """
+        row = self.scan_history_dal.get_cache_validators(self.db, scan_id)
+        if row is None:
+            raise HTTPException(status_code=404, detail="Scan not found")
+
+        etag = build_etag("scan-detail", SCAN_DETAIL_VERSION, scan_id, row.scan_updated_at)
+        return etag, row.scan_updated_at
+
+    def render_scan_detail(self, scan: ScanHistory) -> Dict[str, Any]:
+        """
+        ScanDetailOut 형태의 dict
+        저장된 detail_payload가 현재 버전이면 검증 없이 그대로 쓰고 (저장할 때 ScanDetailOut으로 만든 값),
+        아니면 ai_* 컬럼으로 새로 만듦
+        ScanDetailOut에는 이름 / 카테고리가 없어서 display_name / display_category 변경(PATCH)은
+        detail_payload에 반영되지 않음 (다시 만들 필요 없음)
+        """
+        if scan.detail_payload is not None and scan.detail_version == SCAN_DETAIL_VERSION:
+            return scan.detail_payload
+        return self.build_scan_detail(scan).model_dump(mode="json")
+
+    def build_scan_detail(self, scan: ScanHistory | ScanHistoryCreate) -> ScanDetailOut:
+        """
+        scan row(또는 저장 직전 데이터)로 상세 응답을 만듦 (DB 조회 없음)
+        """
         # 1) decision -> risk_level
         decision = (scan.decision or "ok").lower()
         risk_level = {
@@ -0,0 +1,94 @@
+# app/services/score_formulas.py
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.core.config import settings
+
+
+class ScoreFormula(ABC):
+    """
+    일별 점수 산식 (user_daily_score.formula_version 별로 등록)
+    하루치 스캔들의 ai_total_score 묶음 -> 0~100 점수, 계산할 값이 없으면 -1
+    여러 날을 한 번에 넘겨 numpy로 벡터 계산 (홈 1일 / 워커 배치 / 전체 재계산 모두 같은 코드)
+    """
+
+    version: int = 0
+    description: str = ""
+
+    @abstractmethod
+    def score_groups(self, values: np.ndarray, group_ids: np.ndarray, n_groups: int) -> np.ndarray:
+        """
+        values: 스캔 점수 (float, 없으면 NaN) / group_ids: 각 값이 속한 날의 번호 (0 ~ n_groups-1)
+        반환: 날별 점수 (int 배열, 길이 n_groups)
+        """
+
+    def score_keys(
+        self,
+        keys: Sequence[tuple],
+        values_by_key: Dict[tuple, Sequence[Optional[float]]],
+    ) -> Dict[tuple, int]:
+        """
+        {(user_id, local_date): [점수, ...]} -> {(user_id, local_date): 점수}
+        """
+        sizes = [len(values_by_key.get(key, ())) for key in keys]
+        values = np.fromiter(
+            (
+                np.nan if v is None else v
+                for key in keys
+                for v in values_by_key.get(key, ())
+            ),
+            dtype=np.float64,
+            count=sum(sizes),
+        )
+        group_ids = np.repeat(np.arange(len(keys), dtype=np.intp), sizes)
+        scores = self.score_groups(values, group_ids, len(keys))
+        return dict(zip(keys, scores.tolist()))
+
+
+_FORMULAS: Dict[int, ScoreFormula] = {}
+
+
+def register_formula(cls):
+    """
+    산식 클래스 등록 데코레이터. 산식을 바꿀 때는 기존 클래스를 고치지 말고 새 version으로 추가
+    """
+    formula = cls()
+    if formula.version in _FORMULAS:
+        raise ValueError(f"Score formula version {formula.version} is already registered")
+    _FORMULAS[formula.version] = formula
+    return cls
+
+
+def get_formula(version: Optional[int] = None) -> ScoreFormula:
+    """
+    version이 없으면 현재 산식 (settings.SCORE_FORMULA_VERSION)
+    """
+    version = version or settings.SCORE_FORMULA_VERSION
+    formula = _FORMULAS.get(version)
+    if formula is None:
+        raise ValueError(f"Unknown score formula version: {version}")
+    return formula
+
+
+def available_formulas() -> List[ScoreFormula]:
+    return [_FORMULAS[v] for v in sorted(_FORMULAS)]
+
+
+@register_formula
+class MeanScoreFormula(ScoreFormula):
+    version = 1
+    description = "그날 스캔 ai_total_score 평균 (0~100으로 자르고 반올림)"
+
+    def score_groups(self, values: np.ndarray, group_ids: np.ndarray, n_groups: int) -> np.ndarray:
+        valid = ~np.isnan(values)
+        sums = np.bincount(group_ids[valid], weights=values[valid], minlength=n_groups)
+        counts = np.bincount(group_ids[valid], minlength=n_groups)
+
+        scores = np.full(n_groups, -1, dtype=np.int64)
+        has_values = counts > 0
+        avg = sums[has_values] / counts[has_values]
+        # round()와 같은 half-to-even 반올림
+        scores[has_values] = np.rint(np.clip(avg, 0.0, 100.0)).astype(np.int64)
+        return scores
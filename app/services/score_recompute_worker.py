@@ -0,0 +1,159 @@
+# app/services/score_recompute_worker.py
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.metrics import metrics
+from app.DAL.scan_history_DAL import ScanHistoryDAL
+from app.DAL.user_daily_score_DAL import UserDailyScoreDAL
+from app.services.score_formulas import get_formula
+from app.services.user_daily_score_service import UserDailyScoreService
+
+logger = logging.getLogger(__name__)
+
+
+class ScoreRecomputeWorker:
+    """
+    dirty인 user_daily_score를 백그라운드에서 배치로 재계산
+    - 홈 진입 시 재계산(recompute_score_for_day)은 그대로 두고, 대부분은 워커가 먼저 처리해서
+      홈에서는 이미 깨끗한 row를 읽도록 함
+    - 배치당: dirty row 잠금(SKIP LOCKED) / 스캔 점수 조회 / numpy 산식 계산 / executemany UPDATE
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: Optional[int] = None,
+        interval_seconds: Optional[float] = None,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.SCORE_WORKER_BATCH_SIZE
+        self.interval_seconds = (
+            interval_seconds if interval_seconds is not None else settings.SCORE_WORKER_INTERVAL_SECONDS
+        )
+
+        self._stop: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self._lock = threading.Lock()
+        self._dirty_count: Optional[int] = None
+        self._dirty_lag_seconds: Optional[float] = None
+        self._last_run_at: Optional[datetime] = None
+
+    # -------------------------------------------------
+    # 한 배치 처리 (동기, 스레드에서 실행)
+    # -------------------------------------------------
+    def run_once(self) -> int:
+        """
+        dirty row를 최대 batch_size개 재계산하고 실제로 갱신된 row 수 반환
+        """
+        db = self.session_factory()
+        try:
+            with metrics.timer("score_worker.batch"):
+                rows = UserDailyScoreDAL.claim_dirty_batch(db, limit=self.batch_size)
+                if not rows:
+                    db.commit()
+                    updated = 0
+                else:
+                    formula = get_formula()
+                    num_scans_by_key = {
+                        (user_id, local_date): num_scans for user_id, local_date, num_scans in rows
+                    }
+                    values_by_key = ScanHistoryDAL.get_ai_scores_for_keys(db, keys=list(num_scans_by_key))
+                    computed = UserDailyScoreService.compute_scores(
+                        num_scans_by_key, values_by_key, formula
+                    )
+                    scores = [
+                        {
+                            "user_id": user_id,
+                            "local_date": local_date,
+                            "num_scans": num_scans or 0,
+                            "score": computed[(user_id, local_date)],
+                        }
+                        for (user_id, local_date), num_scans in num_scans_by_key.items()
+                    ]
+                    # 커밋하면서 잠금 해제. 그 사이 스캔이 추가된 row는 num_scans가 달라서 건너뜀 -> 다음 배치
+                    updated = UserDailyScoreDAL.bulk_update_scores(
+                        db,
+                        scores=scores,
+                        computed_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                        formula_version=formula.version,
+                    )
+
+            metrics.inc("score_worker.recomputed", updated)
+            self._refresh_lag(db)
+            return updated
+        except Exception:
+            db.rollback()
+            metrics.inc("score_worker.errors")
+            raise
+        finally:
+            db.close()
+
+    def _refresh_lag(self, db: Session) -> None:
+        row = UserDailyScoreDAL.get_dirty_stats(db)
+        lag = None
+        if row.oldest_updated_at is not None and row.db_now is not None:
+            lag = max(0.0, (row.db_now - row.oldest_updated_at).total_seconds())
+        with self._lock:
+            self._dirty_count = int(row.count or 0)
+            self._dirty_lag_seconds = lag
+            self._last_run_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def stats(self) -> Dict[str, Any]:
+        # GET /v1/metrics 의 collectors["score_worker"]
+        with self._lock:
+            return {
+                "batch_size": self.batch_size,
+                "interval_seconds": self.interval_seconds,
+                "dirty_count": self._dirty_count,
+                "dirty_lag_seconds": self._dirty_lag_seconds,
+                "last_run_at": self._last_run_at.isoformat() if self._last_run_at else None,
+            }
+
+    # -------------------------------------------------
+    # 반복 실행 (앱 startup/shutdown 에서 start/stop)
+    # -------------------------------------------------
+    async def run_forever(self) -> None:
+        assert self._stop is not None
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                updated = await asyncio.to_thread(self.run_once)
+            except Exception:
+                logger.exception("score recompute batch failed")
+                updated = 0
+
+            # 배치가 꽉 찼으면 밀린 게 더 있으니 바로 다음 배치
+            if updated >= self.batch_size:
+                continue
+
+            wait = max(0.0, self.interval_seconds - (time.monotonic() - started))
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        await self._task
+        self._task = None
+
+
+score_recompute_worker = ScoreRecomputeWorker()
+metrics.register_collector("score_worker", score_recompute_worker.stats)
@@ -0,0 +1,117 @@
+# app/services/session_service.py
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.auth import create_app_refresh_token
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.DAL.user_session_DAL import UserSessionDAL, hash_token
+
+# 잘못된 refresh token 해시 (프로세스 내). 같은 토큰으로 반복 요청이 와도 DB 조회는 한 번
+_invalid_refresh_tokens = TTLCache(
+    ttl_seconds=settings.INVALID_REFRESH_TOKEN_CACHE_TTL_SECONDS,
+    max_entries=settings.INVALID_REFRESH_TOKEN_CACHE_MAX_ENTRIES,
+)
+metrics.register_collector("cache.invalid_refresh_token", _invalid_refresh_tokens.stats)
+
+
+@dataclass(frozen=True)
+class IssuedSession:
+    user_id: str
+    session_id: str
+    refresh_token: str  # 클라이언트에 한 번만 내려주는 원문
+
+
+class SessionService:
+    """
+    앱 refresh token 세션 발급 / 갱신(rotation) / 폐기
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        user_session_dal: UserSessionDAL,
+    ):
+        self.db = db
+        self.user_session_dal = user_session_dal
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def _expires_at(now: datetime) -> datetime:
+        return now + timedelta(days=settings.REFRESH_TOKEN_TTL_DAYS)
+
+    def issue(self, user_id: str) -> IssuedSession:
+        """
+        로그인 시 새 기기 세션 생성 (커밋은 호출한 쪽에서 user 변경과 함께)
+        """
+        refresh_token = create_app_refresh_token()
+        session_id = self.user_session_dal.create(
+            self.db,
+            user_id=user_id,
+            token_hash=hash_token(refresh_token),
+            expires_at=self._expires_at(self._now()),
+        )
+        return IssuedSession(user_id=user_id, session_id=session_id, refresh_token=refresh_token)
+
+    def refresh(self, refresh_token: str) -> Optional[IssuedSession]:
+        """
+        refresh token 검증 후 새 토큰으로 교체 (기존 토큰은 유예 시간 뒤 사용 불가)
+        유효하지 않으면 None
+        """
+        token_hash = hash_token(refresh_token)
+        if _invalid_refresh_tokens.get(token_hash) is not None:
+            metrics.inc("auth.refresh.invalid_cached")
+            return None
+
+        now = self._now()
+        new_token = create_app_refresh_token()
+        new_hash = hash_token(new_token)
+
+        row = self.user_session_dal.find_active(self.db, token_hash, now)
+        if row is not None and self.user_session_dal.rotate(
+            self.db,
+            session_id=row.id,
+            new_token_hash=new_hash,
+            now=now,
+            expires_at=self._expires_at(now),
+            expected_token_hash=token_hash,
+        ):
+            self.db.commit()
+            return IssuedSession(user_id=row.user_id, session_id=row.id, refresh_token=new_token)
+
+        # 방금 다른 요청이 같은 토큰으로 갱신한 경우 -> 유예 시간 안이면 한 번 더 교체
+        row = self.user_session_dal.find_recently_rotated(
+            self.db,
+            token_hash,
+            rotated_after=now - timedelta(seconds=settings.REFRESH_TOKEN_ROTATION_GRACE_SECONDS),
+            now=now,
+        )
+        if row is not None and self.user_session_dal.rotate(
+            self.db,
+            session_id=row.id,
+            new_token_hash=new_hash,
+            now=now,
+            expires_at=self._expires_at(now),
+        ):
+            self.db.commit()
+            return IssuedSession(user_id=row.user_id, session_id=row.id, refresh_token=new_token)
+
+        self.db.rollback()
+        _invalid_refresh_tokens.set(token_hash, True)
+        metrics.inc("auth.refresh.invalid")
+        return None
+
+    def revoke(self, session_id: str) -> None:
+        self.user_session_dal.delete(self.db, session_id)
+        self.db.commit()
+
+    def revoke_all(self, user_id: str) -> None:
+        self.user_session_dal.delete_for_user(self.db, user_id)
+        self.db.commit()
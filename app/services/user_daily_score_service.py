@@ -1,17 +1,30 @@
-from datetime import date, datetime, timezone
-from typing import Optional, Dict, Any
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
 from app.models.user_daily_score import UserDailyScore
 from app.DAL.user_daily_score_DAL import UserDailyScoreDAL
 from app.DAL.scan_history_DAL import ScanHistoryDAL
+from app.services.score_formulas import ScoreFormula, get_formula
+from app.DAL.user_score_rollup_DAL import (
+    UserScoreRollupDAL,
+    week_start,
+    month_start,
+    next_month,
+)
 
 from app.schemas.user_daily_score import (
     UserDailyScoreCreate,
     UserDailyScoreUpdate,
     MaxSeverity,
+    UserDailyScoreDayOut,
+    UserDailyScoreRangeOut,
+    TrendPeriod,
+    UserPeriodScoreOut,
+    UserScoreTrendOut,
 )
+from app.schemas.scan_history import RiskLevel
 
 
 class UserDailyScoreService:
@@ -28,10 +41,12 @@ class UserDailyScoreService:
         db: Session,
         user_daily_score_dal: UserDailyScoreDAL,
         scan_history_dal: ScanHistoryDAL,
+        user_score_rollup_dal: UserScoreRollupDAL,
     ):
         self.db = db
         self.user_daily_score_dal = user_daily_score_dal
         self.scan_history_dal = scan_history_dal
+        self.user_score_rollup_dal = user_score_rollup_dal
 
     # -------------------------------------------------
     # 스캔 1건 발생 시 호출 (점수는 계산 안 함)
@@ -63,7 +78,7 @@ class UserDailyScoreService:
                 num_scans=1,
                 max_severity=severity,
                 decision_counts=_updated_decision_counts(None, decision_key),
-                formula_version=1,
+                formula_version=get_formula().version,
                 dirty=1,
                 last_computed_at=None,
                 sync_state=1,
@@ -103,8 +118,158 @@ class UserDailyScoreService:
             uds_in=uds_update,
         )
 
+    @staticmethod
+    def compute_scores(
+        num_scans_by_key: Dict[tuple, Optional[int]],
+        values_by_key: Dict[tuple, List[Optional[int]]],
+        formula: Optional[ScoreFormula] = None,
+    ) -> Dict[tuple, int]:
+        """
+        (user_id, local_date)별 점수를 산식으로 한 번에 계산 (홈 / 캘린더 / 워커 / 전체 재계산 공통)
+        num_scans가 0인 날은 산식과 관계없이 -1
+        """
+        formula = formula or get_formula()
+        computed = formula.score_keys(list(num_scans_by_key), values_by_key)
+        return {
+            key: computed[key] if (num_scans or 0) > 0 else -1
+            for key, num_scans in num_scans_by_key.items()
+        }
+
+    @staticmethod
+    def _top_risk_level(decision_counts: Optional[Dict[str, int]]) -> Optional[RiskLevel]:
+        counts = decision_counts or {}
+        if counts.get("avoid"):
+            return RiskLevel.red
+        if counts.get("caution"):
+            return RiskLevel.yellow
+        if counts.get("ok"):
+            return RiskLevel.green
+        return None
+
+    # -------------------------------------------------
+    # 캘린더 조건부 GET: 재계산 전에 값싼 validator만 조회
+    # -------------------------------------------------
+    def get_range_validators(
+        self,
+        *,
+        user_id: str,
+        date_from: date,
+        date_to: date,
+    ):
+        return self.user_daily_score_dal.get_range_validators(
+            self.db, user_id=user_id, date_from=date_from, date_to=date_to
+        )
+
     # -------------------------------------------------
-    # 홈 화면 진입 시: 점수 재계산 (유일한 score 계산 지점)
+    # 캘린더: 날짜 구간 점수 (dirty인 날은 한 번에 재계산)
+    # -------------------------------------------------
+    def get_range(
+        self,
+        *,
+        user_id: str,
+        date_from: date,
+        date_to: date,
+    ) -> UserDailyScoreRangeOut:
+        rows = self.user_daily_score_dal.list_range(
+            self.db, user_id=user_id, date_from=date_from, date_to=date_to
+        )
+
+        # dirty인 날만 모아서 점수 조회 한 번 + UPDATE 한 번
+        dirty_rows = [r for r in rows if r.dirty]
+        formula = get_formula()
+        new_scores: Dict[date, int] = {}
+        if dirty_rows:
+            num_scans_by_key = {(user_id, r.local_date): r.num_scans for r in dirty_rows}
+            values_by_key = self.scan_history_dal.get_ai_scores_for_keys(
+                self.db, keys=list(num_scans_by_key)
+            )
+            computed = self.compute_scores(num_scans_by_key, values_by_key, formula)
+            new_scores = {local_date: score for (_, local_date), score in computed.items()}
+
+        # 응답은 커밋 전에 만들어 둠 (커밋 후 row를 다시 읽지 않도록)
+        days = [
+            UserDailyScoreDayOut(
+                local_date=r.local_date,
+                score=new_scores.get(r.local_date, r.score),
+                num_scans=r.num_scans or 0,
+                decision_counts=r.decision_counts or {},
+                top_risk_level=self._top_risk_level(r.decision_counts),
+            )
+            for r in rows
+        ]
+
+        if dirty_rows:
+            self.user_daily_score_dal.bulk_update_scores(
+                self.db,
+                scores=[
+                    {
+                        "user_id": user_id,
+                        "local_date": r.local_date,
+                        "num_scans": r.num_scans or 0,
+                        "score": new_scores[r.local_date],
+                    }
+                    for r in dirty_rows
+                ],
+                computed_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                formula_version=formula.version,
+            )
+
+        return UserDailyScoreRangeOut(
+            user_id=user_id,
+            date_from=date_from,
+            date_to=date_to,
+            days=days,
+        )
+
+    # -------------------------------------------------
+    # 추이 그래프: 주간/월간 집계 테이블만 읽음 (일별 row를 다시 평균내지 않음)
+    # -------------------------------------------------
+    def get_trend(
+        self,
+        *,
+        user_id: str,
+        period: TrendPeriod,
+        date_from: date,
+        date_to: date,
+    ) -> UserScoreTrendOut:
+        if period == TrendPeriod.week:
+            rows = self.user_score_rollup_dal.list_weekly(
+                self.db, user_id=user_id, date_from=date_from, date_to=date_to
+            )
+            by_start = {r.week_start: r for r in rows}
+            start, step = week_start(date_from), (lambda d: d + timedelta(days=7))
+        else:
+            rows = self.user_score_rollup_dal.list_monthly(
+                self.db, user_id=user_id, date_from=date_from, date_to=date_to
+            )
+            by_start = {r.month_start: r for r in rows}
+            start, step = month_start(date_from), next_month
+
+        # 집계 row가 없는 주/월도 -1로 채워서 그래프 x축이 끊기지 않게
+        periods = []
+        while start <= date_to:
+            r = by_start.get(start)
+            periods.append(
+                UserPeriodScoreOut(
+                    period_start=start,
+                    score=r.score if r else -1,
+                    scored_days=r.scored_days if r else 0,
+                    num_scans=r.num_scans if r else 0,
+                    decision_counts=(r.decision_counts or {}) if r else {},
+                )
+            )
+            start = step(start)
+
+        return UserScoreTrendOut(
+            user_id=user_id,
+            period=period,
+            date_from=date_from,
+            date_to=date_to,
+            periods=periods,
+        )
+
+    # -------------------------------------------------
+    # 홈 화면 진입 시: 하루 점수 재계산 (여러 날은 get_range에서 한 번에)
     # -------------------------------------------------
     def recompute_score_for_day(
         self,
@@ -115,6 +280,7 @@ class UserDailyScoreService:
         uds = self.user_daily_score_dal.get(
             self.db, user_id=user_id, local_date=local_date
         )
+        formula = get_formula()
 
         # 1️⃣ 홈 첫 진입: row 자체가 없으면 -1로 생성
         if uds is None:
@@ -125,32 +291,24 @@ class UserDailyScoreService:
                 num_scans=0,
                 max_severity=None,
                 decision_counts={},
-                formula_version=1,
+                formula_version=formula.version,
                 dirty=0,
                 last_computed_at=datetime.now(timezone.utc).replace(tzinfo=None),
                 sync_state=1,
             )
             return self.user_daily_score_dal.create_or_get(self.db, uds_create)
 
-        # 2️⃣ 오늘 스캔 점수 통계
-        stats = self.scan_history_dal.get_ai_score_stats_for_day(
-            self.db, user_id=user_id, local_date=local_date
-        )
-        # stats = {"count": int, "avg_score": float | None}
-
-        # 3️⃣ 초기 상태 보정
-        # - 오늘 스캔이 0개면 무조건 -1
-        if (uds.num_scans or 0) == 0:
-            score = -1
-        elif not stats or stats["count"] == 0 or stats["avg_score"] is None:
-            score = -1
-        else:
-            score = int(round(max(0.0, min(100.0, stats["avg_score"]))))
+        # 2️⃣ 오늘 스캔 점수 목록
+        key = (user_id, local_date)
+        values_by_key = self.scan_history_dal.get_ai_scores_for_keys(self.db, keys=[key])
+
+        # 3️⃣ 현재 산식으로 계산 (스캔 0개면 -1)
+        score = self.compute_scores({key: uds.num_scans}, values_by_key, formula)[key]
 
         uds_update = UserDailyScoreUpdate(
             score=score,
             dirty=0,
-            formula_version=1,
+            formula_version=formula.version,
             last_computed_at=datetime.now(timezone.utc).replace(tzinfo=None),
         )
 
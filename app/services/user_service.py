@@ -1,10 +1,12 @@
 # app/services/user_service.py
-from datetime import date
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
 from app.DAL.user_DAL import UserDAL
 from app.DAL.user_daily_score_DAL import UserDailyScoreDAL
+from app.core.auth import invalidate_principal
+from app.core.local_time import local_today
+from app.services.home_service import HomeService
 from app.schemas.user import (
     MyPageOut,
     MyPageHabitOut,
@@ -26,12 +28,12 @@ class UserService:
         self.user_daily_score_dal = user_daily_score_dal
 
     def get_mypage(self, user_id: str) -> MyPageOut:
-        today = date.today()
-
         user = self.user_dal.get(db=self.db, user_id=user_id)
         if user is None:
             raise HTTPException(status_code=404, detail="User not found")
 
+        today = local_today(user.timezone)
+
         user_daily_score = self.user_daily_score_dal.get(
             db=self.db,
             user_id=user_id,
@@ -65,6 +67,8 @@ class UserService:
 
         self.db.commit()
         self.db.refresh(user)
+        HomeService.invalidate(user_id)
+        invalidate_principal(user_id)
 
         return MyPageHabitOut(habit=habit, updated_at=user.updated_at)
 
@@ -76,6 +80,8 @@ class UserService:
         user.conditions = conditions
         self.db.commit()
         self.db.refresh(user)
+        HomeService.invalidate(user_id)
+        invalidate_principal(user_id)
 
         return MyPageConditionOut(conditions=conditions, updated_at=user.updated_at)
     
@@ -88,5 +94,7 @@ class UserService:
 
         self.db.commit()
         self.db.refresh(user)
+        HomeService.invalidate(user_id)
+        invalidate_principal(user_id)
 
         return MyPageAllergiesOut(allergies=allergies, updated_at=user.updated_at)
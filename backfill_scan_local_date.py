@@ -0,0 +1,65 @@
+# backfill_scan_local_date.py
+# scan_history.local_date가 비어 있는 기존 row를 유저 timezone 기준으로 채움
+# 실행: python backfill_scan_local_date.py
+import traceback
+
+from sqlalchemy import bindparam, select, update
+
+from app.core.database import SessionLocal
+from app.core.local_time import to_local_date
+from app.models.scan_history import ScanHistory
+from app.models.user import User
+
+BATCH_SIZE = 1000
+
+
+def run_backfill(batch_size: int = BATCH_SIZE) -> int:
+    db = SessionLocal()
+    total = 0
+    last_id = ""
+    try:
+        while True:
+            # id 기준으로 잘라서 처리 (한 번에 너무 많이 잠그지 않도록)
+            rows = db.execute(
+                select(ScanHistory.id, ScanHistory.scanned_at, User.timezone)
+                .join(User, User.id == ScanHistory.user_id)
+                .where(ScanHistory.local_date.is_(None), ScanHistory.id > last_id)
+                .order_by(ScanHistory.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            db.execute(
+                update(ScanHistory.__table__)
+                .where(ScanHistory.__table__.c.id == bindparam("scan_id"))
+                .values(
+                    local_date=bindparam("new_local_date"),
+                    # local_date만 채우는 것이라 updated_at은 그대로 둠
+                    updated_at=ScanHistory.__table__.c.updated_at,
+                ),
+                [
+                    {"scan_id": scan_id, "new_local_date": to_local_date(scanned_at, tz_name)}
+                    for scan_id, scanned_at, tz_name in rows
+                ],
+            )
+            db.commit()
+
+            total += len(rows)
+            last_id = rows[-1][0]
+            print(f"🚀 {total}개 처리 중...")
+
+        print(f"✅ 총 {total}개의 scan_history.local_date 채우기 완료!")
+        return total
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+        return total
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run_backfill()
@@ -0,0 +1,92 @@
+# benchmark_db_pool.py
+# 커넥션 풀 liveness 방식 비교: pre-ping(checkout마다 ping) vs pool_recycle(오래된 커넥션만 재연결)
+# 같은 DB에 엔진 두 개를 만들어 "checkout -> 짧은 쿼리 -> checkin"을 반복하고 요청당 지연시간과 ping 횟수 출력
+# 운영 DB가 아닌 스테이징/로컬 DB로 실행 (DATABASE_URL 또는 MYSQL_* 환경변수)
+# 실행: python benchmark_db_pool.py [--requests N] [--threads N]
+import argparse
+import threading
+import time
+import traceback
+
+from sqlalchemy import create_engine, text
+
+from app.core.database import DATABASE_URL, pool_options
+
+
+def percentile(sorted_values, q):
+    idx = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def run_case(label: str, pre_ping: bool, requests: int, threads: int) -> None:
+    options = pool_options()
+    options["pool_pre_ping"] = pre_ping
+    options["pool_size"] = max(options["pool_size"], threads)
+    engine = create_engine(DATABASE_URL, **options)
+
+    # dialect ping 호출 수 집계 (pre-ping 왕복 수)
+    pings = [0]
+    do_ping = engine.dialect.do_ping
+
+    def counting_ping(dbapi_connection):
+        pings[0] += 1
+        return do_ping(dbapi_connection)
+
+    engine.dialect.do_ping = counting_ping
+
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(n):
+        local = []
+        for _ in range(n):
+            start = time.perf_counter()
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1")).scalar()
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    try:
+        # 풀 채우기 (첫 연결 비용은 비교에서 제외)
+        worker(threads)
+        latencies.clear()
+        pings[0] = 0
+
+        per_thread = requests // threads
+        started = time.perf_counter()
+        ts = [threading.Thread(target=worker, args=(per_thread,)) for _ in range(threads)]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        print(
+            f"📊 {label:<8} 요청 {len(latencies)}개 | "
+            f"p50 {percentile(latencies, 0.50):.3f}ms p99 {percentile(latencies, 0.99):.3f}ms | "
+            f"{len(latencies) / elapsed:,.0f} req/s | ping {pings[0]}회"
+        )
+    finally:
+        engine.dispose()
+
+
+def run_benchmark(requests: int = 5000, threads: int = 4) -> None:
+    try:
+        print(f"🚀 {DATABASE_URL.split('@')[-1]} 에서 측정 (요청 {requests}개, 스레드 {threads}개)")
+        run_case("pre-ping", True, requests, threads)
+        run_case("recycle", False, requests, threads)
+        print("✅ 측정 완료!")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="커넥션 풀 pre-ping vs recycle 비교")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    run_benchmark(requests=args.requests, threads=args.threads)
@@ -0,0 +1,96 @@
+# benchmark_dependencies.py
+# 요청당 의존성 주입(Depends) 해석 비용 측정
+# 실제 app/dependencies.py 의 서비스 provider를 쓰는 빈 엔드포인트들을 만들고, 의존성이 없는 엔드포인트(/noop)와의
+# 요청당 시간 차이를 출력 (DB 세션은 가짜로 바꿔서 DB 없이 실행, ASGI로 직접 호출해서 네트워크 비용 없음)
+# 실행: python benchmark_dependencies.py [--requests N]
+import argparse
+import asyncio
+import statistics
+import time
+import traceback
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from app.core.config import settings
+from app.core.database import get_db
+from app import dependencies as deps
+
+# 현재 구조와 비교할 수 있도록 AI 서비스가 만들어지는 경우에도 실패하지 않게
+settings.OPENAI_API_KEY = settings.OPENAI_API_KEY or "benchmark"
+
+PROVIDERS = {
+    "scan_history_service": deps.get_scan_history_service,
+    "scan_get_full_service": deps.get_scan_get_full_service,
+    "scan_flow_service": deps.get_scan_flow_service,
+    "user_daily_score_service": deps.get_user_daily_score_service,
+    "user_dal": deps.get_user_dal,
+}
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/noop")
+    async def noop():
+        return None
+
+    for name, provider in PROVIDERS.items():
+        async def endpoint(_=Depends(provider)):
+            return None
+
+        app.add_api_route(f"/{name}", endpoint, methods=["GET"], name=name)
+
+    def fake_db():
+        # 실제 연결 없이 세션 자리만 채움
+        yield None
+
+    app.dependency_overrides[get_db] = fake_db
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    # 요청당 평균 마이크로초 (앞 10%는 워밍업으로 제외)
+    warmup = max(1, requests // 10)
+    for _ in range(warmup):
+        await client.get(path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        res = await client.get(path)
+        res.raise_for_status()
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def run(requests: int, rounds: int) -> None:
+    app = build_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        paths = ["/noop"] + [f"/{name}" for name in PROVIDERS]
+        samples = {path: [] for path in paths}
+        for _ in range(rounds):
+            for path in paths:
+                samples[path].append(await measure(client, path, requests))
+
+    base = statistics.median(samples["/noop"])
+    print(f"📊 /noop: {base:.1f}µs/요청 (의존성 없음, 기준)")
+    for path in paths[1:]:
+        us = statistics.median(samples[path])
+        print(f"📊 {path:<28} {us:8.1f}µs/요청  (DI 오버헤드 {us - base:7.1f}µs)")
+
+
+def run_benchmark(requests: int = 2000, rounds: int = 3) -> None:
+    try:
+        asyncio.run(run(requests, rounds))
+        print("✅ 측정 완료!")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요청당 의존성 주입 비용 측정")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(requests=args.requests, rounds=args.rounds)
@@ -0,0 +1,207 @@
+# benchmark_home.py
+# 홈 화면 조립 비용 측정: 하루 스캔 수가 1 / 50 / 500개인 유저의 홈 (대표 스캔 2개 + 오늘 점수)
+# 임시 SQLite 파일에 유저별로 오늘 + 지난 30일 스캔을 넣고, 홈 캐시를 비운 상태에서 get_home의 시간 / SQL 수 출력
+# 비교용으로 그날 스캔 전체를 읽어 Python에서 상품별로 거르는 예전 방식(get_by_date)도 같이 측정
+# 점수가 dirty인 경우(그날 스캔 점수를 다시 읽어 재계산)와 아닌 경우를 나눠서 봄
+# 설정된 DB는 건드리지 않음
+# 실행: python benchmark_home.py [--scans 1 50 500] [--rounds N]
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import traceback
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from sqlalchemy import create_engine, insert, update
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.core.local_time import local_today
+from app.core.query_stats import count_queries, instrument_query_stats
+from app.dependencies import build_user_daily_score_service
+from app.DAL.scan_history_DAL import ScanHistoryDAL
+from app.models.product import Product
+from app.models.scan_history import ScanHistory
+from app.models.scan_report import ScanReport
+from app.models.user import User
+from app.models.user_daily_score import UserDailyScore
+from app.services.home_service import HOME_SCAN_LIMIT, HomeService
+
+TZ = "Asia/Seoul"
+HISTORY_DAYS = 30
+
+
+def seed(engine, scans_per_day: List[int]) -> None:
+    """
+    유저 bench-{n}: 오늘 포함 HISTORY_DAYS일 동안 하루 n개 스캔 (상품은 n/2종류라 같은 상품 재스캔 포함)
+    """
+    today = local_today(TZ)
+    now = datetime.combine(today, datetime.min.time()) + timedelta(hours=12)
+    with engine.begin() as conn:
+        products = max(scans_per_day) // 2 + 1
+        conn.execute(
+            insert(Product),
+            [
+                {
+                    "id": f"p-{i:08d}",
+                    "name": f"상품 {i}",
+                    "category": "과자",
+                    "image_url": f"https://cdn.example.com/products/{i}.jpg",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(products)
+            ],
+        )
+        for n in scans_per_day:
+            user_id = f"bench-{n}"
+            conn.execute(insert(User), [{"id": user_id, "kakao_user_id": user_id, "timezone": TZ}])
+            scans = []
+            for d in range(HISTORY_DAYS):
+                local_date = today - timedelta(days=d)
+                for i in range(n):
+                    scans.append(
+                        {
+                            "id": f"s-{n}-{d:02d}-{i:05d}",
+                            "user_id": user_id,
+                            "product_id": f"p-{i // 2:08d}",
+                            "scanned_at": now - timedelta(days=d, seconds=i),
+                            "local_date": local_date,
+                            "decision": "caution",
+                            "display_category": "과자",
+                            "summary": "당류가 높아 하루 섭취량에 주의가 필요해요.",
+                            "ai_total_score": 40 + i % 60,
+                            "product_name": f"상품 {i // 2}",
+                            "conditions": ["diabetes"],
+                            "allergies": ["milk"],
+                            "habits": [],
+                            "caution_factors": [{"factor": "sugar", "evaluation": "NO"}],
+                            "dirty": False,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                    )
+            conn.execute(insert(ScanHistory), scans)
+            conn.execute(
+                insert(ScanReport),
+                [
+                    {
+                        "scan_id": s["id"],
+                        "ai_condition_report": "당뇨가 있다면 주의하세요. " * 5,
+                        "ai_total_report": "종합 리포트 " * 20,
+                        "product_nutrition": {"sugars": 27, "sodium": 120},
+                        "product_ingredient": "정제수, 설탕, 구연산",
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for s in scans
+                ],
+            )
+            conn.execute(
+                insert(UserDailyScore),
+                [
+                    {
+                        "user_id": user_id,
+                        "local_date": today,
+                        "score": 70,
+                        "num_scans": n,
+                        "decision_counts": {"caution": n},
+                        "dirty": 0,
+                    }
+                ],
+            )
+
+
+def set_dirty(engine, user_id: str, dirty: int) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            update(UserDailyScore).where(UserDailyScore.user_id == user_id).values(dirty=dirty)
+        )
+
+
+def full_rows_home(db, user_id: str) -> list:
+    """
+    예전 홈 방식: 그날 스캔 전체(리포트 포함)를 읽고 상품별 최신만 남긴 뒤 2개
+    """
+    seen, items = set(), []
+    for scan in ScanHistoryDAL.get_by_date(db, user_id, datetime.combine(local_today(TZ), datetime.min.time())):
+        key = scan.product_id or scan.id
+        if key not in seen:
+            seen.add(key)
+            items.append(scan)
+    return items[:HOME_SCAN_LIMIT]
+
+
+def bounded_home(db, user_id: str) -> dict:
+    HomeService.invalidate(user_id)
+    service = HomeService(
+        db=db,
+        user_daily_score_service=build_user_daily_score_service(db),
+        scan_history_dal=ScanHistoryDAL(),
+    )
+    return service.get_home(user_id=user_id, tz_name=TZ)
+
+
+def measure(session_factory, fn: Callable, rounds: int, before: Callable = None) -> Tuple[float, int]:
+    """
+    (중앙값 ms, 마지막 실행의 SQL 수) - 매번 새 세션
+    """
+    times: List[float] = []
+    queries = 0
+    for _ in range(rounds):
+        if before is not None:
+            before()
+        db = session_factory()
+        try:
+            with count_queries() as q:
+                started = time.perf_counter()
+                fn(db)
+                times.append((time.perf_counter() - started) * 1000)
+            queries = q.count
+        finally:
+            db.close()
+    return statistics.median(times), queries
+
+
+def run_benchmark(scans_per_day: List[int], rounds: int = 20) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench_home_"), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(engine)
+        instrument_query_stats(engine)
+        seed(engine, scans_per_day)
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+
+        print(f"🚀 하루 스캔 {scans_per_day}개 x {HISTORY_DAYS}일, 측정 {rounds}회")
+        for n in scans_per_day:
+            user_id = f"bench-{n}"
+            cases = {
+                "home          ": (lambda db: bounded_home(db, user_id), None),
+                "home (dirty)  ": (
+                    lambda db: bounded_home(db, user_id),
+                    lambda: set_dirty(engine, user_id, 1),
+                ),
+                "full day rows ": (lambda db: full_rows_home(db, user_id), None),
+            }
+            for name, (fn, before) in cases.items():
+                ms, queries = measure(session_factory, fn, rounds, before)
+                print(f"📊 scans/day={n:<4} {name} {ms:8.2f}ms  SQL {queries}개")
+        print("✅ 측정 완료!")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+    finally:
+        engine.dispose()
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="하루 스캔 수별 홈 조립 비용 측정")
+    parser.add_argument("--scans", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    run_benchmark(scans_per_day=args.scans, rounds=args.rounds)
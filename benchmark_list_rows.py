@@ -0,0 +1,167 @@
+# benchmark_list_rows.py
+# 목록 조회 비용 측정: ORM 객체로 읽는 list()와 읽기 전용 Row로 읽는 list_rows() 비교
+# 임시 SQLite 파일에 상품 / 스캔 기록을 n개씩 넣고, 조회 + 응답 dict 변환까지의 시간과 최대 메모리(tracemalloc)를 출력
+# 설정된 DB는 건드리지 않음
+# 실행: python benchmark_list_rows.py [--sizes 1000 5000] [--rounds N]
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+import traceback
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Tuple
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.core.responses import rows_to_dicts
+from app.DAL.product_DAL import ProductDAL
+from app.DAL.scan_history_DAL import ScanHistoryDAL
+from app.models.product import Product
+from app.models.scan_history import ScanHistory
+from app.models.scan_report import ScanReport
+from app.models.user import User
+from app.schemas.product import ProductOut
+from app.schemas.scan_history import ScanHistoryOut
+
+
+def seed(engine, n: int) -> None:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": "bench-user", "kakao_user_id": "bench"}])
+        conn.execute(
+            insert(Product),
+            [
+                {
+                    "id": f"p-{i:08d}",
+                    "barcode": f"880{i:010d}",
+                    "barcode_kind": "EAN13",
+                    "brand": "브랜드",
+                    "name": f"상품 {i}",
+                    "category": "과자",
+                    "size_text": "120g",
+                    "image_url": f"https://cdn.example.com/products/{i}.jpg",
+                    "country": "KR",
+                    "score": 70 + i % 30,
+                    "allergens": "우유, 대두",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(n)
+            ],
+        )
+        conn.execute(
+            insert(ScanHistory),
+            [
+                {
+                    "id": f"s-{i:08d}",
+                    "user_id": "bench-user",
+                    "product_id": f"p-{i:08d}",
+                    "scanned_at": now - timedelta(minutes=i),
+                    "local_date": date(2025, 1, 1),
+                    "decision": "caution",
+                    "display_category": "과자",
+                    "summary": "당류가 높아 하루 섭취량에 주의가 필요해요.",
+                    "ai_total_score": 64,
+                    "conditions": ["diabetes"],
+                    "allergies": ["milk"],
+                    "habits": [],
+                    "caution_factors": [{"factor": "sugar", "evaluation": "NO"}],
+                    "dirty": False,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(n)
+            ],
+        )
+        conn.execute(
+            insert(ScanReport),
+            [
+                {
+                    "scan_id": f"s-{i:08d}",
+                    "ai_allergy_report": "알레르기 성분 없음",
+                    "ai_condition_report": "당뇨가 있다면 주의하세요. " * 5,
+                    "ai_total_report": "종합 리포트 " * 20,
+                    "ai_allergy_brief": "없음",
+                    "ai_condition_brief": "주의",
+                    "product_nutrition": {"sugars": 27, "sodium": 120},
+                    "product_ingredient": "정제수, 설탕, 구연산",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(n)
+            ],
+        )
+
+
+def measure(session_factory, fn: Callable, rounds: int) -> Tuple[float, float]:
+    """
+    (중앙값 ms, 최대 메모리 MB) - 매번 새 세션 (identity map이 비어 있는 상태에서 시작)
+    tracemalloc은 시간을 크게 늘리므로 시간 측정과 메모리 측정은 따로 실행
+    """
+    times: List[float] = []
+    for _ in range(rounds):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            fn(db)
+            times.append((time.perf_counter() - started) * 1000)
+        finally:
+            db.close()
+
+    db = session_factory()
+    try:
+        tracemalloc.start()
+        fn(db)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        db.close()
+    return statistics.median(times), peak / 1024 / 1024
+
+
+def run_benchmark(sizes: List[int], rounds: int = 5) -> None:
+    for n in sizes:
+        path = os.path.join(tempfile.mkdtemp(prefix="bench_list_rows_"), "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        try:
+            Base.metadata.create_all(engine)
+            seed(engine, n)
+            session_factory = sessionmaker(bind=engine, autoflush=False)
+
+            cases = {
+                "products ORM  ": lambda db: rows_to_dicts(ProductDAL.list(db, limit=n), ProductOut),
+                "products rows ": lambda db: rows_to_dicts(ProductDAL.list_rows(db, limit=n), ProductOut),
+                "scans ORM     ": lambda db: rows_to_dicts(
+                    ScanHistoryDAL.list(db, limit=n, user_id="bench-user"), ScanHistoryOut
+                ),
+                "scans rows    ": lambda db: rows_to_dicts(
+                    ScanHistoryDAL.list_rows(db, limit=n, user_id="bench-user"), ScanHistoryOut
+                ),
+            }
+            print(f"🚀 n={n}")
+            for name, fn in cases.items():
+                ms, mb = measure(session_factory, fn, rounds)
+                print(f"📊 {name} {ms:9.1f}ms  peak {mb:7.2f}MB")
+        except Exception as e:
+            print(f"❌ 오류 발생: {e}")
+            traceback.print_exc()
+            return
+        finally:
+            engine.dispose()
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+
+    print("✅ 측정 완료!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="목록 조회 ORM vs Row 비용 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(sizes=args.sizes, rounds=args.rounds)
@@ -0,0 +1,156 @@
+# benchmark_pagination.py
+# 목록 페이지 깊이별 지연시간 비교: skip/limit(offset) vs cursor(keyset)
+# 임시 SQLite 파일에 한 유저의 스캔 기록 / 상품을 n개씩 넣고, 같은 페이지를 두 방식으로 읽어서 페이지당 시간 출력
+#   offset : ScanHistoryDAL.list_rows(skip=깊이) / ProductDAL.list_rows(skip=깊이) -> 앞의 row를 읽고 버림
+#   cursor : 바로 앞 row의 정렬 키로 만든 커서 -> (user_id, scanned_at, id) / PK 인덱스에서 바로 시작
+# cursor 쪽은 깊이와 상관없이 평평해야 정상
+# 설정된 DB는 건드리지 않음
+# 실행: python benchmark_pagination.py [--rows N] [--depths 0 1000 10000 ...] [--limit N] [--rounds N]
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import traceback
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.core.pagination import encode_cursor
+from app.DAL.product_DAL import ProductDAL
+from app.DAL.scan_history_DAL import ScanHistoryDAL
+from app.models.product import Product
+from app.models.scan_history import ScanHistory
+from app.models.user import User
+
+USER_ID = "bench-user"
+# 다른 유저 기록도 섞어서 user_id 조건이 실제로 걸러야 하게 함
+OTHER_USER_ID = "bench-other"
+
+
+def seed(engine, n: int) -> None:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [{"id": USER_ID, "kakao_user_id": "bench"}, {"id": OTHER_USER_ID, "kakao_user_id": "other"}],
+        )
+        conn.execute(
+            insert(Product),
+            [
+                {
+                    "id": f"p-{i:08d}",
+                    "name": f"상품 {i}",
+                    "category": "과자",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(n)
+            ],
+        )
+        conn.execute(
+            insert(ScanHistory),
+            [
+                {
+                    "id": f"s-{i:08d}",
+                    "user_id": USER_ID if i % 4 else OTHER_USER_ID,
+                    "scanned_at": now - timedelta(seconds=i * 30),
+                    "local_date": date(2025, 1, 1) - timedelta(days=i // 2880),
+                    "decision": "caution",
+                    "display_category": "과자",
+                    "summary": "당류가 높아 하루 섭취량에 주의가 필요해요.",
+                    "product_name": f"상품 {i}",
+                    "dirty": False,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(n)
+            ],
+        )
+
+
+def cursor_at(db, depth: int, query_fn: Callable, order) -> Optional[str]:
+    """
+    depth번째 row 바로 앞 row의 정렬 키 -> 커서 (클라이언트가 앞 페이지에서 받았을 값)
+    """
+    if depth == 0:
+        return None
+    prev = query_fn(db, skip=depth - 1, limit=1)[0]
+    return encode_cursor(*[getattr(prev, col.key) for col, _ in order])
+
+
+def median_ms(session_factory, fn: Callable, rounds: int) -> float:
+    times: List[float] = []
+    for _ in range(rounds):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            fn(db)
+            times.append((time.perf_counter() - started) * 1000)
+        finally:
+            db.close()
+    return statistics.median(times)
+
+
+def run_benchmark(rows: int, depths: List[int], limit: int = 20, rounds: int = 20) -> None:
+    path = os.path.join(tempfile.mkdtemp(prefix="bench_pagination_"), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    try:
+        Base.metadata.create_all(engine)
+        seed(engine, rows)
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+
+        cases = {
+            "scans   ": (
+                lambda db, **kw: ScanHistoryDAL.list_rows(db, user_id=USER_ID, **kw),
+                ScanHistoryDAL.LIST_ORDER,
+            ),
+            "products": (
+                lambda db, **kw: ProductDAL.list_rows(db, **kw),
+                ProductDAL.LIST_ORDER,
+            ),
+        }
+        print(f"🚀 row {rows}개, 페이지 {limit}개, 측정 {rounds}회")
+        for name, (query_fn, order) in cases.items():
+            for depth in depths:
+                db = session_factory()
+                try:
+                    cursor = cursor_at(db, depth, query_fn, order)
+                    # 두 방식이 같은 페이지를 읽는지 확인
+                    same = [r.id for r in query_fn(db, skip=depth, limit=limit)] == [
+                        r.id for r in query_fn(db, cursor=cursor, limit=limit)
+                    ]
+                finally:
+                    db.close()
+                if not same:
+                    raise RuntimeError(f"{name.strip()} depth={depth}: offset / cursor 페이지가 다름")
+
+                offset_ms = median_ms(
+                    session_factory, lambda db: query_fn(db, skip=depth, limit=limit), rounds
+                )
+                cursor_ms = median_ms(
+                    session_factory, lambda db: query_fn(db, cursor=cursor, limit=limit), rounds
+                )
+                print(f"📊 {name} depth={depth:<7} offset {offset_ms:8.2f}ms  cursor {cursor_ms:8.2f}ms")
+        print("✅ 측정 완료!")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+    finally:
+        engine.dispose()
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="페이지 깊이별 offset vs cursor 지연시간 비교")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1000, 10000, 50000, 100000])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    run_benchmark(rows=args.rows, depths=args.depths, limit=args.limit, rounds=args.rounds)
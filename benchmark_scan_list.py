@@ -0,0 +1,208 @@
+# benchmark_scan_list.py
+# 스캔 목록 화면 비용 측정: 기록이 많은 유저의 목록을 세 가지 방식으로 읽어서 비교
+#   ORM 전체   : 리포트 그룹 undefer + scan_report까지 (ScanHistoryDAL.list, 예전 목록 조회와 같은 양)
+#   ORM 기본   : ScanHistory만 (리포트 TEXT/JSON 컬럼은 deferred라 읽지 않음)
+#   projection : SUMMARY_COLUMNS만 (list_summaries_by_date / 홈과 같은 컬럼)
+# 세 경우 모두 같은 목록 응답({"scan": [...]})을 만들고, 시간 / 최대 메모리(tracemalloc) /
+# DB에서 읽어 온 값의 바이트 / 응답 본문 바이트를 출력
+# 참고로 ScanHistoryOut 전체 필드를 내려보낼 때의 응답 바이트도 같이 출력
+# 임시 SQLite 파일을 쓰므로 설정된 DB는 건드리지 않음
+# 실행: python benchmark_scan_list.py [--sizes 1000 10000] [--rounds N]
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+import traceback
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+import orjson
+from sqlalchemy import create_engine, insert, inspect as sa_inspect
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.core.responses import FastJSONResponse, rows_to_dicts
+from app.DAL.scan_history_DAL import SUMMARY_COLUMNS, ScanHistoryDAL
+from app.models.scan_history import ScanHistory
+from app.models.scan_report import ScanReport
+from app.models.user import User
+from app.schemas.scan_history import ScanHistoryOut
+
+USER_ID = "bench-user"
+RISK_LEVEL = {"avoid": "red", "caution": "yellow", "ok": "green"}
+
+
+def seed(engine, n: int) -> None:
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"id": USER_ID, "kakao_user_id": "bench"}])
+        conn.execute(
+            insert(ScanHistory),
+            [
+                {
+                    "id": f"s-{i:08d}",
+                    "user_id": USER_ID,
+                    "scanned_at": now - timedelta(minutes=i),
+                    "local_date": date(2025, 1, 1) - timedelta(days=i // 20),
+                    "decision": "caution",
+                    "display_category": "과자",
+                    "summary": "당류가 높아 하루 섭취량에 주의가 필요해요.",
+                    "image_url": f"https://cdn.example.com/scans/{i}.jpg",
+                    "product_name": f"상품 {i}",
+                    "ai_total_score": 64,
+                    "conditions": ["diabetes", "hypertension"],
+                    "allergies": ["milk", "soy"],
+                    "habits": ["diet"],
+                    "caution_factors": [{"factor": "sugar", "evaluation": "NO"}] * 3,
+                    "dirty": False,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(n)
+            ],
+        )
+        conn.execute(
+            insert(ScanReport),
+            [
+                {
+                    "scan_id": f"s-{i:08d}",
+                    "ai_allergy_report": "우유와 대두가 들어 있어요. " * 10,
+                    "ai_condition_report": "당뇨가 있다면 주의하세요. " * 30,
+                    "ai_total_report": "종합 리포트 " * 100,
+                    "ai_allergy_brief": "우유, 대두",
+                    "ai_condition_brief": "당류 주의",
+                    "product_nutrition": {"sugars": 27, "sodium": 120, "fat": 9, "protein": 2},
+                    "product_ingredient": "정제수, 설탕, 구연산, 혼합제제, 합성향료 " * 5,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(n)
+            ],
+        )
+
+
+def _base_query(db, *entities):
+    return (
+        db.query(*entities)
+        .filter(ScanHistory.user_id == USER_ID, ScanHistory.deleted_at.is_(None))
+        .order_by(ScanHistory.scanned_at.desc(), ScanHistory.id.desc())
+    )
+
+
+def loaded_bytes(rows: List[Any]) -> int:
+    """
+    조회 결과에 실제로 실려 온 값의 JSON 바이트 (ORM은 로드된 속성만, deferred 컬럼은 빠짐)
+    """
+    total = 0
+    for row in rows:
+        if isinstance(row, Row):
+            values: Dict[str, Any] = dict(row._mapping)
+        else:
+            state = sa_inspect(row).dict
+            values = {k: v for k, v in state.items() if not k.startswith("_") and k != "report"}
+            if state.get("report") is not None:
+                values.update(
+                    (k, v) for k, v in sa_inspect(state["report"]).dict.items() if not k.startswith("_")
+                )
+        total += len(orjson.dumps(values, default=str))
+    return total
+
+
+def list_payload(rows: List[Any]) -> Dict[str, Any]:
+    # ScanHistoryService.get_scan_list_by_date와 같은 응답 형태
+    return {
+        "scan": [
+            {
+                "name": s.product_name if not s.dirty else s.display_name,
+                "category": s.display_category,
+                "scanID": s.id,
+                "riskLevel": RISK_LEVEL.get((s.decision or "ok").lower(), "green"),
+                "summary": s.summary,
+                "url": s.image_url,
+            }
+            for s in rows
+        ]
+    }
+
+
+def measure(session_factory, load: Callable, rounds: int) -> Tuple[float, float, int, int]:
+    """
+    (중앙값 ms, 최대 메모리 MB, 읽은 값 바이트, 응답 바이트) - 매번 새 세션
+    tracemalloc은 시간을 크게 늘리므로 시간 측정과 메모리 측정은 따로 실행
+    """
+    times: List[float] = []
+    for _ in range(rounds):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            FastJSONResponse(list_payload(load(db)))
+            times.append((time.perf_counter() - started) * 1000)
+        finally:
+            db.close()
+
+    db = session_factory()
+    try:
+        tracemalloc.start()
+        rows = load(db)
+        body = FastJSONResponse(list_payload(rows)).body
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return statistics.median(times), peak / 1024 / 1024, loaded_bytes(rows), len(body)
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        db.close()
+
+
+def run_benchmark(sizes: List[int], rounds: int = 5) -> None:
+    for n in sizes:
+        path = os.path.join(tempfile.mkdtemp(prefix="bench_scan_list_"), "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        try:
+            Base.metadata.create_all(engine)
+            seed(engine, n)
+            session_factory = sessionmaker(bind=engine, autoflush=False)
+
+            cases = {
+                "ORM 전체   ": lambda db: ScanHistoryDAL.list(db, limit=n, user_id=USER_ID),
+                "ORM 기본   ": lambda db: _base_query(db, ScanHistory).limit(n).all(),
+                "projection ": lambda db: _base_query(db, *SUMMARY_COLUMNS).limit(n).all(),
+            }
+            print(f"🚀 스캔 기록 n={n}")
+            for name, load in cases.items():
+                ms, mb, read, body = measure(session_factory, load, rounds)
+                print(
+                    f"📊 {name} {ms:9.1f}ms  peak {mb:7.2f}MB  "
+                    f"읽은 값 {read / 1024:9.1f}KB  응답 {body / 1024:8.1f}KB"
+                )
+
+            db = session_factory()
+            try:
+                full = FastJSONResponse(
+                    rows_to_dicts(ScanHistoryDAL.list(db, limit=n, user_id=USER_ID), ScanHistoryOut)
+                ).body
+                print(f"📊 (참고) ScanHistoryOut 전체 필드 응답 {len(full) / 1024:8.1f}KB")
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"❌ 오류 발생: {e}")
+            traceback.print_exc()
+            return
+        finally:
+            engine.dispose()
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+
+    print("✅ 측정 완료!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="스캔 목록 전체 row vs deferred vs projection 비용 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(sizes=args.sizes, rounds=args.rounds)
@@ -0,0 +1,189 @@
+# benchmark_serialization.py
+# 응답 직렬화 비용 측정: 기존 경로(response_model 검증 + jsonable_encoder + json.dumps)와
+# fast_json 경로(검증 없이 dict -> orjson)를 payload 크기별로 비교
+# DB 없이 메모리의 ORM 객체 / dict로 엔드포인트를 만들고 ASGI로 직접 호출 (네트워크 비용 없음)
+# 실행: python benchmark_serialization.py [--sizes 1 10 100 1000] [--requests N]
+import argparse
+import asyncio
+import statistics
+import time
+import traceback
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import FastAPI, Response
+
+from app.core.responses import FastJSONResponse, fast_json, rows_to_dicts
+from app.models.product import Product
+from app.schemas.product import ProductOut
+from app.schemas.scan_full import ScanFullOut
+from app.schemas.scan_history import ScanHistoryListOut, ScanSummaryOut
+
+
+def make_products(n: int) -> List[Product]:
+    now = datetime(2025, 1, 1, 12, 0, 0, 123000)
+    return [
+        Product(
+            id=f"00000000-0000-0000-0000-{i:012d}",
+            barcode=f"880{i:010d}",
+            barcode_kind="EAN13",
+            brand="브랜드",
+            name=f"상품 {i}",
+            category="과자",
+            size_text="120g",
+            image_url=f"https://cdn.example.com/products/{i}.jpg",
+            country="KR",
+            notes=None,
+            score=70 + i % 30,
+            allergens="우유, 대두",
+            trace_allergens=None,
+            created_at=now,
+            updated_at=now + timedelta(seconds=i),
+        )
+        for i in range(n)
+    ]
+
+
+def make_scan_summaries(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"상품 {i}",
+            "category": "음료",
+            "scanID": f"scan-{i}",
+            "riskLevel": ("green", "yellow", "red")[i % 3],
+            "summary": "당류가 높아 하루 섭취량에 주의가 필요해요.",
+            "url": f"https://cdn.example.com/scans/{i}.jpg",
+        }
+        for i in range(n)
+    ]
+
+
+def make_scan_full(n: int) -> Dict[str, Any]:
+    # 대체 상품 리포트 n개 (리포트 개수로 상세 응답 크기 조절)
+    block = {"brief_report": "알레르기 성분 없음", "face": "GOOD", "report": "상세 설명 " * 20}
+    return {
+        "product": {"name": "상품", "category": "음료", "image_url": "https://cdn.example.com/p.jpg"},
+        "scan": {
+            "summary": "당류가 높아 하루 섭취량에 주의가 필요해요.",
+            "score": 64,
+            "reports": {
+                "allergies": block,
+                "condition": {**block, "face": "NOT BAD"},
+                "alternatives": [block] * n,
+                "vegan": block,
+            },
+            "caution_factors": [{"factor": "hypertension", "evaluation": "NO"}],
+        },
+        "nutrition": {
+            "carbs_g": 31.5, "protein_g": 2.0, "sodium_mg": 120.0, "sugar_g": 27.0, "fat_g": 0.5,
+            "trans_fat_g": 0.0, "sat_fat_g": 0.1, "cholesterol_mg": 0.0, "calories": 140.0, "per_serving_grams": 250.0,
+        },
+        "ingredient": {"text": "정제수, 설탕, 구연산"},
+    }
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    payloads: Dict[str, Any] = {}
+
+    # 기존 방식: ORM 객체 / 모델을 반환 -> FastAPI가 검증 후 jsonable_encoder + json.dumps
+    @app.get("/products/default/{n}", response_model=List[ProductOut])
+    def products_default(n: int):
+        return payloads[f"products:{n}"]
+
+    @app.get("/products/fast/{n}", response_model=List[ProductOut])
+    def products_fast(n: int, response: Response):
+        return fast_json(rows_to_dicts(payloads[f"products:{n}"], ProductOut), response)
+
+    @app.get("/scan-list/default/{n}", response_model=ScanHistoryListOut)
+    def scan_list_default(n: int):
+        return ScanHistoryListOut(scan=[ScanSummaryOut(**s) for s in payloads[f"scans:{n}"]])
+
+    @app.get("/scan-list/fast/{n}", response_model=ScanHistoryListOut)
+    def scan_list_fast(n: int):
+        return fast_json({"scan": payloads[f"scans:{n}"]})
+
+    @app.get("/scan-full/default/{n}", response_model=ScanFullOut)
+    def scan_full_default(n: int):
+        return ScanFullOut.model_validate(payloads[f"full:{n}"])
+
+    @app.get("/scan-full/fast/{n}", response_model=ScanFullOut)
+    def scan_full_fast(n: int):
+        return fast_json(payloads[f"full:{n}"])
+
+    # 홈: dict 반환 (검증은 Any라 가볍고 jsonable_encoder + json.dumps 비용만)
+    @app.get("/home/default/{n}")
+    def home_default(n: int) -> Dict[str, Any]:
+        return {"scan": payloads[f"scans:{n}"], "todayScore": 72}
+
+    @app.get("/home/fast/{n}")
+    def home_fast(n: int) -> Dict[str, Any]:
+        return FastJSONResponse({"scan": payloads[f"scans:{n}"], "todayScore": 72})
+
+    app.state.payloads = payloads
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    # 요청당 평균 마이크로초 (앞 10%는 워밍업으로 제외)
+    for _ in range(max(1, requests // 10)):
+        await client.get(path)
+    started = time.perf_counter()
+    for _ in range(requests):
+        res = await client.get(path)
+        res.raise_for_status()
+    return (time.perf_counter() - started) / requests * 1_000_000
+
+
+async def run(sizes: List[int], requests: int, rounds: int) -> None:
+    app = build_app()
+    for n in sizes:
+        app.state.payloads[f"products:{n}"] = make_products(n)
+        app.state.payloads[f"scans:{n}"] = make_scan_summaries(n)
+        app.state.payloads[f"full:{n}"] = make_scan_full(n)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for kind in ("products", "scan-list", "scan-full", "home"):
+            for n in sizes:
+                default_path, fast_path = f"/{kind}/default/{n}", f"/{kind}/fast/{n}"
+
+                # 두 경로의 JSON 내용이 같은지 먼저 확인
+                a = (await client.get(default_path)).json()
+                b = (await client.get(fast_path)).json()
+                if a != b:
+                    raise AssertionError(f"{kind} n={n}: 응답 내용이 다름")
+
+                # 요청 수는 payload가 클수록 줄여서 라운드당 시간을 비슷하게
+                count = max(20, requests // max(1, n // 10))
+                default_us, fast_us = [], []
+                for _ in range(rounds):
+                    default_us.append(await measure(client, default_path, count))
+                    fast_us.append(await measure(client, fast_path, count))
+
+                d, f = statistics.median(default_us), statistics.median(fast_us)
+                size = len((await client.get(fast_path)).content)
+                print(
+                    f"📊 {kind:<10} n={n:<5} {size / 1024:8.1f}KB  "
+                    f"default {d:9.1f}µs  fast {f:9.1f}µs  ({d / f:4.1f}x)"
+                )
+
+
+def run_benchmark(sizes: List[int], requests: int = 1000, rounds: int = 3) -> None:
+    try:
+        asyncio.run(run(sizes, requests, rounds))
+        print("✅ 측정 완료!")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="응답 직렬화 비용 측정 (payload 크기별)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(sizes=args.sizes, requests=args.requests, rounds=args.rounds)
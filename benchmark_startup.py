@@ -0,0 +1,87 @@
+# benchmark_startup.py
+# 앱 시작 시간 측정: 새 프로세스에서 "import app.main" 시간과 startup 훅(warm-up 포함) 시간을 여러 번 재서 중앙값 출력
+# 마지막에 python -X importtime 결과로 import가 오래 걸리는 모듈 상위 N개 출력
+# 실행: python benchmark_startup.py [--runs N] [--top N]
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import traceback
+
+CHILD_CODE = """
+import json, time
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app.main.app):
+    t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "startup_ms": (t2 - t1) * 1000}))
+"""
+
+
+def run_child(code: str, *args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    # 측정 중에는 점수 워커를 띄우지 않음
+    env.setdefault("SCORE_WORKER_ENABLED", "false")
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_profile(top: int):
+    """
+    python -X importtime 출력 -> (모듈, self ms, 누적 ms) 모듈 자체 실행 시간(self) 기준 상위 N개
+    """
+    proc = run_child("import app.main", "-X", "importtime")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if not parts[0].isdigit():
+            continue
+        self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2]
+        rows.append((name, self_us / 1000, cumulative_us / 1000))
+
+    return sorted(rows, key=lambda r: r[1], reverse=True)[:top]
+
+
+def run_benchmark(runs: int = 5, top: int = 15) -> None:
+    try:
+        results = []
+        for i in range(runs):
+            proc = run_child(CHILD_CODE)
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+            print(f"🚀 {i + 1}/{runs}: import {results[-1]['import_ms']:.0f}ms, startup {results[-1]['startup_ms']:.0f}ms")
+
+        import_ms = statistics.median(r["import_ms"] for r in results)
+        startup_ms = statistics.median(r["startup_ms"] for r in results)
+        print(f"📊 중앙값: import {import_ms:.0f}ms + startup {startup_ms:.0f}ms = {import_ms + startup_ms:.0f}ms")
+
+        print(f"📊 import 시간(self) 상위 {top}개 (ms)")
+        for name, self_ms, cumulative_ms in import_profile(top):
+            print(f"   {self_ms:8.1f}  (누적 {cumulative_ms:7.1f})  {name}")
+        print("✅ 측정 완료!")
+
+    except subprocess.CalledProcessError as e:
+        print(f"❌ 오류 발생: {e}\n{e.stderr}")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="앱 import / startup 시간 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    run_benchmark(runs=args.runs, top=args.top)
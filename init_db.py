@@ -0,0 +1,44 @@
+# init_db.py
+# 모델 기준으로 없는 테이블을 생성 (이미 있는 테이블은 건드리지 않음, 컬럼 변경은 반영 안 됨)
+# 예전에는 앱 import 시점(app/main.py)에 create_all을 실행했지만 워커 시작 / --reload 마다 DB 왕복이 생기고
+# DB가 잠깐 안 떠 있으면 앱이 시작되지 않아서 별도 명령으로 분리
+# - 로컬 SQLite 모드: 처음 한 번 실행 후 python migration.py 로 상품 데이터 적재
+# - 운영 MySQL: sql/*.mysql.sql 을 순서대로 적용 (이 스크립트는 빈 개발 DB용)
+# 실행: python init_db.py
+import traceback
+
+from sqlalchemy import inspect
+
+from app.core.database import Base, engine
+
+# Base.metadata에 모든 테이블이 등록되도록 모델 import
+from app.models.user import User  # noqa: F401
+from app.models.product import Product  # noqa: F401
+from app.models.nutrition import Nutrition  # noqa: F401
+from app.models.ingredient import Ingredient  # noqa: F401
+from app.models.scan_history import ScanHistory  # noqa: F401
+from app.models.scan_report import ScanReport  # noqa: F401
+from app.models.user_daily_score import UserDailyScore  # noqa: F401
+from app.models.user_score_rollup import UserWeeklyScore, UserMonthlyScore  # noqa: F401
+from app.models.user_session import UserSession  # noqa: F401
+
+
+def run_init_db() -> None:
+    try:
+        existing = set(inspect(engine).get_table_names())
+        Base.metadata.create_all(bind=engine)
+
+        created = [name for name in Base.metadata.tables if name not in existing]
+        for name in created:
+            print(f"🚀 테이블 생성: {name}")
+        print(
+            f"✅ 테이블 {len(Base.metadata.tables)}개 확인 완료! 새로 생성 {len(created)}개 "
+            f"({engine.url.render_as_string(hide_password=True)})"
+        )
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    run_init_db()
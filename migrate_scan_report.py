@@ -0,0 +1,135 @@
+# migrate_scan_report.py
+# scan_history에 있던 AI 리포트 본문을 scan_report 테이블로 복사 (sql/005 이후 실행)
+# id 순으로 잘라서 INSERT ... SELECT upsert 하므로 서비스 중에도, 여러 번 실행해도 안전
+# - 이미 scan_report row가 있으면 NULL인 컬럼만 예전 컬럼 값으로 채움 (새 코드가 쓴 값은 유지)
+# - 배포(005의 3단계) 직후 새 코드가 본문 없이 만든 row(이름 수정 등)를 채울 때는
+#   그 row의 저장된 상세 응답을 비우고 scan_history.updated_at을 올려서 다시 만들게 함 (ETag도 바뀜)
+# 실행: python migrate_scan_report.py
+import traceback
+
+from sqlalchemy import and_, column, func, inspect, null, or_, select, table, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.core.database import SessionLocal, engine
+from app.models.scan_report import ScanReport, REPORT_FIELDS
+
+BATCH_SIZE = 500
+
+# 본문 컬럼으로 만든 상세 응답 (본문을 새로 채우면 같이 비움)
+DETAIL_FIELDS = ("detail_payload", "detail_version")
+
+
+def _upsert(dialect: str, fields: list, source):
+    """
+    scan_report에 INSERT ... SELECT, scan_id가 이미 있으면 NULL인 컬럼만 채움
+    """
+    report = ScanReport.__table__
+    columns = ["scan_id", "created_at", "updated_at", *fields]
+    if dialect == "mysql":
+        stmt = mysql_insert(report).from_select(columns, source)
+        return stmt.on_duplicate_key_update(
+            **{f: func.coalesce(report.c[f], stmt.inserted[f]) for f in fields}
+        )
+    stmt = sqlite_insert(report).from_select(columns, source)
+    return stmt.on_conflict_do_update(
+        index_elements=["scan_id"],
+        set_={f: func.coalesce(report.c[f], stmt.excluded[f]) for f in fields},
+    )
+
+
+def run_migration(batch_size: int = BATCH_SIZE) -> int:
+    # 006으로 이미 지운 컬럼은 건너뜀
+    legacy_columns = {c["name"] for c in inspect(engine).get_columns("scan_history")}
+    fields = [f for f in REPORT_FIELDS if f in legacy_columns]
+    if not fields:
+        print("✅ scan_history에 옮길 리포트 컬럼이 없습니다.")
+        return 0
+
+    # 모델에는 더 이상 없는 컬럼이라 가벼운 table()로 직접 지정
+    legacy = table(
+        "scan_history",
+        column("id"),
+        column("created_at"),
+        column("updated_at"),
+        *[column(f) for f in fields],
+    )
+    report = ScanReport.__table__
+    text_fields = [f for f in fields if f not in DETAIL_FIELDS]
+
+    db = SessionLocal()
+    dialect = db.get_bind().dialect.name
+    total = 0
+    refilled = 0
+    last_id = ""
+    try:
+        while True:
+            # 이번 청크의 마지막 id만 먼저 구함 (PK 범위로 잠금 범위를 작게)
+            ids = db.execute(
+                select(legacy.c.id)
+                .where(legacy.c.id > last_id)
+                .order_by(legacy.c.id)
+                .limit(batch_size)
+            ).scalars().all()
+            if not ids:
+                break
+            upper_id = ids[-1]
+            in_chunk = and_(legacy.c.id > last_id, legacy.c.id <= upper_id)
+
+            # 본문 없이 먼저 만들어진 scan_report row (이번 upsert로 본문이 채워짐)
+            stale_ids = []
+            if text_fields:
+                stale_ids = db.execute(
+                    select(report.c.scan_id)
+                    .join(legacy, legacy.c.id == report.c.scan_id)
+                    .where(
+                        in_chunk,
+                        or_(*[and_(report.c[f].is_(None), legacy.c[f].isnot(None)) for f in text_fields]),
+                    )
+                ).scalars().all()
+
+            result = db.execute(
+                _upsert(
+                    dialect,
+                    fields,
+                    select(
+                        legacy.c.id,
+                        legacy.c.created_at,
+                        legacy.c.updated_at,
+                        *[legacy.c[f] for f in fields],
+                    ).where(in_chunk),
+                )
+            )
+
+            if stale_ids:
+                db.execute(
+                    update(report)
+                    .where(report.c.scan_id.in_(stale_ids))
+                    .values(detail_payload=null(), detail_version=null())
+                )
+                db.execute(
+                    update(legacy)
+                    .where(legacy.c.id.in_(stale_ids))
+                    .values(updated_at=func.now())
+                )
+            db.commit()
+
+            total += result.rowcount or 0
+            refilled += len(stale_ids)
+            last_id = upper_id
+            print(f"🚀 {last_id}까지 확인, {total}개 복사 (본문 다시 채움 {refilled}개)...")
+
+        print(f"✅ 총 {total}개의 scan_report 복사 완료! (본문 다시 채움 {refilled}개)")
+        return total
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+        return total
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,40 @@
+# purge_sessions.py
+# 만료된 로그인 세션(user_session) 정리
+# expires_at 인덱스로 만료 row를 SESSION_PURGE_BATCH_SIZE개씩 골라 PK로 삭제하고 배치마다 커밋
+# (한 번에 지우면 큰 트랜잭션 / 긴 잠금이 생기므로 잘라서 처리). cron 등으로 주기 실행
+# 실행: python purge_sessions.py
+import traceback
+from datetime import datetime, timezone
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.DAL.user_session_DAL import UserSessionDAL
+
+
+def run_purge(batch_size: int = settings.SESSION_PURGE_BATCH_SIZE) -> int:
+    db = SessionLocal()
+    total = 0
+    # 시작 시각 기준으로 고정 (실행 중에 새로 만료되는 세션은 다음 실행에서)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    try:
+        while True:
+            deleted = UserSessionDAL.purge_expired(db, now=now, batch_size=batch_size)
+            if deleted == 0:
+                break
+            total += deleted
+            print(f"🚀 만료 세션 {total}개 삭제...")
+
+        print(f"✅ 총 {total}개의 만료 세션 정리 완료!")
+        return total
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+        return total
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run_purge()
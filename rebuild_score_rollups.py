@@ -0,0 +1,51 @@
+# rebuild_score_rollups.py
+# user_daily_score에서 주간/월간 집계(user_weekly_score / user_monthly_score)를 처음부터 다시 만듦
+# sql/009 적용 직후 한 번, 또는 집계가 어긋났다고 의심될 때 실행 (여러 번 실행해도 결과 동일)
+# 유저 id 순으로 잘라서 유저 묶음마다 한 트랜잭션으로 처리
+# 실행: python rebuild_score_rollups.py
+import traceback
+
+from sqlalchemy import select
+
+from app.core.database import SessionLocal
+from app.models.user import User
+from app.DAL.user_score_rollup_DAL import UserScoreRollupDAL
+
+USER_BATCH_SIZE = 200
+
+
+def run_rebuild(batch_size: int = USER_BATCH_SIZE) -> int:
+    db = SessionLocal()
+    total_users = 0
+    total_days = 0
+    last_id = ""
+    try:
+        while True:
+            user_ids = db.execute(
+                select(User.id)
+                .where(User.id > last_id)
+                .order_by(User.id)
+                .limit(batch_size)
+            ).scalars().all()
+            if not user_ids:
+                break
+
+            total_days += UserScoreRollupDAL.rebuild_for_users(db, list(user_ids))
+            total_users += len(user_ids)
+            last_id = user_ids[-1]
+            print(f"🚀 유저 {total_users}명, 일별 점수 {total_days}개 집계...")
+
+        print(f"✅ 총 {total_users}명의 주간/월간 점수 재집계 완료!")
+        return total_users
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e}")
+        traceback.print_exc()
+        return total_users
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    run_rebuild()
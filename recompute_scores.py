@@ -0,0 +1,149 @@
+# recompute_scores.py
+# user_daily_score 전체를 지정한 산식(formula_version)으로 다시 계산
+# 산식을 바꾸고(SCORE_FORMULA_VERSION) 배포한 뒤 실행. 홈에 들어오지 않는 유저/지난 날짜도 새 산식으로 맞춤
+# (user_id, local_date) PK 순으로 잘라서 처리하고, 배치마다 진행 위치를 체크포인트 파일에 저장
+# 중간에 멈춰도 같은 명령으로 다시 실행하면 이어서 진행
+# 실행: python recompute_scores.py [--formula-version N] [--batch-size N] [--all] [--reset]
+import argparse
+import json
+import os
+import traceback
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import select, tuple_
+
+from app.core.database import SessionLocal
+from app.models.user_daily_score import UserDailyScore
+from app.DAL.scan_history_DAL import ScanHistoryDAL
+from app.DAL.user_daily_score_DAL import UserDailyScoreDAL
+from app.services.score_formulas import get_formula
+from app.services.user_daily_score_service import UserDailyScoreService
+
+BATCH_SIZE = 2000
+CHECKPOINT_PATH = "recompute_scores.checkpoint.json"
+
+
+def load_checkpoint(path: str, formula_version: int) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    # 다른 산식으로 돌던 체크포인트는 무시하고 처음부터
+    if checkpoint.get("formula_version") != formula_version:
+        return None
+    return checkpoint
+
+
+def save_checkpoint(path: str, checkpoint: dict) -> None:
+    # 임시 파일에 쓰고 교체 (중간에 죽어도 체크포인트가 깨지지 않음)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def run_recompute(
+    formula_version: Optional[int] = None,
+    batch_size: int = BATCH_SIZE,
+    checkpoint_path: str = CHECKPOINT_PATH,
+    recompute_all: bool = False,
+) -> int:
+    formula = get_formula(formula_version)
+    checkpoint = load_checkpoint(checkpoint_path, formula.version) or {
+        "formula_version": formula.version,
+        "last_user_id": None,
+        "last_local_date": None,
+        "processed": 0,
+        "updated": 0,
+    }
+    if checkpoint["last_user_id"] is not None:
+        print(f"🔁 체크포인트에서 이어서 진행: {checkpoint['last_user_id']} / {checkpoint['last_local_date']}")
+
+    db = SessionLocal()
+    try:
+        while True:
+            q = (
+                select(UserDailyScore.user_id, UserDailyScore.local_date, UserDailyScore.num_scans)
+                .where(UserDailyScore.deleted_at.is_(None))
+                .order_by(UserDailyScore.user_id, UserDailyScore.local_date)
+                .limit(batch_size)
+            )
+            if not recompute_all:
+                # 이미 이 산식으로 계산된 날은 건너뜀 (홈/워커가 먼저 계산한 날 포함)
+                q = q.where(UserDailyScore.formula_version != formula.version)
+            if checkpoint["last_user_id"] is not None:
+                q = q.where(
+                    tuple_(UserDailyScore.user_id, UserDailyScore.local_date)
+                    > tuple_(checkpoint["last_user_id"], date.fromisoformat(checkpoint["last_local_date"]))
+                )
+
+            rows = db.execute(q).all()
+            if not rows:
+                break
+
+            num_scans_by_key = {
+                (user_id, local_date): num_scans for user_id, local_date, num_scans in rows
+            }
+            values_by_key = ScanHistoryDAL.get_ai_scores_for_keys(db, keys=list(num_scans_by_key))
+            computed = UserDailyScoreService.compute_scores(num_scans_by_key, values_by_key, formula)
+
+            # num_scans가 그 사이 바뀐 날은 건너뜀 (dirty로 남아서 워커/홈이 새 산식으로 계산)
+            updated = UserDailyScoreDAL.bulk_update_scores(
+                db,
+                scores=[
+                    {
+                        "user_id": user_id,
+                        "local_date": local_date,
+                        "num_scans": num_scans or 0,
+                        "score": computed[(user_id, local_date)],
+                    }
+                    for (user_id, local_date), num_scans in num_scans_by_key.items()
+                ],
+                computed_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                formula_version=formula.version,
+            )
+
+            last_user_id, last_local_date, _ = rows[-1]
+            checkpoint.update(
+                last_user_id=last_user_id,
+                last_local_date=last_local_date.isoformat(),
+                processed=checkpoint["processed"] + len(rows),
+                updated=checkpoint["updated"] + updated,
+            )
+            save_checkpoint(checkpoint_path, checkpoint)
+            print(f"🚀 {checkpoint['processed']}개 처리, {checkpoint['updated']}개 갱신...")
+
+        print(f"✅ 산식 v{formula.version}으로 총 {checkpoint['processed']}개 재계산 완료!")
+        # 끝까지 돌았으면 체크포인트 정리 (다음 실행은 처음부터)
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return checkpoint["processed"]
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 오류 발생: {e} (다시 실행하면 체크포인트부터 이어서 진행)")
+        traceback.print_exc()
+        return checkpoint["processed"]
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="user_daily_score 산식 재계산")
+    parser.add_argument("--formula-version", type=int, default=None, help="기본값: SCORE_FORMULA_VERSION")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH)
+    parser.add_argument("--all", action="store_true", help="이미 같은 산식으로 계산된 날도 다시 계산")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 지우고 처음부터")
+    args = parser.parse_args()
+
+    if args.reset and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    run_recompute(
+        formula_version=args.formula_version,
+        batch_size=args.batch_size,
+        checkpoint_path=args.checkpoint,
+        recompute_all=args.all,
+    )
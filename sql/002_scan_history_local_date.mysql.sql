@@ -0,0 +1,11 @@
+-- 유저별 timezone (local_date 계산 기준)
+ALTER TABLE user
+    ADD COLUMN timezone VARCHAR(64) NOT NULL DEFAULT 'Asia/Seoul';
+
+-- 유저 로컬 기준 스캔 날짜 (저장 시점에 계산, 기존 row는 backfill_scan_local_date.py로 채움)
+ALTER TABLE scan_history
+    ADD COLUMN local_date DATE NULL AFTER scanned_at;
+
+-- 날짜별 목록/개수/점수 통계 조회용 복합 인덱스
+CREATE INDEX ix_scan_history_user_local_date
+    ON scan_history (user_id, local_date, scanned_at);
@@ -0,0 +1,32 @@
+-- 하루 단위 스캔 순번 카운터 ("12월 3일 4번" 같은 이름에 사용)
+ALTER TABLE user_daily_score
+    ADD COLUMN scan_seq INT UNSIGNED NOT NULL DEFAULT 0 AFTER decision_counts;
+
+-- 스캔 시점에 발급받은 순번 (1부터)
+ALTER TABLE scan_history
+    ADD COLUMN day_seq INT UNSIGNED NULL AFTER local_date;
+
+-- 기존 row 순번 채우기 (002의 local_date backfill 이후 실행, MySQL 8 이상)
+UPDATE scan_history sh
+JOIN (
+    SELECT id,
+           ROW_NUMBER() OVER (
+               PARTITION BY user_id, local_date
+               ORDER BY scanned_at, id
+           ) AS seq
+    FROM scan_history
+    WHERE local_date IS NOT NULL
+) ranked ON ranked.id = sh.id
+SET sh.day_seq = ranked.seq,
+    sh.updated_at = sh.updated_at
+WHERE sh.day_seq IS NULL;
+
+-- 카운터는 그날 마지막 순번부터 이어서 발급
+UPDATE user_daily_score uds
+JOIN (
+    SELECT user_id, local_date, MAX(day_seq) AS max_seq
+    FROM scan_history
+    GROUP BY user_id, local_date
+) seqs ON seqs.user_id = uds.user_id AND seqs.local_date = uds.local_date
+SET uds.scan_seq = seqs.max_seq,
+    uds.updated_at = uds.updated_at;
@@ -0,0 +1,5 @@
+-- 저장 시점에 만들어 두는 상세 응답(ScanDetailOut) JSON
+-- 기존 row는 비어 있어도 조회 시 ai_* 컬럼으로 만들어서 응답함
+ALTER TABLE scan_history
+    ADD COLUMN detail_payload JSON NULL AFTER caution_factors,
+    ADD COLUMN detail_version SMALLINT UNSIGNED NULL AFTER detail_payload;
@@ -0,0 +1,38 @@
+-- scan_history의 AI 리포트 본문을 1:1 테이블로 분리 (scan_history는 목록/집계용으로 좁게 유지)
+-- 순서 (무중단):
+--   1) 이 파일로 scan_report 생성
+--   2) python migrate_scan_report.py  (기존 row를 청크 단위로 복사, 여러 번 실행해도 안전)
+--   3) 새 코드 배포 (scan_report 읽기/쓰기)
+--   4) python migrate_scan_report.py  한 번 더 (2~3 사이에 예전 코드가 쓴 row 마저 복사)
+--   5) 확인 후 006_scan_history_drop_report_columns.mysql.sql 실행
+CREATE TABLE scan_report (
+    scan_id CHAR(36) PRIMARY KEY,
+
+    ai_allergy_report   TEXT,
+    ai_condition_report TEXT,
+    ai_alter_report     TEXT,
+    ai_vegan_report     TEXT,
+    ai_total_report     TEXT,
+    ai_vegan_brief      TEXT,
+    ai_allergy_brief    TEXT,
+    ai_condition_brief  TEXT,
+    ai_alter_brief      TEXT,
+
+    product_nutrition  JSON,
+    product_ingredient TEXT,
+
+    detail_payload JSON,
+    detail_version SMALLINT UNSIGNED,
+
+    created_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6)
+        ON UPDATE CURRENT_TIMESTAMP(6),
+
+    CONSTRAINT fk_scan_report_scan
+        FOREIGN KEY (scan_id) REFERENCES scan_history(id) ON DELETE CASCADE
+)
+ENGINE = InnoDB
+ROW_FORMAT = COMPRESSED
+KEY_BLOCK_SIZE = 8
+DEFAULT CHARSET = utf8mb4
+COLLATE = utf8mb4_unicode_ci;
@@ -0,0 +1,16 @@
+-- 005 + migrate_scan_report.py 완료 후, 새 코드가 scan_report만 쓰는 것을 확인하고 실행
+-- (INSTANT가 안 되는 버전이면 테이블 재구성이 일어나므로 pt-online-schema-change / gh-ost 권장)
+ALTER TABLE scan_history
+    DROP COLUMN ai_allergy_report,
+    DROP COLUMN ai_condition_report,
+    DROP COLUMN ai_alter_report,
+    DROP COLUMN ai_vegan_report,
+    DROP COLUMN ai_total_report,
+    DROP COLUMN ai_vegan_brief,
+    DROP COLUMN ai_allergy_brief,
+    DROP COLUMN ai_condition_brief,
+    DROP COLUMN ai_alter_brief,
+    DROP COLUMN product_nutrition,
+    DROP COLUMN product_ingredient,
+    DROP COLUMN detail_payload,
+    DROP COLUMN detail_version;
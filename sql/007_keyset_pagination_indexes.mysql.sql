@@ -0,0 +1,8 @@
+-- 커서(keyset) 페이지네이션용 인덱스
+-- 유저별 스캔 히스토리: ORDER BY scanned_at DESC, id DESC
+CREATE INDEX ix_scan_history_user_scanned_id
+    ON scan_history (user_id, scanned_at, id);
+
+-- 상품별 성분 목록: ORDER BY order_index, created_at, id
+CREATE INDEX ix_ingredient_product_order
+    ON ingredient (product_id, order_index, created_at, id);
@@ -0,0 +1,4 @@
+-- 점수 재계산 워커가 dirty row를 오래된 순으로 가져갈 때 사용
+-- WHERE dirty = 1 ORDER BY updated_at LIMIT n
+CREATE INDEX ix_user_daily_score_dirty_updated
+    ON user_daily_score (dirty, updated_at);
@@ -0,0 +1,46 @@
+-- user_daily_score의 주간/월간 집계 (추이 그래프는 이 테이블의 PK 범위만 읽음)
+-- 일별 row가 바뀔 때 해당 주/월만 다시 집계해서 upsert (UserScoreRollupDAL.refresh)
+-- 생성 후 python rebuild_score_rollups.py 로 기존 데이터 채우기
+CREATE TABLE user_weekly_score (
+  user_id         CHAR(36) NOT NULL COMMENT 'FK user(id)',
+  week_start      DATE NOT NULL COMMENT '주 시작일 (월요일)',
+
+  score           SMALLINT NOT NULL DEFAULT -1,        -- 점수가 계산된 날의 평균, 없으면 -1
+  score_sum       INT UNSIGNED NOT NULL DEFAULT 0,
+  scored_days     TINYINT UNSIGNED NOT NULL DEFAULT 0,
+  num_scans       INT UNSIGNED NOT NULL DEFAULT 0,
+  decision_counts JSON NULL,                            -- {"ok":n,"caution":n,"avoid":n}
+
+  updated_at      DATETIME(6) NOT NULL
+                  DEFAULT CURRENT_TIMESTAMP(6)
+                  ON UPDATE CURRENT_TIMESTAMP(6),
+
+  PRIMARY KEY (user_id, week_start),
+
+  CONSTRAINT fk_user_weekly_score_user
+    FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
+)
+DEFAULT CHARSET = utf8mb4
+COLLATE = utf8mb4_unicode_ci;
+
+CREATE TABLE user_monthly_score (
+  user_id         CHAR(36) NOT NULL COMMENT 'FK user(id)',
+  month_start     DATE NOT NULL COMMENT '월 시작일 (1일)',
+
+  score           SMALLINT NOT NULL DEFAULT -1,
+  score_sum       INT UNSIGNED NOT NULL DEFAULT 0,
+  scored_days     TINYINT UNSIGNED NOT NULL DEFAULT 0,
+  num_scans       INT UNSIGNED NOT NULL DEFAULT 0,
+  decision_counts JSON NULL,
+
+  updated_at      DATETIME(6) NOT NULL
+                  DEFAULT CURRENT_TIMESTAMP(6)
+                  ON UPDATE CURRENT_TIMESTAMP(6),
+
+  PRIMARY KEY (user_id, month_start),
+
+  CONSTRAINT fk_user_monthly_score_user
+    FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
+)
+DEFAULT CHARSET = utf8mb4
+COLLATE = utf8mb4_unicode_ci;
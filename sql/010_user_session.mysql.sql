@@ -0,0 +1,27 @@
+-- 기기별 로그인 세션 (앱 refresh token). 토큰 원문 대신 SHA-256 hex만 저장
+-- token_hash는 유니크. refresh 조회는 (token_hash, user_id, expires_at) 인덱스만으로 처리
+-- 만료 세션은 python purge_sessions.py 로 배치 삭제
+-- 기존 user.app_refresh_token은 011로 세션에 옮기고 비움 (새 코드 배포 전에 실행, 컬럼은 당분간 유지)
+CREATE TABLE user_session (
+  id                  CHAR(36) NOT NULL,
+  user_id             CHAR(36) NOT NULL COMMENT 'FK user(id)',
+
+  token_hash          CHAR(64) NOT NULL COMMENT '현재 refresh token SHA-256',
+  previous_token_hash CHAR(64) NULL COMMENT '직전 토큰 (동시 갱신 유예용)',
+
+  expires_at          DATETIME NOT NULL,
+  rotated_at          DATETIME NULL,
+  created_at          DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+  PRIMARY KEY (id),
+  UNIQUE KEY ux_user_session_token_hash (token_hash),
+  KEY ix_user_session_token (token_hash, user_id, expires_at),
+  KEY ix_user_session_previous_token (previous_token_hash),
+  KEY ix_user_session_user (user_id),
+  KEY ix_user_session_expires (expires_at),
+
+  CONSTRAINT fk_user_session_user
+    FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
+)
+DEFAULT CHARSET = utf8mb4
+COLLATE = utf8mb4_unicode_ci;
@@ -0,0 +1,18 @@
+-- 세션 테이블(010) 도입 전에 발급된 user.app_refresh_token(원문)을 user_session으로 옮기고 원문은 지움
+-- 한 번만 실행. 010 적용 후, refresh에서 원문 조회를 뺀 코드를 배포하기 전에 실행
+-- (먼저 배포하면 그 사이 예전 토큰으로 들어온 refresh는 401 -> 다시 로그인)
+-- token_hash는 app/DAL/user_session_DAL.py hash_token과 같은 값 (SHA-256 소문자 hex)
+-- 만료는 지금부터 REFRESH_TOKEN_TTL_DAYS(기본 30일)
+START TRANSACTION;
+
+INSERT INTO user_session (id, user_id, token_hash, expires_at)
+SELECT UUID(), id, SHA2(app_refresh_token, 256), UTC_TIMESTAMP() + INTERVAL 30 DAY
+FROM user
+WHERE app_refresh_token IS NOT NULL
+  AND deleted_at IS NULL;
+
+UPDATE user
+SET app_refresh_token = NULL
+WHERE app_refresh_token IS NOT NULL;
+
+COMMIT;
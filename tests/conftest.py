@@ -0,0 +1,117 @@
+# tests/conftest.py
+# 로컬 SQLite 모드(임시 파일)로 앱 전체를 띄워서 테스트
+# 설정(app/core/config.py)은 import 시점에 한 번 읽으므로 app을 import하기 전에 환경변수를 지정
+# 실행: python -m pytest -q
+import os
+import tempfile
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+_DB_DIR = tempfile.mkdtemp(prefix="healthy_scanner_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+# count_queries는 프로세스의 모든 SQL을 세므로 백그라운드 작업은 끔
+os.environ["SCORE_WORKER_ENABLED"] = "false"
+os.environ["STARTUP_WARMUP_ENABLED"] = "false"
+os.environ["IMAGE_BASE_DIR"] = f"{_DB_DIR}/static"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.auth import create_access_token  # noqa: E402
+from app.core.database import SessionLocal  # noqa: E402
+from app.core.local_time import to_local_date  # noqa: E402
+from app.dependencies import build_scan_history_service, get_scan_history_dal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.ingredient import Ingredient  # noqa: E402
+from app.models.nutrition import Nutrition  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.scan_history import ScanHistoryCreate  # noqa: E402
+from app.services.scan_history_service import SCAN_DETAIL_VERSION  # noqa: E402
+from init_db import run_init_db  # noqa: E402
+
+run_init_db()
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "mysql: 운영 MySQL에서만 의미 있는 테스트 (TEST_MYSQL_URL이 없으면 skip)",
+    )
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def user(db) -> User:
+    # 테스트마다 새 유저 (유저별 홈 / principal 캐시가 다른 테스트와 섞이지 않게)
+    u = User(id=str(uuid4()), kakao_user_id=str(uuid4()), name="tester", timezone="Asia/Seoul")
+    db.add(u)
+    db.commit()
+    return u
+
+
+@pytest.fixture
+def auth_headers(user) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+
+@pytest.fixture
+def product(db) -> Product:
+    p = Product(id=str(uuid4()), name="테스트 과자", category="과자", image_url="/static/p.png")
+    db.add(p)
+    db.flush()
+    db.add_all(
+        [
+            Nutrition(id=str(uuid4()), product_id=p.id, calories=120, sugar_g=8),
+            Ingredient(id=str(uuid4()), product_id=p.id, raw_ingredient="밀가루, 설탕", order_index=0),
+        ]
+    )
+    db.commit()
+    return p
+
+
+@pytest.fixture
+def make_scan(db, user):
+    """
+    분석이 끝난 스캔을 저장 (analyze_and_save_scan처럼 상세 응답도 미리 만들어 둠)
+    """
+
+    def _make(product_id=None, **fields):
+        scanned_at = datetime.now(timezone.utc).replace(tzinfo=None)
+        values = dict(
+            user_id=user.id,
+            product_id=product_id,
+            scanned_at=scanned_at,
+            local_date=to_local_date(scanned_at, user.timezone),
+            display_category="과자",
+            decision="caution",
+            summary="당이 조금 많아요",
+            ai_total_score=70,
+            ai_total_report="전체 리포트",
+            ai_allergy_report="알레르기 리포트",
+            ai_allergy_brief="알레르기 요약",
+            caution_factors=[{"key": "diabetes", "level": "yellow"}],
+            product_name="테스트 과자",
+        )
+        data = ScanHistoryCreate(**{**values, **fields})
+        service = build_scan_history_service(db)
+        data.detail_payload = service.build_scan_detail(data).model_dump(mode="json")
+        data.detail_version = SCAN_DETAIL_VERSION
+        return get_scan_history_dal().create(db, data)
+
+    return _make
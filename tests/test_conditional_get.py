@@ -0,0 +1,46 @@
+# tests/test_conditional_get.py
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.core.query_stats import count_queries
+from app.DAL.nutrition_DAL import NutritionDAL
+from app.models.nutrition import Nutrition
+
+
+def test_not_modified_skips_assembly_queries(client, auth_headers, product, make_scan):
+    scan = make_scan(product.id)
+    path = f"/v1/scan-history/{scan.id}/details"
+    first = client.get(path, headers=auth_headers)
+    assert first.status_code == 200
+
+    with count_queries() as q:
+        r = client.get(path, headers={**auth_headers, "If-None-Match": first.headers["etag"]})
+
+    assert r.status_code == 304
+    assert r.headers["etag"] == first.headers["etag"]
+    # validator 조회 한 번만, scan / product / nutrition / ingredient 조립 쿼리는 없음
+    assert q.count == 1, q.statements
+    assert "scan_updated_at" in q.statements[0]
+
+
+def test_etag_changes_when_older_nutrition_row_is_deleted(client, db, auth_headers, product, make_scan):
+    # 최신이 아닌 row를 hard delete하면 max(updated_at)은 그대로 -> row 수로 감지
+    older = Nutrition(
+        id=str(uuid4()),
+        product_id=product.id,
+        label_version=0,
+        calories=999,
+        updated_at=datetime.utcnow() - timedelta(days=1),
+    )
+    db.add(older)
+    db.commit()
+
+    scan = make_scan(product.id)
+    path = f"/v1/scan-history/{scan.id}/details"
+    etag = client.get(path, headers=auth_headers).headers["etag"]
+
+    assert NutritionDAL.delete(db, older.id)
+
+    r = client.get(path, headers={**auth_headers, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
@@ -0,0 +1,31 @@
+# tests/test_daily_score_recompute.py
+from app.DAL.scan_history_DAL import ScanHistoryDAL
+from app.dependencies import build_user_daily_score_service
+from app.models.user_daily_score import UserDailyScore
+from app.services.score_formulas import get_formula
+
+
+def test_recompute_ignores_soft_deleted_scans(db, user, make_scan):
+    kept = make_scan(ai_total_score=40)
+    deleted = make_scan(ai_total_score=90)
+    local_date = kept.local_date
+    db.add(
+        UserDailyScore(
+            user_id=user.id,
+            local_date=local_date,
+            score=-1,
+            num_scans=2,
+            decision_counts={"caution": 2},
+            dirty=1,
+        )
+    )
+    db.commit()
+
+    assert ScanHistoryDAL.soft_delete(db, deleted.id)
+
+    key = (user.id, local_date)
+    assert ScanHistoryDAL.get_ai_scores_for_keys(db, [key]) == {key: [40]}
+
+    uds = build_user_daily_score_service(db).recompute_score_for_day(user_id=user.id, local_date=local_date)
+    assert uds.score == get_formula().score_keys([key], {key: [40]})[key]
+    assert uds.score != get_formula().score_keys([key], {key: [40, 90]})[key]
@@ -0,0 +1,100 @@
+# tests/test_kakao_login.py
+# 카카오 대신 httpx.MockTransport로 KAKAO_AUTH_BASE_URL / KAKAO_API_BASE_URL 응답을 흉내내서
+# GET /auth/kakao/callback 의 성공 / 400 / 502 / 재시도 경로 확인
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.dependencies import get_kakao_auth_service
+from app.main import app
+from app.services.kakao_auth_service import KakaoAuthService
+
+TOKEN_URL = f"{settings.KAKAO_AUTH_BASE_URL}/oauth/token"
+USER_URL = f"{settings.KAKAO_API_BASE_URL}/v2/user/me"
+
+
+def _token_ok(request):
+    return httpx.Response(
+        200,
+        json={"access_token": "kakao-access", "refresh_token": "kakao-refresh", "token_type": "bearer"},
+    )
+
+
+def _user_ok(request):
+    assert request.headers["Authorization"] == "Bearer kakao-access"
+    return httpx.Response(
+        200,
+        json={"id": str(uuid4()), "kakao_account": {"profile": {"nickname": "카카오"}}},
+    )
+
+
+@pytest.fixture
+def stub_kakao(monkeypatch):
+    """
+    stub_kakao({TOKEN_URL: [핸들러...], USER_URL: [핸들러...]})
+    URL별로 핸들러를 순서대로 하나씩 사용 (마지막 핸들러는 계속 재사용), 받은 요청 URL 목록 반환
+    """
+    monkeypatch.setattr(KakaoAuthService, "RETRY_BACKOFF_SECONDS", 0)
+    calls = []
+
+    def install(routes):
+        def handler(request):
+            url = str(request.url.copy_with(query=None))
+            calls.append(url)
+            queue = routes[url]
+            return (queue.pop(0) if len(queue) > 1 else queue[0])(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        app.dependency_overrides[get_kakao_auth_service] = lambda: KakaoAuthService(client, retries=1)
+        return calls
+
+    yield install
+    app.dependency_overrides.pop(get_kakao_auth_service, None)
+
+
+def test_callback_issues_app_tokens(client, stub_kakao):
+    calls = stub_kakao({TOKEN_URL: [_token_ok], USER_URL: [_user_ok]})
+
+    r = client.get("/auth/kakao/callback", params={"code": "ok"})
+
+    assert r.status_code == 200
+    assert r.json()["app_access_token"]
+    assert r.json()["app_refresh_token"]
+    assert calls == [TOKEN_URL, USER_URL]
+
+
+def test_callback_returns_400_on_kakao_error(client, stub_kakao):
+    calls = stub_kakao({TOKEN_URL: [lambda request: httpx.Response(400, json={"error": "invalid_grant"})]})
+
+    r = client.get("/auth/kakao/callback", params={"code": "used"})
+
+    assert r.status_code == 400
+    # 토큰 발급(POST)은 code가 한 번만 쓰이므로 재시도하지 않음
+    assert calls == [TOKEN_URL]
+
+
+def test_callback_returns_502_when_kakao_unreachable(client, stub_kakao):
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    stub_kakao({TOKEN_URL: [refuse]})
+
+    r = client.get("/auth/kakao/callback", params={"code": "ok"})
+
+    assert r.status_code == 502
+
+
+def test_user_info_is_retried_once_after_5xx(client, stub_kakao):
+    calls = stub_kakao(
+        {
+            TOKEN_URL: [_token_ok],
+            USER_URL: [lambda request: httpx.Response(503), _user_ok],
+        }
+    )
+
+    r = client.get("/auth/kakao/callback", params={"code": "ok"})
+
+    assert r.status_code == 200
+    assert calls == [TOKEN_URL, USER_URL, USER_URL]
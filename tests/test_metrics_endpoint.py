@@ -0,0 +1,7 @@
+# tests/test_metrics_endpoint.py
+from app.core.config import settings
+
+
+def test_metrics_endpoint_is_not_exposed_by_default(client):
+    assert settings.METRICS_ENDPOINT_ENABLED is False
+    assert client.get("/v1/metrics").status_code == 404
@@ -0,0 +1,59 @@
+# tests/test_query_budgets.py
+# 엔드포인트별 SQL 수 상한 (N+1 / 불필요한 조회가 다시 생기면 실패, 실행된 SQL 목록이 같이 출력됨)
+# 쿼리를 줄였으면 상한도 같이 내릴 것
+from app.core.query_stats import assert_query_budget
+
+
+def test_full_scan_details_budget(client, auth_headers, product, make_scan):
+    scan = make_scan(product.id)
+
+    # validators 1 + scan(+report join) 1 + product / nutrition / ingredient 각 1
+    with assert_query_budget(5, "GET /v1/scan-history/{id}/details"):
+        r = client.get(f"/v1/scan-history/{scan.id}/details", headers=auth_headers)
+    assert r.status_code == 200
+
+
+def test_scan_detail_budget(client, auth_headers, make_scan):
+    scan = make_scan()
+
+    with assert_query_budget(2, "GET /v1/scan-history/{id}"):
+        r = client.get(f"/v1/scan-history/{scan.id}", headers=auth_headers)
+    assert r.status_code == 200
+
+
+def test_home_budget(client, auth_headers, product, make_scan):
+    make_scan(product.id)
+    make_scan(product.id)
+
+    # 첫 요청: principal 조회 + 오늘 점수 row 생성(-1, 빈 row라 rollup 쿼리 없음) + 대표 스캔
+    with assert_query_budget(6, "GET /v1/home (cold)"):
+        r = client.get("/v1/home", headers=auth_headers)
+    assert r.status_code == 200
+    assert len(r.json()["scan"]) == 1
+
+    # principal / 홈 캐시가 있으면 DB를 읽지 않음
+    with assert_query_budget(0, "GET /v1/home (cached)"):
+        r = client.get("/v1/home", headers=auth_headers)
+    assert r.status_code == 200
+
+
+def test_product_list_budget(client, product):
+    with assert_query_budget(1, "GET /v1/products/"):
+        r = client.get("/v1/products/", params={"limit": 20})
+    assert r.status_code == 200
+
+
+def test_not_modified_budgets(client, auth_headers, product, make_scan):
+    scan = make_scan(product.id)
+    paths = (
+        f"/v1/scan-history/{scan.id}/details",
+        f"/v1/scan-history/{scan.id}",
+        f"/v1/products/{product.id}",
+    )
+    for path in paths:
+        etag = client.get(path, headers=auth_headers).headers["etag"]
+
+        # 304는 validator 조회 한 번만
+        with assert_query_budget(1, f"GET {path} (304)"):
+            r = client.get(path, headers={**auth_headers, "If-None-Match": etag})
+        assert r.status_code == 304
@@ -0,0 +1,55 @@
+# tests/test_replica_routing.py
+# 빈 SQLite 파일을 replica로 붙여서, 쓰기 직후 읽기가 primary로 가는지 확인
+# (replica에는 row가 없으므로 replica에서 읽으면 404)
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import database
+from app.core.database import Base, engine
+from app.core.db_routing import RoutingSession
+
+
+@pytest.fixture
+def empty_replica(tmp_path, monkeypatch):
+    replica = create_engine(f"sqlite:///{tmp_path}/replica.db")
+    Base.metadata.create_all(replica)
+    monkeypatch.setattr(database, "replica_engine", replica)
+    monkeypatch.setattr(
+        database,
+        "SessionLocal",
+        sessionmaker(
+            class_=RoutingSession,
+            autocommit=False,
+            autoflush=False,
+            bind=engine,
+            replica_bind=replica,
+            lag_monitor=None,
+        ),
+    )
+    yield replica
+    replica.dispose()
+
+
+def test_unauthenticated_replica_route_reads_replica(client, empty_replica, make_scan):
+    scan = make_scan()
+
+    r = client.get(f"/v1/scan-history/{scan.id}/details")
+    assert r.status_code == 404
+
+
+def test_read_after_write_goes_to_primary_without_auth_dependency(
+    client, empty_replica, auth_headers, make_scan
+):
+    scan = make_scan()
+
+    # PATCH / GET .../details 모두 get_current_user를 쓰지 않음 -> get_db가 토큰의 sub로 유저를 기록
+    r = client.patch(
+        f"/v1/scan-history/{scan.id}",
+        json={"name": "내 과자", "category": "과자"},
+        headers=auth_headers,
+    )
+    assert r.status_code == 200
+
+    r = client.get(f"/v1/scan-history/{scan.id}/details", headers=auth_headers)
+    assert r.status_code == 200
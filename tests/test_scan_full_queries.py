@@ -0,0 +1,50 @@
+# tests/test_scan_full_queries.py
+import re
+from collections import Counter
+
+from app.core.query_stats import count_queries
+
+_FROM = re.compile(r"\bFROM (\w+)")
+
+
+def _tables_read(statements):
+    """
+    validator 조회를 뺀 SELECT들의 대상 테이블 (첫 FROM 기준) 개수
+    """
+    return Counter(
+        _FROM.search(s).group(1)
+        for s in statements
+        if s.lstrip().upper().startswith("SELECT") and "scan_updated_at" not in s
+    )
+
+
+def test_details_reads_each_row_once(client, auth_headers, product, make_scan):
+    scan = make_scan(product.id)
+
+    with count_queries() as q:
+        r = client.get(f"/v1/scan-history/{scan.id}/details", headers=auth_headers)
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["product"]["name"] == product.name
+    assert body["ingredient"]["text"] == "밀가루, 설탕"
+    # scan(+scan_report join) / product / nutrition / ingredient 각각 한 번
+    assert _tables_read(q.statements) == {
+        "scan_history": 1,
+        "product": 1,
+        "nutrition": 1,
+        "ingredient": 1,
+    }, q.statements
+
+
+def test_details_without_product_reads_only_the_scan(client, auth_headers, make_scan):
+    # 이미지 / 성분표 스캔: 상품 부분은 scan row로 채우고 이름은 저장된 day_seq 사용
+    scan = make_scan(product_name=None, day_seq=3)
+
+    with count_queries() as q:
+        r = client.get(f"/v1/scan-history/{scan.id}/details", headers=auth_headers)
+
+    assert r.status_code == 200
+    d = scan.local_date
+    assert r.json()["product"]["name"] == f"{d.month}월 {d.day}일 3번"
+    assert _tables_read(q.statements) == {"scan_history": 1}, q.statements
@@ -0,0 +1,118 @@
+# tests/test_scan_history_indexes.py
+# 날짜별 scan_history 조회가 (user_id, local_date) 인덱스를 타는지 MySQL EXPLAIN으로 확인
+# SQLite 플래너는 MySQL과 달라서 의미가 없으므로 sql/*.mysql.sql 을 적용한 테스트용 MySQL에서만 실행
+#   TEST_MYSQL_URL=mysql+pymysql://user:pw@host:3306/healthy_scanner_test?charset=utf8mb4 python -m pytest -q -m mysql
+import os
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.DAL.scan_history_DAL import ScanHistoryDAL
+
+pytestmark = [
+    pytest.mark.mysql,
+    pytest.mark.skipif(not os.getenv("TEST_MYSQL_URL"), reason="TEST_MYSQL_URL 없음"),
+]
+
+INDEX = "ix_scan_history_user_local_date"
+DAY = date(2025, 1, 15)
+
+
+@pytest.fixture(scope="module")
+def mysql_db():
+    engine = create_engine(os.environ["TEST_MYSQL_URL"])
+    user_ids = [str(uuid4()) for _ in range(20)]
+    with engine.begin() as conn:
+        for user_id in user_ids:
+            conn.execute(
+                text("INSERT INTO user (id, kakao_user_id) VALUES (:id, :id)"),
+                {"id": user_id},
+            )
+        # 유저 20명 x 30일 x 하루 5개 -> 하루치 조회가 인덱스로 좁혀질 만큼의 row
+        rows = []
+        for user_id in user_ids:
+            for d in range(30):
+                local_date = DAY + timedelta(days=d - 15)
+                for n in range(5):
+                    rows.append(
+                        {
+                            "id": str(uuid4()),
+                            "user_id": user_id,
+                            "scanned_at": datetime.combine(local_date, datetime.min.time()) + timedelta(hours=n),
+                            "local_date": local_date,
+                            "ai_total_score": 50 + n,
+                        }
+                    )
+        conn.execute(
+            text(
+                "INSERT INTO scan_history (id, user_id, scanned_at, local_date, ai_total_score, dirty) "
+                "VALUES (:id, :user_id, :scanned_at, :local_date, :ai_total_score, 0)"
+            ),
+            rows,
+        )
+        conn.execute(text("ANALYZE TABLE scan_history"))
+
+    session = Session(engine)
+    try:
+        yield session, user_ids[0]
+    finally:
+        session.close()
+        with engine.begin() as conn:
+            # scan_history는 FK ON DELETE CASCADE
+            conn.execute(text("DELETE FROM user WHERE id IN :ids").bindparams(ids=tuple(user_ids)))
+        engine.dispose()
+
+
+def _explain_keys(session: Session, call) -> list:
+    """
+    call(session) 안에서 실행된 SELECT마다 EXPLAIN -> scan_history를 읽는 행의 key 목록
+    """
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        call(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    keys = []
+    with engine.connect() as conn:
+        for statement, parameters in captured:
+            for row in conn.exec_driver_sql("EXPLAIN " + statement, parameters).mappings():
+                if row["table"] == "scan_history":
+                    keys.append(row["key"])
+    return keys
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda db, u: ScanHistoryDAL.list_summaries_by_date(db, u, DAY),
+        lambda db, u: ScanHistoryDAL.get_by_date(db, u, datetime.combine(DAY, datetime.min.time())),
+        lambda db, u: ScanHistoryDAL.get_representative_scans_for_day(db, u, DAY),
+        lambda db, u: ScanHistoryDAL.get_scan_order_for_day(db, u, DAY, "missing"),
+        lambda db, u: ScanHistoryDAL.get_ai_scores_for_keys(db, [(u, DAY)]),
+    ],
+    ids=[
+        "list_summaries_by_date",
+        "get_by_date",
+        "get_representative_scans_for_day",
+        "get_scan_order_for_day",
+        "get_ai_scores_for_keys",
+    ],
+)
+def test_day_bucketed_queries_use_local_date_index(mysql_db, call):
+    session, user_id = mysql_db
+
+    keys = _explain_keys(session, lambda db: call(db, user_id))
+
+    assert keys, "scan_history를 읽는 SELECT가 없음"
+    assert all(key == INDEX for key in keys), keys
@@ -0,0 +1,23 @@
+# tests/test_scan_rename.py
+from app.core.query_stats import count_queries
+
+
+def test_rename_keeps_detail_payload_and_skips_report(client, auth_headers, make_scan):
+    scan = make_scan()
+    before = client.get(f"/v1/scan-history/{scan.id}", headers=auth_headers)
+    assert before.status_code == 200
+
+    with count_queries() as q:
+        r = client.patch(
+            f"/v1/scan-history/{scan.id}",
+            json={"name": "내 과자", "category": "간식"},
+            headers=auth_headers,
+        )
+    assert r.status_code == 200
+    assert r.json()["name"] == "내 과자"
+    # 이름 / 카테고리만 바뀌므로 scan_report(리포트 본문 / 상세 응답)는 읽지도 쓰지도 않음
+    assert not any("scan_report" in s for s in q.statements), q.statements
+
+    # 상세 응답에는 이름 / 카테고리가 없어서 그대로
+    after = client.get(f"/v1/scan-history/{scan.id}", headers=auth_headers)
+    assert after.json() == before.json()
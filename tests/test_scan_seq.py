@@ -0,0 +1,37 @@
+# tests/test_scan_seq.py
+from datetime import date
+
+from app.DAL.user_daily_score_DAL import UserDailyScoreDAL
+from app.models.user_daily_score import UserDailyScore
+
+DAY = date(2025, 3, 1)
+
+
+def _stored_seq(db, user_id):
+    db.expire_all()
+    uds = db.get(UserDailyScore, (user_id, DAY))
+    return uds.scan_seq if uds else None
+
+
+def test_rolled_back_scan_returns_its_number(db, user):
+    assert UserDailyScoreDAL.allocate_scan_seq(db, user.id, DAY) == 1
+    # 스캔 INSERT가 실패한 경우: 순번 발급도 같이 롤백
+    db.rollback()
+    assert _stored_seq(db, user.id) is None
+
+    assert UserDailyScoreDAL.allocate_scan_seq(db, user.id, DAY) == 1
+    db.commit()
+    assert UserDailyScoreDAL.allocate_scan_seq(db, user.id, DAY) == 2
+    db.rollback()
+    assert UserDailyScoreDAL.allocate_scan_seq(db, user.id, DAY) == 2
+    db.commit()
+    assert _stored_seq(db, user.id) == 2
+
+
+def test_seq_is_committed_with_the_scan(db, user, make_scan):
+    seq = UserDailyScoreDAL.allocate_scan_seq(db, user.id, DAY)
+    # 순번 발급만으로는 커밋되지 않고, 스캔 INSERT의 커밋에 같이 실림
+    scan = make_scan(local_date=DAY, day_seq=seq)
+
+    assert _stored_seq(db, user.id) == 1
+    assert scan.day_seq == 1
@@ -0,0 +1,43 @@
+# tests/test_score_rollups.py
+from app.core.query_stats import count_queries
+from app.DAL.user_score_rollup_DAL import UserScoreRollupDAL, week_start
+from app.dependencies import build_user_daily_score_service
+from app.models.user_score_rollup import UserMonthlyScore, UserWeeklyScore
+
+ROLLUP_COLUMNS = ("score", "score_sum", "scored_days", "num_scans", "decision_counts")
+
+
+def _rollups(db, user_id):
+    db.expire_all()
+    return [
+        {c: getattr(row, c) for c in ROLLUP_COLUMNS}
+        for model in (UserWeeklyScore, UserMonthlyScore)
+        for row in db.query(model).filter(model.user_id == user_id).all()
+    ]
+
+
+def test_scans_add_deltas_and_recompute_matches_rebuild(db, user, make_scan):
+    service = build_user_daily_score_service(db)
+    scans = [make_scan(decision="caution", ai_total_score=60), make_scan(decision="avoid", ai_total_score=20)]
+    local_date = scans[0].local_date
+
+    for i, scan in enumerate(scans):
+        with count_queries() as q:
+            service.update_on_scan(
+                user_id=user.id, local_date=local_date, severity=None, decision_key=scan.decision
+            )
+        # 스캔 누적은 주/월 일별 row를 다시 읽지 않음 (변화량 upsert만)
+        assert not any("local_date >=" in s for s in q.statements), q.statements
+
+    weekly = db.query(UserWeeklyScore).filter_by(user_id=user.id, week_start=week_start(local_date)).one()
+    assert weekly.num_scans == 2
+    assert weekly.decision_counts == {"caution": 1, "avoid": 1}
+    # 아직 dirty라 점수는 평균에 없음
+    assert weekly.scored_days == 0
+
+    service.recompute_score_for_day(user_id=user.id, local_date=local_date)
+    incremental = _rollups(db, user.id)
+    assert incremental[0]["scored_days"] == 1
+
+    UserScoreRollupDAL.rebuild_for_users(db, [user.id])
+    assert _rollups(db, user.id) == incremental
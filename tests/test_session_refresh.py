@@ -0,0 +1,41 @@
+# tests/test_session_refresh.py
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.DAL.user_session_DAL import UserSessionDAL, hash_token
+from app.dependencies import get_session_service
+
+
+def test_refresh_rotates_token(client, db, user):
+    issued = get_session_service(db).issue(user.id)
+    db.commit()
+
+    r = client.post("/v1/auth/refresh", json={"app_refresh_token": issued.refresh_token})
+    assert r.status_code == 200
+    assert r.json()["app_refresh_token"] != issued.refresh_token
+
+    # 새 토큰으로 한 번 더 갱신 가능
+    r = client.post("/v1/auth/refresh", json={"app_refresh_token": r.json()["app_refresh_token"]})
+    assert r.status_code == 200
+
+
+def test_legacy_plaintext_token_is_not_looked_up(client, db, user):
+    # user.app_refresh_token은 sql/011로 세션에 옮긴 뒤에는 조회하지 않음
+    user.app_refresh_token = "legacy-plaintext-token"
+    db.commit()
+
+    r = client.post("/v1/auth/refresh", json={"app_refresh_token": "legacy-plaintext-token"})
+    assert r.status_code == 401
+
+
+def test_token_hash_is_unique(db, user):
+    expires_at = datetime.utcnow() + timedelta(days=1)
+    token_hash = hash_token("same-token")
+    UserSessionDAL.create(db, user_id=user.id, token_hash=token_hash, expires_at=expires_at)
+    UserSessionDAL.create(db, user_id=user.id, token_hash=token_hash, expires_at=expires_at + timedelta(days=1))
+
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
@@ -0,0 +1,63 @@
+# tests/test_user_daily_score_range.py
+from datetime import date, timedelta
+
+from app.core.query_stats import count_queries
+from app.models.user_daily_score import UserDailyScore
+
+DATE_FROM = date(2025, 1, 1)
+DATE_TO = date(2025, 1, 31)
+PATH = "/v1/user-daily-scores/me/range"
+PARAMS = {"date_from": DATE_FROM.isoformat(), "date_to": DATE_TO.isoformat()}
+
+
+def _add_days(db, user, dirty=0):
+    db.add_all(
+        [
+            UserDailyScore(
+                user_id=user.id,
+                local_date=DATE_FROM + timedelta(days=d),
+                score=-1 if dirty else 70,
+                num_scans=1,
+                decision_counts={"caution": 1},
+                dirty=dirty,
+            )
+            for d in range(3)
+        ]
+    )
+    db.commit()
+
+
+def test_range_requires_auth(client):
+    assert client.get(PATH, params=PARAMS).status_code == 401
+    assert client.get("/v1/user-daily-scores/me/trend", params=PARAMS).status_code == 401
+
+
+def test_range_not_modified_skips_rows_and_recompute(client, db, user, auth_headers):
+    _add_days(db, user)
+    first = client.get(PATH, params=PARAMS, headers=auth_headers)
+    assert first.status_code == 200
+    assert [d["score"] for d in first.json()["days"]] == [70, 70, 70]
+
+    with count_queries() as q:
+        r = client.get(PATH, params=PARAMS, headers={**auth_headers, "If-None-Match": first.headers["etag"]})
+
+    assert r.status_code == 304
+    # validator 조회 한 번만 (row 조회 / 재계산 UPDATE 없음)
+    assert q.count == 1, q.statements
+
+
+def test_range_recomputes_dirty_days_before_304(client, db, user, auth_headers):
+    _add_days(db, user, dirty=1)
+    first = client.get(PATH, params=PARAMS, headers=auth_headers)
+    assert first.status_code == 200
+    assert not db.query(UserDailyScore).filter_by(user_id=user.id, dirty=1).count()
+
+    # 재계산 후 상태로 만든 ETag라 다음 요청은 304
+    r = client.get(PATH, params=PARAMS, headers={**auth_headers, "If-None-Match": first.headers["etag"]})
+    assert r.status_code == 304
+
+    # 다시 dirty가 되면 같은 ETag라도 재계산
+    db.query(UserDailyScore).filter_by(user_id=user.id).update({"dirty": 1})
+    db.commit()
+    r = client.get(PATH, params=PARAMS, headers={**auth_headers, "If-None-Match": first.headers["etag"]})
+    assert r.status_code == 200
@@ -0,0 +1,16 @@
+# tests/test_user_timezone.py
+
+
+def test_update_user_rejects_unknown_timezone(client, db, user):
+    r = client.patch(f"/v1/users/{user.id}", json={"timezone": "Not/AZone"})
+
+    assert r.status_code == 422
+    db.refresh(user)
+    assert user.timezone == "Asia/Seoul"
+
+
+def test_update_user_accepts_iana_timezone(client, user):
+    r = client.patch(f"/v1/users/{user.id}", json={"timezone": "America/New_York"})
+
+    assert r.status_code == 200
+    assert r.json()["timezone"] == "America/New_York"